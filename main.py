@@ -15,11 +15,22 @@ def cmd_gen():
 
     parsergen.main()
 
+def cmd_genll():
+    from pppp import llgen
+
+    llgen.main()
+
+
+def cmd_report():
+    from pppp import grammarparse
+
+    grammarparse.parse_grammar_file('Grammar').report()
+
 
 def cmd_tokenize():
     from pppp import tokenizer
 
-    toks = tokenizer.tokenize_file(sys.argv[1])
+    toks = tokenizer.tokenize_file(sys.argv[1], verbose=True)
     
     for t in toks:
         print(t)
@@ -27,35 +38,117 @@ def cmd_tokenize():
 def cmd_parse():
     from pppp import tokenizer, parser, parserbase
 
-    toks = tokenizer.tokenize_file(sys.argv[2])
+    toks = tokenizer.tokenize_file(sys.argv[2], verbose=True)
     
     if True:
         for t in toks:
             print(t)
 
     p = parser.parser(toks)
-    T = p.parse_file_input()
+    try:
+        T = p.parse_file_input()
+    except parserbase.ParseError as e:
+        print("{0}: {1}".format(sys.argv[2], e))
+        sys.exit(1)
     
     if T is not None:
         parserbase.print_tree(T)
     else:
         print(T)
+        sys.exit(1)
+
+def cmd_stream():
+    from pppp import stream, parserbase
+
+    with open(sys.argv[2], 'rb') as f:
+        try:
+            for T in stream.iter_statements(f):
+                parserbase.print_tree(T)
+        except parserbase.ParseError as e:
+            print("{0}: {1}".format(sys.argv[2], e))
+            sys.exit(1)
+
+def cmd_parse_tree():
+    import os, time
+    from pppp import batch
+
+    jobs = os.cpu_count() or 1
+    if '--jobs' in sys.argv:
+        jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
+    if '--cache' in sys.argv:
+        from pppp import cache
+        cache.enable(sys.argv[sys.argv.index('--cache') + 1])
+
+    start = time.perf_counter()
+    files = 0
+    failed = 0
+    tokens = 0
+    size = 0
+    items = batch.find_sources(sys.argv[2])
+    for r in batch.parse_many(items, jobs, ordered=False, trees=False):
+        files = files + 1
+        tokens = tokens + r.tokens
+        size = size + r.size
+        if r.error is None:
+            print("ok {0} {1} tokens {2:.3f}s".format(r.name, r.tokens,
+                r.read_time + r.tokenize_time + r.parse_time))
+        else:
+            failed = failed + 1
+            print("FAIL {0} {1}".format(r.name, r.error))
+    wall = max(time.perf_counter() - start, 1e-9)
+
+    print("{0} files, {1} failed, {2} tokens, {3} bytes in {4:.2f}s with {5} jobs".format(
+        files, failed, tokens, size, wall, jobs))
+    print("{0:.1f} files/s, {1:.0f} tokens/s, {2:.0f} KB/s".format(
+        files / wall, tokens / wall, size / 1024 / wall))
+
+def cmd_parse_split():
+    import os, time
+    from pppp import tokenizer, parserbase, batch
+
+    jobs = os.cpu_count() or 1
+    if '--jobs' in sys.argv:
+        jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
+
+    S = tokenizer.read_source(sys.argv[2], verbose=True)
+
+    start = time.perf_counter()
+    toks = batch.tokenize_split(S, jobs)
+    middle = time.perf_counter()
+    try:
+        T = batch.parse_split(toks, jobs, arena=True)
+    except parserbase.ParseError as e:
+        print("{0}: {1}".format(sys.argv[2], e))
+        sys.exit(1)
+    end = time.perf_counter()
+
+    if T is None:
+        print("Parser error")
+        sys.exit(1)
+    print("{0} statements, {1} tokens with {2} jobs: tokenized in {3:.2f}s, parsed in {4:.2f}s".format(
+        len([x for x in T.childs if x.ntype == 'stmt']), len(toks), jobs,
+        middle - start, end - middle))
 
 def cmd_compile():
     from pppp import tokenizer, parser, parserbase, compiler
 
-    toks = tokenizer.tokenize_file(sys.argv[2])
+    toks = tokenizer.tokenize_file(sys.argv[2], verbose=True)
 
     if not toks:
         print("Tokenizer error")
-        return
+        sys.exit(1)
 
     p = parser.parser(toks)
-    T = p.parse_file_input()
-
-    if not T:
+    try:
+        T = p.parse_file_input()
+    except parserbase.ParseError as e:
+        print("{0}: {1}".format(sys.argv[2], e))
+        sys.exit(1)
+
+    if T is None:
+        # It failed before any commit point.
         print("Parser error")
-        return
+        sys.exit(1)
 
     compiler.compile(T)
 
@@ -63,10 +156,20 @@ def cmd_compile():
 def main():
     if sys.argv[1] == 'gen':
         cmd_gen()
+    elif sys.argv[1] == 'genll':
+        cmd_genll()
+    elif sys.argv[1] == 'report':
+        cmd_report()
     elif sys.argv[1] == 'tokenize':
         cmd_tokenize()
     elif sys.argv[1] == 'parse':
         cmd_parse()
+    elif sys.argv[1] == 'parse-tree':
+        cmd_parse_tree()
+    elif sys.argv[1] == 'parse-split':
+        cmd_parse_split()
+    elif sys.argv[1] == 'stream':
+        cmd_stream()
     elif sys.argv[1] == 'compile':
         cmd_compile()
 
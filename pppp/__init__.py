@@ -0,0 +1,23 @@
+
+__version__ = '0.1'
+
+def parse_many(paths_or_sources, workers=None, ordered=True, trees=True, pending=None):
+    """
+    Parses many files in worker processes; see batch.parse_many.
+    """
+    from . import batch
+    return batch.parse_many(paths_or_sources, workers, ordered, trees, pending)
+
+def parse_split(toks, workers=None, chunks=None, compact=False, punctuation=True, arena=False):
+    """
+    Parses the tokens of one file in worker processes; see batch.parse_split.
+    """
+    from . import batch
+    return batch.parse_split(toks, workers, chunks, compact, punctuation, arena)
+
+def tokenize_split(S, workers=None, chunks=None, compact=False):
+    """
+    Tokenizes one source str in worker processes; see batch.tokenize_split.
+    """
+    from . import batch
+    return batch.tokenize_split(S, workers, chunks, compact)
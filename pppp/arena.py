@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Arena tree. Instead of one astnode object per node, the parser appends every
+node to a column per field as it completes, that is in post-order. A node is
+an index into the columns, and NodeView reads it back with the astnode API.
+"""
+
+from array import array
+
+class Arena:
+    """
+    Nodes of a parse tree, by index. Leaves have the index of their token in
+    first and last, and a kid_count of -1. The other nodes have the first
+    and last token they span, and their child indices are stored together
+    in kids, from kid_start for kid_count entries.
+    """
+    def __init__(self, toks):
+        self.toks = toks
+        # Drop the records of backtracked subtrees; off in packrat mode,
+        # where the memo may still hold them.
+        self.trimming = True
+        self.type_names = [] # Node type ID to ntype
+        self.type_ids = {}   # ntype to node type ID
+        self.types = array('i')
+        self.first = array('i')
+        self.last = array('i')
+        self.parent = array('i')
+        self.kid_start = array('i')
+        self.kid_count = array('i')
+        self.kids = array('i')
+        self.begin = array('i') # First record of the subtree
+
+    def type_id(self, ntype):
+        tid = self.type_ids.get(ntype)
+        if tid is None:
+            tid = len(self.type_names)
+            self.type_names.append(ntype)
+            self.type_ids[ntype] = tid
+        return tid
+
+    def add_leaf(self, ntype, pos):
+        """
+        Appends the leaf of the token at pos, returns its index.
+        """
+        idx = len(self.types)
+        self.types.append(self.type_id(ntype))
+        self.first.append(pos)
+        self.last.append(pos)
+        self.parent.append(-1)
+        self.kid_start.append(len(self.kids))
+        self.kid_count.append(-1)
+        self.begin.append(idx)
+        return idx
+
+    def add_node(self, ntype, childs, startpos, endpos):
+        """
+        Appends a node with the child indices childs, spanning the tokens
+        from startpos up to endpos, returns its index.
+        """
+        idx = len(self.types)
+        self.types.append(self.type_id(ntype))
+        self.first.append(startpos)
+        self.last.append(endpos - 1)
+        self.parent.append(-1)
+        self.kid_start.append(len(self.kids))
+        self.kid_count.append(len(childs))
+        if len(childs) > 0:
+            self.begin.append(self.begin[childs[0]])
+        else:
+            self.begin.append(idx)
+        self.kids.extend(childs)
+        for x in childs:
+            self.parent[x] = idx
+        return idx
+
+    def trim(self, childs, k):
+        """
+        Drops the records of the subtrees childs[k:], which a parser is
+        backtracking over. They are the last ones of the arena: the records
+        of a subtree are contiguous, and any record after them is of a
+        subtree that was already dropped.
+        """
+        if len(childs) > k:
+            self.truncate(self.begin[childs[k]])
+
+    def truncate(self, n):
+        """
+        Drops the records from the index n on.
+        """
+        if self.trimming and n < len(self.types):
+            del self.kids[self.kid_start[n]:]
+            for column in (self.types, self.first, self.last, self.parent,
+                self.kid_start, self.kid_count, self.begin):
+                del column[n:]
+
+    def extend(self, other, base):
+        """
+        Appends the records of the Arena other, whose token 0 is the token
+        base of this one. Returns what the indices of its nodes grow by.
+        """
+        offset = len(self.types)
+        kids = len(self.kids)
+        type_ids = [self.type_id(x) for x in other.type_names]
+        self.types.extend([type_ids[x] for x in other.types])
+        self.first.extend([x + base for x in other.first])
+        self.last.extend([x + base for x in other.last])
+        self.parent.extend([x + offset if x >= 0 else -1 for x in other.parent])
+        self.kid_start.extend([x + kids for x in other.kid_start])
+        self.kid_count.extend(other.kid_count)
+        self.kids.extend([x + offset for x in other.kids])
+        self.begin.extend([x + offset for x in other.begin])
+        return offset
+
+    def fix_parents(self, idx):
+        """
+        Sets the parent of every node under idx to the node holding it.
+        """
+        stack = [idx]
+        while len(stack) > 0:
+            n = stack.pop(-1)
+            start = self.kid_start[n]
+            for x in self.kids[start:start + max(self.kid_count[n], 0)]:
+                self.parent[x] = n
+                stack.append(x)
+
+    def view(self, idx):
+        """
+        Returns the NodeView of the node idx, or None if idx is None.
+        """
+        if idx is None:
+            return None
+        return NodeView(self, idx)
+
+    def __len__(self):
+        return len(self.types)
+
+class NodeView:
+    """
+    A node of an Arena, with the same attributes as parserbase.astnode. The
+    views are made when read and not kept; two views of the same node are
+    equal.
+    """
+    __slots__ = ('arena', 'idx')
+
+    def __init__(self, arena, idx):
+        self.arena = arena
+        self.idx = idx
+
+    @property
+    def ntype(self):
+        return self.arena.type_names[self.arena.types[self.idx]]
+
+    @property
+    def tok(self):
+        if self.arena.kid_count[self.idx] < 0:
+            return self.arena.toks[self.arena.first[self.idx]]
+        return None
+
+    @property
+    def childs(self):
+        if self.arena.kid_count[self.idx] < 0:
+            return []
+        start = self.arena.kid_start[self.idx]
+        return [NodeView(self.arena, x) for x in self.arena.kids[start:start + self.arena.kid_count[self.idx]]]
+
+    @property
+    def parent(self):
+        p = self.arena.parent[self.idx]
+        if p < 0:
+            return None
+        return NodeView(self.arena, p)
+
+    def is_terminal(self):
+        return self.tok is not None
+
+    def __eq__(self, other):
+        return type(other) is NodeView and other.arena is self.arena and other.idx == self.idx
+
+    def __hash__(self):
+        return hash(self.idx)
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Batch parsing. Parses many files in a pool of worker processes, so that the
+interpreter starts and the parser is imported once per worker instead of
+once per file, while a pool of threads reads the next files.
+"""
+
+import os
+import time
+from array import array
+
+from . import tokenizer
+from . import parser
+from . import stream
+from . import cache
+from .arena import Arena
+from .parserbase import astnode, arena_nodes, ParseError
+
+def find_sources(root):
+    """
+    Yields the path of every .py file under the directory root, in name
+    order, found with os.scandir. Links to directories are not followed,
+    and directories that can not be read are skipped.
+    """
+    stack = [root]
+    while len(stack) > 0:
+        path = stack.pop(-1)
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        dirs = []
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                dirs.append(e.path)
+            elif e.name.endswith('.py') and e.is_file():
+                yield e.path
+        stack.extend(reversed(dirs))
+
+def init_worker(cache_dir=None):
+    """
+    Initializer of the worker processes: builds the tables of the tokenizer
+    once, and enables the cache in cache_dir if not None. The parser and its
+    tables are loaded with this module.
+    """
+    if tokenizer.STR_PREFIXES is None:
+        tokenizer.init_tables()
+    if cache_dir is not None:
+        # Files are only evicted by the process that started the workers.
+        cache.enable(cache_dir, None)
+
+class ParseResult:
+    """
+    What parse_many returns for each file. name is its path, or the name
+    given with its source. tree is the NodeView of its file_input node,
+    or None if it did not parse or trees were not asked for, and error is
+    None, or why it did not parse. tokens and size are the number of its
+    tokens and bytes, and read_time, tokenize_time and parse_time are in
+    seconds.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.tree = None
+        self.error = None
+        self.tokens = 0
+        self.size = 0
+        self.read_time = 0.0
+        self.tokenize_time = 0.0
+        self.parse_time = 0.0
+
+def error_message(e):
+    return "{0}: {1}".format(type(e).__name__, e)
+
+def read_item(item):
+    """
+    Returns the name, the source, the seconds taken and the error of the
+    item of parse_many: a path, read as bytes, or a (name, source) pair.
+    """
+    if type(item) is tuple:
+        return item[0], item[1], 0.0, None
+    start = time.perf_counter()
+    try:
+        with open(item, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return item, None, time.perf_counter() - start, error_message(e)
+    return item, data, time.perf_counter() - start, None
+
+def parse_source(name, data, trees=True):
+    """
+    Tokenizes and parses data, the source of name as bytes or str, and
+    returns its ParseResult. The tree is in arena mode, which is quick to
+    send from a worker process. With the cache enabled, the tokens and the
+    tree are loaded from it or stored there.
+    """
+    result = ParseResult(name)
+    result.size = len(data)
+    try:
+        start = time.perf_counter()
+        if cache.current is not None:
+            toks = cache.current.tokenize_source(data)
+        else:
+            if type(data) is bytes:
+                data = tokenizer.decode_source(data)
+            toks = tokenizer.tokenize_source(data)
+        result.tokens = len(toks)
+        middle = time.perf_counter()
+        result.tokenize_time = middle - start
+        p = parser.parser(toks, arena=trees or cache.current is not None)
+        root = p.parse_file_input()
+        result.parse_time = time.perf_counter() - middle
+        if root is None:
+            result.error = "SyntaxError: invalid syntax"
+        elif trees:
+            result.tree = p.arena.view(root)
+    except Exception as e:
+        # Tokenizer and parser errors, and sources that can not be decoded
+        # or that nest too deep.
+        result.error = error_message(e)
+    return result
+
+def cached_result(c, name, key, trees, data=None):
+    """
+    Returns the ParseResult of the source key from what the Cache c holds,
+    without its size and times, or None if it is not there. The tokens of
+    a tree or an error need the source data; without it that is None too.
+    """
+    value = c.load_tree(key)
+    if value is None:
+        return None
+    tokens, digest, arena, root, error = value
+    result = ParseResult(name)
+    result.tokens = tokens
+    if error is not None or (trees and arena is not None):
+        if data is None:
+            return None
+        if type(data) is bytes:
+            data = tokenizer.decode_source(data)
+        toks = c.load_tokens(key, data, not trees)
+        if toks is None or len(toks) != tokens:
+            return None
+    if error is not None:
+        result.error = error_message(ParseError(error[0], error[1], toks[error[1]]))
+    elif arena is None:
+        result.error = "SyntaxError: invalid syntax"
+    elif trees:
+        arena.toks = toks
+        result.tree = arena.view(root)
+    return result
+
+def read_and_parse(item, pool, trees, c=None):
+    # Runs in a thread of parse_many: reads item, then waits for a worker
+    # process to parse it. With the Cache c, a file that did not change
+    # since it was parsed is not read unless its tree or error is needed,
+    # and one parsed before under any name is not parsed again.
+    st = None
+    if c is not None and type(item) is not tuple:
+        start = time.perf_counter()
+        entry = c.lookup(item)
+        if entry is not None:
+            result = cached_result(c, item, entry[2], trees)
+            if result is not None:
+                result.size = entry[1]
+                result.read_time = time.perf_counter() - start
+                return result
+        try:
+            st = os.stat(item)
+        except OSError:
+            pass
+
+    name, data, read_time, error = read_item(item)
+    result = None
+    if error is None and c is not None:
+        key = c.source_key(data)
+        if st is not None:
+            c.remember(item, st, key)
+        result = cached_result(c, name, key, trees, data)
+
+    if error is not None:
+        result = ParseResult(name)
+        result.error = error
+    elif result is not None:
+        result.size = len(data)
+    elif pool is None:
+        result = parse_source(name, data, trees)
+    else:
+        result = pool.submit(parse_source, name, data, trees).result()
+    result.read_time = read_time
+    return result
+
+def parse_many(paths_or_sources, workers=None, ordered=True, trees=True, pending=None):
+    """
+    Parses many files, and returns an iterator of their ParseResult.
+    paths_or_sources holds paths, or (name, source) pairs with the source
+    as bytes or str. The files are read in a pool of threads and parsed in
+    worker processes, one per CPU if None, or in this process if 1. At
+    most pending files, twice the workers by default, are being read or
+    parsed at a time, and paths_or_sources is only read as they are done.
+    The results are in the order of paths_or_sources if ordered is True,
+    and else as they are done. With trees False the files are only checked.
+    With the cache enabled, see cache.enable, the results are taken from it
+    when there, and stored in it when not.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if pending is None:
+        pending = 2 * workers
+
+    c = cache.current
+    cache_dir = None
+    if c is not None:
+        cache_dir = c.directory
+
+    if workers == 1:
+        init_worker()
+        for item in paths_or_sources:
+            yield read_and_parse(item, None, trees, c)
+        cache.flush()
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    items = iter(paths_or_sources)
+    more = True
+    running = []
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(cache_dir,)) as pool, \
+        ThreadPoolExecutor(pending) as threads:
+        while True:
+            while more and len(running) < pending:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    more = False
+                    break
+                running.append(threads.submit(read_and_parse, item, pool, trees, c))
+            if len(running) == 0:
+                break
+            if ordered:
+                yield running.pop(0).result()
+            else:
+                done = wait(running, return_when=FIRST_COMPLETED)[0]
+                for f in done:
+                    running.remove(f)
+                    yield f.result()
+    cache.flush()
+
+# First words of the clauses that go on with the statement before them.
+CONTINUATIONS = frozenset(['else', 'elif', 'except', 'finally'])
+
+def split_points(toks, count):
+    """
+    Splits toks, the tokens of a file, into about count chunks of units of
+    stream.read_units. Returns the index of the first token of each chunk
+    and of the ENDMARKER, and a dict from the start of each unit to the
+    start of the next one. A chunk does not start with a clause that goes
+    on with the statement before it, nor after a decorator.
+    """
+    size = max(len(toks) // count, 1)
+    points = [0]
+    next_unit = {}
+    pos = 0
+    prev = None
+    for unit in stream.read_units(toks):
+        next_unit[pos] = pos + len(unit)
+        if prev is not None and pos - points[-1] >= size and \
+            unit[0][4] not in CONTINUATIONS and prev[0][4] != '@':
+            points.append(pos)
+        pos = pos + len(unit)
+        prev = unit
+    end = len(toks) - 1
+    if points[-1] == end:
+        points.pop(-1)
+    points.append(end)
+    return points, next_unit
+
+def parse_chunk(toks, end, compact=False, punctuation=True):
+    """
+    Parses the NEWLINE tokens and statements at the top level of toks from
+    the first one on, like parse_file_input in arena mode, while they end
+    by the index end; the tokens after end are lookahead. Returns the
+    Arena, the indices of the nodes, the index where it stopped, and
+    (rule, pos) of the ParseError that stopped it, or None.
+    """
+    p = parser.parser(toks, False, compact, punctuation, True)
+    arena = p.arena
+    items = []
+    pos = 0
+    error = None
+    while pos < end:
+        if p.tclasses[pos] == tokenizer.T_NEWLINE:
+            items.append(arena.add_leaf('NEWLINE', pos))
+            pos = pos + 1
+            continue
+        mark = len(arena)
+        p.pos = pos
+        try:
+            c = p.parse_stmt()
+        except ParseError as e:
+            c = None
+            error = (e.rule, e.pos)
+        if c is None or p.pos > end:
+            # Goes on past end, or needs the tokens after the lookahead.
+            arena.truncate(mark)
+            break
+        items.append(c)
+        pos = p.pos
+    # Sent back without the tokens, which the caller has.
+    arena.toks = None
+    return arena, items, pos, error
+
+def parse_split(toks, workers=None, chunks=None, compact=False, punctuation=True, arena=False):
+    """
+    Parses toks, the tokens of a file as a list, like parse_file_input, but
+    in worker processes: the file is split at top-level statements into
+    chunks, 4 per worker by default, which are parsed at the same time and
+    joined under one file_input node. Returns that node, a NodeView in
+    arena mode, or None if the file does not parse. The workers send back
+    Arena objects, much quicker to pass between processes than astnode
+    objects, and out of arena mode they are made into astnode objects here.
+
+    A chunk is parsed with the unit after it, since the parser looks past
+    a statement for a clause that goes on with it. If a statement does not
+    end by the end of its chunk, the split was wrong there: the statements
+    from it on are parsed again in this process, up to the start of a later
+    chunk.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunks is None:
+        chunks = 4 * workers
+    points, next_unit = split_points(toks, chunks)
+    end = points[-1]
+
+    def chunk(start, stop):
+        return toks[start:next_unit.get(stop, len(toks))], stop - start
+
+    args = [chunk(points[i], points[i + 1]) for i in range(len(points) - 1)]
+    options = (compact, punctuation)
+    pool = None
+    if workers == 1:
+        results = iter([parse_chunk(t, e, *options) for t, e in args])
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(workers, initializer=init_worker)
+        results = pool.map(parse_chunk, [a[0] for a in args], [a[1] for a in args],
+            *[[x] * len(args) for x in options])
+
+    if arena:
+        whole = Arena(toks)
+    childs = []
+    pos = 0
+    i = 0 # Next chunk whose result was not taken
+    try:
+        while pos < end:
+            while points[i] < pos:
+                next(results)
+                i = i + 1
+            if points[i] == pos:
+                part, items, stop, error = next(results)
+                i = i + 1
+                limit = points[i]
+            else:
+                # Parse from pos up to the start of a chunk, or to the end
+                # of the file if no statement ends before that.
+                j = i
+                while True:
+                    limit = points[j]
+                    part, items, stop, error = parse_chunk(*(chunk(pos, limit) + options))
+                    if stop > 0 or limit == end:
+                        break
+                    if error is not None:
+                        j = len(points) - 1
+                    else:
+                        j = j + 1
+            if arena:
+                offset = whole.extend(part, pos)
+                childs.extend([x + offset for x in items])
+            else:
+                nodes = arena_nodes(part, toks, pos)
+                childs.extend([nodes[x] for x in items])
+            if stop == 0 and limit == end:
+                if error is not None:
+                    raise ParseError(error[0], pos + error[1], toks[pos + error[1]])
+                return None
+            pos = pos + stop
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if arena:
+        childs.append(whole.add_leaf('ENDMARKER', end))
+        if compact and len(childs) == 1:
+            return whole.view(childs[0])
+        return whole.view(whole.add_node('file_input', childs, 0, end + 1))
+    childs.append(astnode('ENDMARKER', toks[end]))
+    if compact and len(childs) == 1:
+        return childs[0]
+    node = astnode('file_input')
+    for x in childs:
+        node.addchild(x)
+    return node
+
+def tokenize_chunk(text, base, line_num, strict=False):
+    """
+    Tokenizes text, the lines of a source from its position base and line
+    line_num, as if they started at the top level: at bracket level 0,
+    outside a string and with the indent stack [0]. Returns a TokenBuffer
+    without its source and the bracket level at the end of text, or None
+    and 0 if text does not tokenize on its own and strict is False.
+    """
+    try:
+        tuples = list(tokenizer.generate_tokens(iter([text]), base, line_num))
+    except Exception:
+        # A string that goes on in the next chunk, or a syntax error.
+        if strict:
+            raise
+        return None, 0
+    # Columns are much quicker than tuples to send back.
+    toks = tokenizer.TokenBuffer(None)
+    toks.kinds = array('i', [t[0] for t in tuples])
+    toks.starts = array('i', [t[1] for t in tuples])
+    toks.ends = array('i', [t[2] for t in tuples])
+    toks.lines = array('i', [t[3] for t in tuples])
+    level = 0
+    for k in tokenizer.OPEN_BRACKETS:
+        level = level + toks.kinds.count(k)
+    for k in tokenizer.CLOSE_BRACKETS:
+        level = level - toks.kinds.count(k)
+    return toks, level
+
+def line_points(S, count):
+    """
+    Splits the str S into about count chunks of whole lines, and returns the
+    position where each one starts and len(S). A chunk starts with a line
+    that has code at column 0 and does not follow a backslash.
+    """
+    size = max(len(S) // count, 1)
+    points = [0]
+    pos = size
+    while pos < len(S):
+        n = S.find('\n', pos)
+        if n == -1 or n + 1 >= len(S):
+            break
+        pos = n + 1
+        if S[pos] not in ' \t#\n\\' and S[n - 1:n] != '\\':
+            points.append(pos)
+            pos = pos + size
+    points.append(len(S))
+    return points
+
+def tokenize_split(S, workers=None, chunks=None, compact=False):
+    """
+    Tokenizes the str S like tokenizer.tokenize_source, but in worker
+    processes: S is split into chunks of lines, 4 per worker by default,
+    which are tokenized at the same time and joined.
+
+    Each chunk is tokenized as if it started at the top level, which is
+    right if the chunk before it was and ends at bracket level 0 without
+    an error. Its DEDENT tokens at the end are then those of the first line
+    of the next chunk, which is at column 0, and only its ENDMARKER is
+    dropped. Where a chunk does not end so, it is tokenized again in this
+    process together with the chunks after it, twice as many each time,
+    until a chunk boundary where it does.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunks is None:
+        chunks = 4 * workers
+    points = line_points(S, chunks)
+    m = len(points) - 1
+    lines = [1]
+    for i in range(1, m):
+        lines.append(lines[-1] + S.count('\n', points[i - 1], points[i]))
+
+    args = [(S[points[i]:points[i + 1]], points[i], lines[i]) for i in range(m)]
+    pool = None
+    if workers > 1 and m > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(workers, initializer=init_worker)
+        results = pool.map(tokenize_chunk, *zip(*args))
+
+    whole = tokenizer.TokenBuffer(S)
+    columns = ('kinds', 'starts', 'ends', 'lines')
+    i = 0 # Next chunk
+    try:
+        while i < m:
+            if pool is None:
+                part, level = tokenize_chunk(*args[i])
+            else:
+                part, level = next(results)
+            j = i + 1
+            span = 2
+            while part is None or (level != 0 and j < m):
+                j = min(i + span, m)
+                part, level = tokenize_chunk(S[points[i]:points[j]], points[i], lines[i], j == m)
+                span = 2 * span
+            if pool is not None:
+                for k in range(i + 1, j):
+                    next(results)
+            i = j
+            # The ENDMARKER, but for the last chunk.
+            n = len(part) - (i < m)
+            for c in columns:
+                getattr(whole, c).extend(getattr(part, c)[:n])
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if compact:
+        return whole
+    return [(k, s, e, l, None if k in tokenizer.VALUELESS else S[s:e])
+        for k, s, e, l in zip(whole.kinds, whole.starts, whole.ends, whole.lines)]
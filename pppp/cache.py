@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+On-disk cache of token lists and parse trees. An entry is keyed by a hash of
+the source bytes, the pppp version and the Grammar file, so the same source
+finds it under any path. A manifest holds the mtime and size each path had
+when it was hashed, so that a file that did not change is not hashed again,
+nor even read by batch.parse_many when only its result is asked for.
+Once the cache is larger than its size limit, the files least recently used
+are removed.
+
+enable() turns the cache on for this process: from then on
+tokenizer.tokenize_file loads the tokens from the cache, and parser.parser
+the tree of parse_file_input for those tokens.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import struct
+import hashlib
+import threading
+from array import array
+
+from . import tokenizer
+from .arena import Arena
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# A file modified this recently is not put in the manifest, since an edit
+# made within the resolution of its mtime would leave it the same.
+RACY_SECONDS = 2
+
+MANIFEST = 'manifest'
+
+# An entry file starts with MAGIC and a header of FORMAT, the item size and
+# byte order of its columns, and the number of its integers, columns and
+# strings. Then come the integers, the byte size of each column and its
+# bytes, and the strings as UTF-8 separated by newlines. A file written in
+# another format, or on another machine, is a miss.
+MAGIC = b'PPPP'
+FORMAT = 1
+HEADER = struct.Struct('<4sHBBIII')
+
+# Arena columns stored with a tree.
+ARENA_COLUMNS = ('types', 'first', 'last', 'parent', 'kid_start', 'kid_count', 'kids', 'begin')
+
+# The Cache of this process, or None.
+current = None
+
+def enable(directory, max_size=DEFAULT_MAX_SIZE):
+    """
+    Turns the cache in directory on, and returns its Cache. With max_size
+    None it has no size limit.
+    """
+    global current
+    if current is not None:
+        current.flush()
+    else:
+        atexit.register(flush)
+    current = Cache(directory, max_size)
+    return current
+
+def disable():
+    global current
+    flush()
+    current = None
+
+def flush():
+    if current is not None:
+        current.flush()
+
+def grammar_hash():
+    """
+    Hash of the pppp version and the Grammar file, or the parser generated
+    from it if the Grammar is not installed.
+    """
+    from . import __version__
+    h = hashlib.sha256(__version__.encode('utf-8'))
+    package = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(os.path.dirname(package), 'Grammar')
+    if not os.path.exists(path):
+        path = os.path.join(package, 'parser.py')
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    return h.digest()
+
+def classes_digest(classes):
+    """
+    Hash of the token classes of parserbase.parser_base, stored with a
+    tree to tell the tokens it was parsed from.
+    """
+    return hashlib.sha256(array('i', classes).tobytes()).hexdigest()
+
+class CachedTokens(list):
+    """
+    A token list stored in the cache. cache_key is the key of its source,
+    with which parser.parser finds its tree.
+    """
+    cache_key = None
+
+def pack_entry(ints, columns, strings):
+    """
+    Returns the bytes of an entry file holding the integers ints, the
+    array('i') columns and the strings, which have no newlines.
+    """
+    text = '\n'.join(strings).encode('utf-8')
+    parts = [HEADER.pack(MAGIC, FORMAT, array('i').itemsize, sys.byteorder == 'little',
+        len(ints), len(columns), len(strings))]
+    parts.append(struct.pack('<{0}q'.format(len(ints)), *ints))
+    parts.append(struct.pack('<{0}Q'.format(len(columns) + 1), *([len(x) * x.itemsize for x in columns] + [len(text)])))
+    parts.extend([x.tobytes() for x in columns])
+    parts.append(text)
+    return b''.join(parts)
+
+def unpack_entry(data):
+    """
+    Returns the (ints, columns, strings) of the bytes of an entry file, or
+    None if they are not one that pack_entry wrote here.
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, fmt, itemsize, little, nints, ncolumns, nstrings = HEADER.unpack_from(data)
+    if magic != MAGIC or fmt != FORMAT or itemsize != array('i').itemsize or \
+        little != (sys.byteorder == 'little'):
+        return None
+    offset = HEADER.size
+    if len(data) < offset + 8 * (nints + ncolumns + 1):
+        return None
+    ints = struct.unpack_from('<{0}q'.format(nints), data, offset)
+    offset = offset + 8 * nints
+    sizes = struct.unpack_from('<{0}Q'.format(ncolumns + 1), data, offset)
+    offset = offset + 8 * (ncolumns + 1)
+    if offset + sum(sizes) != len(data):
+        return None
+    columns = []
+    for size in sizes[:-1]:
+        column = array('i')
+        column.frombytes(data[offset:offset + size])
+        columns.append(column)
+        offset = offset + size
+    text = data[offset:].decode('utf-8')
+    strings = text.split('\n') if nstrings > 0 else []
+    if len(strings) != nstrings:
+        return None
+    return list(ints), columns, strings
+
+class Cache:
+    """
+    The entries of a source are files named by its key in directory: its
+    tokens, and a tree for each compact and punctuation mode of the parser.
+    They hold array columns, like TokenBuffer and Arena, see pack_entry;
+    the values of the tokens are sliced from the source again when read.
+    A file is touched when read, so its mtime tells when it was last used.
+    """
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.salt = grammar_hash()
+        self.lock = threading.Lock()
+        self.manifest = None # Path to (mtime, size, key), read when needed
+        self.dirty = False
+        self.size = None     # Bytes at the last eviction, plus those written
+        os.makedirs(directory, exist_ok=True)
+
+    def source_key(self, data):
+        """
+        Returns the key of the source data, as bytes or str.
+        """
+        if type(data) is str:
+            data = data.encode('utf-8')
+        h = hashlib.sha256(self.salt)
+        h.update(data)
+        return h.hexdigest()
+
+    def read_manifest(self):
+        # A JSON object of path to [mtime, size, key].
+        if self.manifest is None:
+            try:
+                with open(os.path.join(self.directory, MANIFEST), 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+                if type(self.manifest) is not dict:
+                    self.manifest = {}
+            except Exception:
+                self.manifest = {}
+        return self.manifest
+
+    def lookup(self, path, st=None):
+        """
+        Returns the (mtime, size, key) of path in the manifest if it still
+        has that mtime and size, or else None. st is the os.stat of path,
+        taken here if None.
+        """
+        entry = self.read_manifest().get(os.path.abspath(path))
+        if type(entry) is not list or len(entry) != 3:
+            return None
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        if st.st_mtime_ns != entry[0] or st.st_size != entry[1]:
+            return None
+        return entry
+
+    def remember(self, path, st, key):
+        """
+        Puts path in the manifest, with key the hash of what it held when
+        os.stat returned st.
+        """
+        if time.time() - st.st_mtime < RACY_SECONDS:
+            return
+        with self.lock:
+            self.read_manifest()[os.path.abspath(path)] = [st.st_mtime_ns, st.st_size, key]
+            self.dirty = True
+
+    def entry_path(self, key, suffix):
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def read(self, key, suffix):
+        """
+        Returns the (ints, columns, strings) of an entry, or None.
+        """
+        path = self.entry_path(key, suffix)
+        try:
+            with open(path, 'rb') as f:
+                value = unpack_entry(f.read())
+            os.utime(path)
+        except (OSError, ValueError, struct.error):
+            # Not there, removed meanwhile, or not valid.
+            return None
+        return value
+
+    def write(self, key, suffix, ints, columns, strings):
+        data = pack_entry(ints, columns, strings)
+        path = self.entry_path(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written aside and renamed, so a reader never sees half of it.
+        temp = "{0}.{1}.{2}.tmp".format(path, os.getpid(), threading.get_ident())
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+        if self.max_size is None:
+            return
+        with self.lock:
+            if self.size is None:
+                self.size = self.evict()
+            self.size = self.size + len(data)
+            if self.size > self.max_size:
+                self.size = self.evict()
+
+    def evict(self):
+        """
+        Removes the files least recently used until the cache is down to
+        3/4 of max_size, if it is larger than max_size. Returns its size.
+        """
+        files = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            dirs = [e.path for e in it if e.is_dir()]
+        for d in dirs:
+            with os.scandir(d) as it:
+                for e in it:
+                    st = e.stat()
+                    files.append((st.st_mtime_ns, st.st_size, e.path))
+                    total = total + st.st_size
+        if self.max_size is None or total <= self.max_size:
+            return total
+        files.sort()
+        for mtime, size, path in files:
+            if total <= self.max_size * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total = total - size
+        return total
+
+    def flush(self):
+        """
+        Saves the manifest, and keeps the cache within max_size.
+        """
+        with self.lock:
+            if self.dirty:
+                path = os.path.join(self.directory, MANIFEST)
+                temp = "{0}.{1}.tmp".format(path, os.getpid())
+                with open(temp, 'w', encoding='utf-8') as f:
+                    json.dump(self.manifest, f)
+                os.replace(temp, path)
+                self.dirty = False
+            if self.max_size is not None:
+                self.size = self.evict()
+
+    def load_tokens(self, key, S, compact=False):
+        """
+        Returns the tokens of the source key, the str S, like
+        tokenizer.tokenize_source, or None if they are not in the cache.
+        """
+        value = self.read(key, '.tok')
+        if value is None:
+            return None
+        columns = value[1]
+        if len(columns) != 4 or len(set([len(x) for x in columns])) != 1:
+            return None
+        kinds, starts, ends, lines = columns
+        if compact:
+            toks = tokenizer.TokenBuffer(S)
+            toks.kinds = kinds
+            toks.starts = starts
+            toks.ends = ends
+            toks.lines = lines
+        else:
+            valueless = tokenizer.VALUELESS
+            toks = CachedTokens([(k, s, e, l, None if k in valueless else S[s:e])
+                for k, s, e, l in zip(kinds, starts, ends, lines)])
+        toks.cache_key = key
+        return toks
+
+    def tokenize_source(self, data, compact=False, verbose=False, key=None):
+        """
+        Tokenizes data, a source as bytes or str, like
+        tokenizer.tokenize_source, unless its tokens are in the cache.
+        """
+        if key is None:
+            key = self.source_key(data)
+        if type(data) is bytes:
+            S = tokenizer.decode_source(data, verbose)
+        else:
+            S = data
+        toks = self.load_tokens(key, S, compact)
+        if toks is not None:
+            return toks
+        toks = tokenizer.tokenize_source(S, compact)
+        if compact:
+            columns = (toks.kinds, toks.starts, toks.ends, toks.lines)
+        else:
+            columns = [array('i', [t[f] for t in toks]) for f in range(4)]
+            toks = CachedTokens(toks)
+        self.write(key, '.tok', [], columns, [])
+        toks.cache_key = key
+        return toks
+
+    def tokenize_file(self, file_name, compact=False, verbose=False):
+        """
+        tokenizer.tokenize_file, through the cache.
+        """
+        with open(file_name, 'rb') as f:
+            data = f.read()
+            st = os.fstat(f.fileno())
+        entry = self.lookup(file_name, st)
+        if entry is not None:
+            key = entry[2]
+        else:
+            key = self.source_key(data)
+            self.remember(file_name, st, key)
+        return self.tokenize_source(data, compact, verbose, key)
+
+    def tree_suffix(self, compact, punctuation):
+        return ".t{0}{1}".format(int(compact), int(punctuation))
+
+    def load_tree(self, key, compact=False, punctuation=True):
+        """
+        Returns what store_tree stored for the source key in the parser
+        mode compact and punctuation, as (tokens, digest, arena, root,
+        error), or None. The Arena has no toks.
+        """
+        value = self.read(key, self.tree_suffix(compact, punctuation))
+        if value is None:
+            return None
+        ints, columns, strings = value
+        if len(ints) != 3 or len(strings) < 2:
+            return None
+        tokens, root, pos = ints
+        error = None
+        if pos >= 0:
+            if pos >= tokens:
+                return None
+            error = (strings[1], pos)
+        if root < 0:
+            return (tokens, strings[0], None, None, error)
+        if len(columns) != len(ARENA_COLUMNS):
+            return None
+        arena = Arena(None)
+        for name, column in zip(ARENA_COLUMNS, columns):
+            setattr(arena, name, column)
+        arena.type_names = strings[2:]
+        arena.type_ids = dict([(x, i) for i, x in enumerate(arena.type_names)])
+        n = len(arena.types)
+        if root >= n or len([x for x in columns if x is not arena.kids and len(x) != n]) > 0:
+            return None
+        return (tokens, strings[0], arena, root, error)
+
+    def store_tree(self, key, compact, punctuation, tokens, digest, arena, root, error):
+        """
+        Stores the result of parse_file_input for the source key: the number
+        of its tokens and the classes_digest of their classes, the Arena and
+        the index of its root, or None if it did not parse, and the
+        (rule, pos) of its ParseError, or None.
+        """
+        strings = [digest, '']
+        columns = []
+        if arena is not None:
+            columns = [getattr(arena, x) for x in ARENA_COLUMNS]
+            strings = strings + arena.type_names
+        else:
+            root = -1
+        pos = -1
+        if error is not None:
+            strings[1] = error[0]
+            pos = error[1]
+        self.write(key, self.tree_suffix(compact, punctuation), [tokens, root, pos], columns, strings)
@@ -231,8 +231,9 @@ class GrammarParser:
         self.productions_text = None
         self.tokens = TOK_NAMES
         self.first_table = {}
-        self.first_table_build = set()
+        self.first_nodes = {} # FIRST de los nodos del arbol, por id()
         self.follow_table = {}
+        self.follow_nodes = {} # FOLLOW de los nodos del arbol, por id()
         #self.m_table = {} # LL(1)
 
         # FIXME: 
@@ -405,87 +406,210 @@ class GrammarParser:
     def FIRST(self, N):
         """
         Devuelve el conjunto de terminales que pueden comenzar una derivación desde N.
+        Las tablas se construyen una sola vez, ver build_FIRST.
         """
-        #print("$$$ ", N)
-        
-        ret = None
-        # memorize = False
-        
-        #if memorize:
-        #    if N in self.first_table_build:
-        #        return set()
-        #    self.first_table_build |= set([N])
-        
+        if len(self.first_table) == 0:
+            self.build_FIRST()
         if type(N) is str:
-            #if memorize:
-            #    if N in self.first_table:
-            #        ret = self.first_table[N]
-            
-            if ret is None:
-                if self.isTerminal(N):
-                    ret = frozenset([N])
-                else:
-                    ret = self.FIRST(self.G[N])
-                
-                #if memorize:
-                #    self.first_table[N] = ret
+            if self.isTerminal(N):
+                return frozenset([N])
+            return self.first_table[N]
+        ret = self.first_nodes.get(id(N))
+        if ret is None:
+            # Un nodo que no es parte de la gramática.
+            ret = self.firstNode(N, None)
+        return ret
+
+    def firstNode(self, N, nodes):
+        """
+        Calcula el FIRST de N a partir de la tabla FIRST actual de los
+        noterminales. Si nodes no es None, guarda ahí el de cada nodo del
+        arbol por su id().
+        """
+        if type(N) is str:
+            if self.isTerminal(N):
+                return frozenset([N])
+            return self.first_table[N]
+
+        eps = frozenset([EPS_SYMBOL])
+        if N.type == 'S':
+            # Hay que cortar el recorrido de la secuencia en el primer elemento que no tenga EPS, 
+            # y agregar EPS solo cuando todos lo tienen. Los elementos que siguen se visitan igual,
+            # para guardar su FIRST.
+            t = frozenset()
+            all_eps = True
+            for x in N.data:
+                u = self.firstNode(x, nodes)
+                if all_eps:
+                    t = t | (u - eps)
+                    all_eps = EPS_SYMBOL in u
+            if all_eps:
+                t = t | eps
+        elif N.type == 'A':
+            t = frozenset()
+            for x in N.data:
+                t = t | self.firstNode(x, nodes)
+        elif N.type == '*' or N.type == '[':
+            t = eps | self.firstNode(N.data, nodes)
+        elif N.type == '+':
+            t = self.firstNode(N.data, nodes)
         else:
-            #print("!!!", N)
-            if N.type == 'S':
-                t = frozenset()
-                # Hay que cortar el recorrido de la secuencia en el primer elemento que no tenga EPS, 
-                # y agregar EPS solo cuando todos lo tienen.
-                eps_count = 0
+            assert False
+
+        if nodes is not None:
+            nodes[id(N)] = t
+        return t
+
+    def build_FIRST(self):
+        """
+        Construye la tabla FIRST para cada noterminal A, y la de cada nodo
+        del arbol por su id(). Se parte de conjuntos vacíos y se recorren
+        todas las producciones hasta que ningún conjunto cambia.
+        """
+        self.first_table = dict([(A[0], frozenset()) for A in self.productions])
+        changed = True
+        while changed:
+            changed = False
+            nodes = {}
+            # Las producciones que usan a otras suelen estar antes en el
+            # archivo; al revés hacen falta menos vueltas.
+            for A in reversed(self.productions):
+                u = self.firstNode(A[2], nodes)
+                if u != self.first_table[A[0]]:
+                    self.first_table[A[0]] = u
+                    changed = True
+        self.first_nodes = nodes
+
+    def NULLABLE(self, N):
+        """
+        Devuelve True si N puede derivar el string vacío.
+        """
+        return EPS_SYMBOL in self.FIRST(N)
+
+    def build_FOLLOW(self):
+        """
+        Construye la tabla FOLLOW para cada noterminal A, y la de cada nodo
+        del arbol por su id(). Se recorren todas las producciones hasta que
+        ningún conjunto cambia.
+        """
+        self.follow_table = dict([(A[0], frozenset()) for A in self.productions])
+        self.follow_nodes = {}
+        for A in self.start_symbs:
+            self.follow_table[A] = frozenset([INPUT_END_SYMBOL])
+        changed = True
+        while changed:
+            changed = False
+            for A in self.productions:
+                if self.followNode(A[2], self.follow_table[A[0]]):
+                    changed = True
+
+    def followNode(self, N, fol):
+        """
+        Agrega fol al FOLLOW de N y de sus hijos. Devuelve True si cambió
+        el FOLLOW de algún noterminal.
+        """
+        if type(N) is str:
+            if self.isTerminal(N) or fol <= self.follow_table[N]:
+                return False
+            self.follow_table[N] = self.follow_table[N] | fol
+            return True
+
+        self.follow_nodes[id(N)] = self.follow_nodes.get(id(N), frozenset()) | fol
+        changed = False
+        if N.type == 'S':
+            # Lo que sigue a cada elemento es el FIRST del resto de la
+            # secuencia, más fol si el resto puede ser vacío.
+            for x in reversed(N.data):
+                if self.followNode(x, fol):
+                    changed = True
+                u = self.FIRST(x)
+                if EPS_SYMBOL in u:
+                    fol = (u - frozenset([EPS_SYMBOL])) | fol
+                else:
+                    fol = u
+        elif N.type == 'A':
+            for x in N.data:
+                if self.followNode(x, fol):
+                    changed = True
+        elif N.type == '[':
+            changed = self.followNode(N.data, fol)
+        elif N.type == '*' or N.type == '+':
+            # Después de una repetición puede venir otra.
+            u = self.FIRST(N.data) - frozenset([EPS_SYMBOL])
+            changed = self.followNode(N.data, u | fol)
+        return changed
+
+    def FOLLOW(self, N):
+        """
+        Devuelve el conjunto de terminales que pueden venir a continuación
+        de N, un noterminal o un nodo del arbol.
+        """
+        if len(self.follow_table) == 0:
+            self.build_FOLLOW()
+        if type(N) is str:
+            return self.follow_table[N]
+        return self.follow_nodes[id(N)]
+
+    def conflicts(self):
+        """
+        Devuelve los conflictos LL(1) de la gramática, como una lista de
+        (noterminal, tipo, terminales, nodo):
+
+        - 'FIRST/FIRST': dos alternativas de un nodo 'A' pueden comenzar con
+          los mismos terminales.
+
+        - 'FIRST/FOLLOW': un nodo '[', '*' o '+', o una alternativa que puede
+          ser vacía, puede comenzar con un terminal que también puede venir
+          a continuación.
+        """
+        out = []
+        def walk(N, rule):
+            if type(N) is str:
+                return
+            if N.type == 'A':
+                seen = frozenset()
+                both = frozenset()
                 for x in N.data:
-                    u = self.FIRST(x)
-                    eps_was_here = (EPS_SYMBOL in u)
-                    if eps_was_here:
-                        u = u - frozenset([EPS_SYMBOL])
-                        eps_count = eps_count + 1
-                    t = t | u
-                    if not eps_was_here:
-                        break
-                if eps_count == len(N.data):
-                    t = t | frozenset([EPS_SYMBOL])
-                ret = t
-            elif N.type == 'A':
-                t = frozenset()
+                    u = self.FIRST(x) - frozenset([EPS_SYMBOL])
+                    both = both | (seen & u)
+                    seen = seen | u
+                if len(both) > 0:
+                    out.append((rule, 'FIRST/FIRST', both, N))
+                if len([x for x in N.data if self.NULLABLE(x)]) > 0:
+                    both = seen & self.FOLLOW(N)
+                    if len(both) > 0:
+                        out.append((rule, 'FIRST/FOLLOW', both, N))
+            elif N.type in '[*+':
+                both = (self.FIRST(N.data) - frozenset([EPS_SYMBOL])) & self.FOLLOW(N)
+                if len(both) > 0:
+                    out.append((rule, 'FIRST/FOLLOW', both, N))
+            if type(N.data) is list:
                 for x in N.data:
-                    u = self.FIRST(x)
-                    if False and len(u.intersection(t)) != 0:
-                        # Si esto da True en algun lugar, la gramatica hace falta
-                        # procesarla con backtracking, ya que existe "P -> A | B", 
-                        # con (FIRST(A) \intersection FIRST(B)) != \empty . Por lo tanto
-                        # en una alternativa "A|B" no alcanza con saber el proximo simbolo,
-                        # y A y B tienen un prefijo de terminales en común.
-                        print(t)
-                        print(u)
-                        print(N)
-                        # assert False
-                    t = t | u
-                ret = t
-            elif N.type == '*':
-                t = frozenset([EPS_SYMBOL])
-                t |= self.FIRST(N.data)
-                ret = t
-            elif N.type == '+':
-                t = frozenset([])
-                t |= self.FIRST(N.data)
-                ret = t
-            elif N.type == '[':
-                t = frozenset([EPS_SYMBOL])
-                t |= self.FIRST(N.data)
-                ret = t
-
-        assert ret is not None
-        #if memorize:
-        #    self.first_table_build.remove(N)
-        return ret
+                    walk(x, rule)
+            else:
+                walk(N.data, rule)
+        for A in self.productions:
+            walk(A[2], A[0])
+        return out
 
-    def build_FIRST(self):
-        """Construye la tabla FIRST para cada noterminal A"""
+    def report(self, out=sys.stdout):
+        """
+        Imprime los conjuntos de cada noterminal y los conflictos LL(1).
+        """
         for A in self.productions:
-            self.first_table[A[0]] = self.FIRST(A[0])
+            if self.NULLABLE(A[0]):
+                print(A[0] + " (nullable)", file=out)
+            else:
+                print(A[0], file=out)
+            print("  FIRST: " + ' '.join(sorted(self.FIRST(A[0]))), file=out)
+            print("  FOLLOW: " + ' '.join(sorted(self.FOLLOW(A[0]))), file=out)
+        C = self.conflicts()
+        print(file=out)
+        print("%d conflicts" % len(C), file=out)
+        for rule, kind, terms, N in C:
+            print(file=out)
+            print(rule + ": " + printNodeStr(N), file=out)
+            print("  " + kind + " on: " + ' '.join(sorted(terms)), file=out)
 
     #~ def FIRST2(self, N):
         #~ """
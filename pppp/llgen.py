@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Table driven parser generator. Compiles the Grammar into the prediction
+tables of the "lltables.py" file, which are run by llparser.py.
+"""
+
+import sys
+import pprint
+
+from . import grammarparse
+from . import parsergen
+from . import tokenizer
+
+GrammarNode = grammarparse.GrammarNode
+
+# Kinds of the nodes of the compiled grammar.
+K_TERM = 0  # ARG: token class, LABEL: terminal name
+K_RULE = 1  # ARG: rule ID
+K_SEQ = 2   # ARG: tuple of node IDs
+K_ALT = 3   # DISPATCH and DEFAULT hold the node IDs of the alternatives
+K_OPT = 4   # ARG: node ID
+K_STAR = 5  # ARG: node ID
+K_PLUS = 6  # ARG: node ID
+
+# ITEMS of a K_SEQ or K_RULE node are the node IDs it runs in sequence.
+#
+# ENTRY of a node is the mask of the token classes that can start what it
+# runs: the rule body or the sequence, or the child of K_OPT, K_STAR and
+# K_PLUS. It is None if that can match nothing, so it can not be checked.
+
+class llparser_gen(parsergen.parser_gen):
+    def __init__(self):
+        parsergen.parser_gen.__init__(self)
+        self.kinds = []
+        self.entry = []
+        self.args = []
+        self.labels = []
+        self.dispatch = []
+        self.default = []
+        self.rules = {} # Rule name to rule ID
+        self.rule_refs = [] # Node ID calling each rule
+        self.terms = {} # Terminal name to node ID
+        self.conflicts = [] # (rule, terminals, alternatives) of each conflict
+
+    def newNode(self, kind, arg, label=None, dispatch=None, default=None, first=None):
+        idx = len(self.kinds)
+        self.kinds.append(kind)
+        if first is None or grammarparse.EPS_SYMBOL in first:
+            self.entry.append(None)
+        else:
+            self.entry.append(self.mask(first))
+        self.args.append(arg)
+        self.labels.append(label)
+        self.dispatch.append(dispatch)
+        self.default.append(default)
+        return idx
+
+    def classNames(self, m):
+        return [sorted(self.class_gstrs[c])[0] for c in range(len(self.class_gstrs)) if m >> c & 1]
+
+    def compileNode(self, N, rule):
+        if type(N) is str:
+            if self.G.isTerminal(N):
+                if N not in self.terms:
+                    if N[0] == "'" and N[-1] == "'":
+                        cls = self.keywords[N[1:-1]]
+                    else:
+                        cls = getattr(tokenizer, 'T_' + N)
+                    self.terms[N] = self.newNode(K_TERM, cls, N)
+                return self.terms[N]
+            return self.rule_refs[self.rules[N]]
+
+        assert type(N) is GrammarNode
+        if N.type == 'S':
+            assert type(N.data) is list
+            items = []
+            for x in N.data:
+                nid = self.compileNode(x, rule)
+                # Nested sequences run the same as a flat one.
+                if self.kinds[nid] == K_SEQ:
+                    items.extend(self.args[nid])
+                else:
+                    items.append(nid)
+            if len(items) == 1:
+                return items[0]
+            return self.newNode(K_SEQ, tuple(items), first=self.G.FIRST(N))
+        elif N.type == 'A':
+            assert type(N.data) is list
+            # Same order of precedence as the recursive descent parser.
+            alts = sorted(N.data, key=self.alt_key, reverse=True)
+            alts = [(self.compileNode(x, rule), self.G.FIRST(x)) for x in alts]
+
+            # Each token class dispatches to the alternatives whose FIRST
+            # set has it, in order. The ones with EPS may match nothing, so
+            # they are candidates for any class.
+            nullable = tuple([nid for nid, f in alts if grammarparse.EPS_SYMBOL in f])
+            masks = [(nid, self.mask(f)) for nid, f in alts]
+            union = 0
+            for nid, m in masks:
+                union = union | m
+            dispatch = {}
+            conflict = 0
+            for c in range(len(self.class_gstrs)):
+                if union >> c & 1:
+                    cands = tuple([nid for nid, m in masks if (m >> c & 1) or nid in nullable])
+                    dispatch[c] = cands
+                    if len(cands) > 1:
+                        conflict = conflict | (1 << c)
+            if conflict:
+                self.conflicts.append((rule, self.classNames(conflict), grammarparse.printNodeStr(N)))
+            return self.newNode(K_ALT, None, None, dispatch, nullable)
+        elif N.type == '[':
+            assert type(N.data) is GrammarNode
+            return self.newNode(K_OPT, self.compileNode(N.data, rule), first=self.G.FIRST(N.data))
+        elif N.type == '*':
+            assert type(N.data) is GrammarNode
+            return self.newNode(K_STAR, self.compileNode(N.data, rule), first=self.G.FIRST(N.data))
+        elif N.type == '+':
+            assert type(N.data) is GrammarNode
+            return self.newNode(K_PLUS, self.compileNode(N.data, rule), first=self.G.FIRST(N.data))
+        assert False
+
+    def compile(self):
+        self.load_grammar()
+
+        for i, x in enumerate(self.G.productions):
+            self.rules[x[0]] = i
+            self.rule_refs.append(self.newNode(K_RULE, i, first=self.G.FIRST(x[0])))
+
+        self.rule_body = [self.compileNode(x[2], x[0]) for x in self.G.productions]
+        self.findPrecRules()
+        self.findInlineRules()
+        self.findCutRules()
+
+        self.items = []
+        for kind, arg in zip(self.kinds, self.args):
+            if kind == K_SEQ:
+                self.items.append(arg)
+            elif kind == K_RULE:
+                body = self.rule_body[arg]
+                if self.kinds[body] == K_SEQ:
+                    self.items.append(self.args[body])
+                else:
+                    self.items.append((body,))
+            else:
+                self.items.append(None)
+
+    def report(self, out=sys.stdout):
+        """
+        Prints the alternatives that need backtracking, and for which
+        terminals.
+        """
+        print("# %d nodes, %d rules, %d conflicts" % (len(self.kinds), len(self.rules), len(self.conflicts)), file=out)
+        for rule, terms, alts in self.conflicts:
+            print("#", file=out)
+            print("# " + rule + ": " + alts, file=out)
+            print("#   on: " + ' '.join(terms), file=out)
+
+    def run(self):
+        self.compile()
+
+        print("""#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+# Autogenerated file. Do not edit!
+""")
+        self.report()
+        print()
+        print("KEYWORDS=" + pprint.pformat(self.keywords))
+        print("RULES=" + pprint.pformat(self.rules))
+        print("RULE_NAMES=" + pprint.pformat([x[0] for x in self.G.productions]))
+        print("RULE_BODY=" + pprint.pformat(self.rule_body))
+        print("RULE_REFS=" + pprint.pformat(self.rule_refs))
+        print("CUT_RULES=" + pprint.pformat(sorted([self.rules[x] for x in self.cut_rules])))
+        print("INLINE_RULES=" + pprint.pformat(sorted([self.rules[x] for x in self.inline_rules])))
+        print("KIND=" + pprint.pformat(self.kinds))
+        print("ENTRY=" + pprint.pformat(self.entry))
+        print("ARG=" + pprint.pformat(self.args))
+        print("ITEMS=" + pprint.pformat(self.items))
+        print("LABEL=" + pprint.pformat(self.labels))
+        print("DISPATCH=" + pprint.pformat(self.dispatch))
+        print("DEFAULT=" + pprint.pformat(self.default))
+
+def main():
+    pg = llparser_gen()
+    pg.run()
+
+if __name__ == '__main__':
+    main()
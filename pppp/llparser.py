@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Table driven parser. Runs the tables of lltables.py, generated by llgen.py,
+with a single loop and an explicit stack. The alternatives of a choice are
+picked from a table by the class of the next token; only when more than one
+alternative can start with it they are tried one after the other. It builds
+the same tree as the recursive descent parser of parser.py, and raises the
+same ParseError at the same commit points.
+
+The outcome of each rule is memoized by position, as in the packrat mode of
+parser.py, so no rule is tried twice at the same token and the backtracking
+takes linear time. The memo is emptied after each statement at the top
+level, since no parse goes back past it.
+
+The parse does not recurse in Python, so the nesting depth of the source is
+only bounded by memory, not by sys.getrecursionlimit().
+"""
+
+from . import parserbase
+from . import lltables
+from .llgen import K_TERM, K_RULE, K_SEQ, K_ALT, K_OPT, K_STAR, K_PLUS
+from .parserbase import astnode
+
+# Terminal nodes of the punctuation dropped with punctuation=False.
+PUNCTUATION_TERMS = frozenset([nid for nid, kind in enumerate(lltables.KIND)
+    if kind == K_TERM and lltables.LABEL[nid][1:-1] in parserbase.PUNCTUATION])
+
+# K_RULE nodes of the rules that commit after their first item, see
+# parsergen.findCutRules.
+CUT_NODES = frozenset([lltables.RULE_REFS[r] for r in lltables.CUT_RULES])
+
+# K_RULE nodes of the rules parser.py inlines in the one rule using them.
+# Like a sequence, their failures are the failures of that rule.
+INLINE_NODES = frozenset([lltables.RULE_REFS[r] for r in lltables.INLINE_RULES])
+
+# K_RULE node of the commit rule, after which the memo is emptied.
+COMMIT_NODE = lltables.RULE_REFS[lltables.RULES[parserbase.parser_base.commit_rule[6:]]]
+
+class parser(parserbase.parser_base):
+    keywords = lltables.KEYWORDS
+
+    def __init__(self, toks, compact=False, punctuation=True, arena=False):
+        parserbase.parser_base.__init__(self, toks, False, compact, punctuation, arena)
+        if self.arena is not None:
+            # The memo may hold the records of backtracked subtrees.
+            self.arena.trimming = False
+
+    def __getattr__(self, name):
+        # parse_<rule> methods, like the recursive descent parser.
+        if name.startswith('parse_') and name[6:] in lltables.RULES:
+            return lambda: self.parse(name[6:])
+        raise AttributeError(name)
+
+    def parse(self, rule):
+        """
+        Parses the rule at the current position. Returns its node, or None
+        if it does not match. Raises ParseError past a commit point.
+        """
+        KIND = lltables.KIND
+        ARG = lltables.ARG
+        ITEMS = lltables.ITEMS
+        LABEL = lltables.LABEL
+        DISPATCH = lltables.DISPATCH
+        DEFAULT = lltables.DEFAULT
+        ENTRY = lltables.ENTRY
+        RULE_NAMES = lltables.RULE_NAMES
+
+        toks = self.toks
+        tclasses = self.tclasses
+        pos = self.pos
+        compact = self.compact
+        arena = self.arena
+        if self.drop_punctuation:
+            dropped = PUNCTUATION_TERMS
+        else:
+            dropped = frozenset()
+
+        # (nodes, position after) of each K_RULE node that was run, by
+        # pos * NODES + node ID, or (None, errpos) if it did not match.
+        NODES = len(KIND)
+        memo = {}
+        reused = False
+        commits = 0 # COMMIT_NODE frames on the stack
+
+        # Each frame is [node ID, position at entry, child nodes, index].
+        # A node either calls a child (call is True and nid is the child)
+        # or returns ret to the frame on top: a list of nodes, or None if
+        # it did not match. A node that does not match leaves pos where it
+        # was at entry, and errpos where parser.py would fail it: a cut
+        # raises its ParseError there.
+        #
+        # K_RULE and K_SEQ frames run their ITEMS in the "step" loop below.
+        # Terminals, and K_OPT or K_STAR items that can not start with the
+        # next token, are done there without calling them.
+        stack = []
+        nid = lltables.RULE_REFS[lltables.RULES[rule]]
+        call = True
+        step = False
+        ret = None
+        errpos = pos
+
+        while True:
+            if call:
+                kind = KIND[nid]
+                if kind == K_TERM:
+                    if tclasses[pos] == ARG[nid]:
+                        if nid in dropped:
+                            ret = []
+                        elif arena is not None:
+                            ret = [arena.add_leaf(LABEL[nid], pos)]
+                        else:
+                            ret = [astnode(LABEL[nid], toks[pos])]
+                        pos = pos + 1
+                    else:
+                        ret = None
+                        errpos = pos
+                    call = False
+                elif kind == K_ALT:
+                    cands = DISPATCH[nid].get(tclasses[pos], DEFAULT[nid])
+                    if len(cands) == 1:
+                        # Predicted, nothing to try after it.
+                        nid = cands[0]
+                    elif len(cands) == 0:
+                        ret = None
+                        errpos = pos
+                        call = False
+                    else:
+                        stack.append([nid, pos, cands, 0])
+                        nid = cands[0]
+                    continue
+                elif ENTRY[nid] is not None and not ENTRY[nid] >> tclasses[pos] & 1:
+                    # It can not start with the next token.
+                    if kind == K_OPT or kind == K_STAR:
+                        ret = []
+                    else:
+                        ret = None
+                        errpos = pos
+                    call = False
+                elif kind == K_RULE and pos * NODES + nid in memo:
+                    ret, p = memo[pos * NODES + nid]
+                    if ret is None:
+                        errpos = p
+                    else:
+                        pos = p
+                        reused = True
+                    call = False
+                elif kind == K_RULE or kind == K_SEQ:
+                    fr = [nid, pos, [], 0]
+                    stack.append(fr)
+                    if nid == COMMIT_NODE:
+                        commits = commits + 1
+                    call = False
+                    step = True
+                else:
+                    # K_OPT, K_STAR, K_PLUS
+                    stack.append([nid, pos, [], 0])
+                    nid = ARG[nid]
+                    continue
+
+            if not step:
+                if len(stack) == 0:
+                    break
+
+                fr = stack[-1]
+                kind = KIND[fr[0]]
+                if kind == K_RULE or kind == K_SEQ:
+                    if ret is None:
+                        if fr[0] in CUT_NODES and fr[3] > 0:
+                            raise self.syntax_error(RULE_NAMES[ARG[fr[0]]], errpos)
+                        pos = fr[1]
+                        stack.pop(-1)
+                        if kind == K_RULE:
+                            if fr[0] not in INLINE_NODES:
+                                errpos = pos
+                            memo[pos * NODES + fr[0]] = (None, errpos)
+                            if fr[0] == COMMIT_NODE:
+                                commits = commits - 1
+                    else:
+                        fr[2].extend(ret)
+                        fr[3] = fr[3] + 1
+                        step = True
+                elif kind == K_ALT:
+                    if ret is None and fr[3] + 1 < len(fr[2]):
+                        fr[3] = fr[3] + 1
+                        nid = fr[2][fr[3]]
+                        call = True
+                    else:
+                        stack.pop(-1)
+                        errpos = fr[1]
+                elif kind == K_OPT:
+                    stack.pop(-1)
+                    if ret is None:
+                        ret = []
+                else:
+                    # K_STAR, K_PLUS
+                    if ret is None:
+                        stack.pop(-1)
+                        if kind == K_PLUS and fr[3] == 0:
+                            ret = None
+                            errpos = fr[1]
+                        else:
+                            ret = fr[2]
+                    else:
+                        fr[2].extend(ret)
+                        fr[1] = pos
+                        fr[3] = fr[3] + 1
+                        m = ENTRY[fr[0]]
+                        if m is not None and not m >> tclasses[pos] & 1:
+                            ret = fr[2]
+                            stack.pop(-1)
+                        else:
+                            nid = ARG[fr[0]]
+                            call = True
+
+            if step:
+                # Run the items of the K_RULE or K_SEQ frame fr.
+                step = False
+                items = ITEMS[fr[0]]
+                childs = fr[2]
+                i = fr[3]
+                while i < len(items):
+                    it = items[i]
+                    kind = KIND[it]
+                    if kind == K_TERM:
+                        if tclasses[pos] != ARG[it]:
+                            break
+                        if it in dropped:
+                            pass
+                        elif arena is not None:
+                            childs.append(arena.add_leaf(LABEL[it], pos))
+                        else:
+                            childs.append(astnode(LABEL[it], toks[pos]))
+                        pos = pos + 1
+                    elif (kind == K_OPT or kind == K_STAR) and ENTRY[it] is not None \
+                        and not ENTRY[it] >> tclasses[pos] & 1:
+                        pass
+                    else:
+                        break
+                    i = i + 1
+
+                if i == len(items):
+                    stack.pop(-1)
+                    if KIND[fr[0]] == K_RULE and compact and len(childs) == 1:
+                        ret = childs
+                    elif KIND[fr[0]] == K_RULE and arena is not None:
+                        ret = [arena.add_node(RULE_NAMES[ARG[fr[0]]], childs, fr[1], pos)]
+                    elif KIND[fr[0]] == K_RULE:
+                        node = astnode(RULE_NAMES[ARG[fr[0]]])
+                        for x in childs:
+                            node.addchild(x)
+                        ret = [node]
+                    else:
+                        ret = childs
+                    if KIND[fr[0]] == K_RULE:
+                        memo[fr[1] * NODES + fr[0]] = (ret, pos)
+                        if fr[0] == COMMIT_NODE:
+                            commits = commits - 1
+                            if commits == 0:
+                                memo = {}
+                elif KIND[items[i]] == K_TERM:
+                    if fr[0] in CUT_NODES and i > 0:
+                        raise self.syntax_error(RULE_NAMES[ARG[fr[0]]], pos)
+                    errpos = pos
+                    pos = fr[1]
+                    stack.pop(-1)
+                    ret = None
+                    if KIND[fr[0]] == K_RULE:
+                        if fr[0] not in INLINE_NODES:
+                            errpos = pos
+                        memo[pos * NODES + fr[0]] = (None, errpos)
+                        if fr[0] == COMMIT_NODE:
+                            commits = commits - 1
+                else:
+                    fr[3] = i
+                    nid = items[i]
+                    call = True
+
+        self.pos = pos
+        if ret is None:
+            return None
+        if reused:
+            # A memoized node may have been added last to a parent that
+            # was then discarded.
+            if arena is not None:
+                arena.fix_parents(ret[0])
+            else:
+                parserbase.fix_parents(ret[0])
+        return ret[0]
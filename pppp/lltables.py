@@ -0,0 +1,4399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+# Autogenerated file. Do not edit!
+
+# 492 nodes, 82 rules, 10 conflicts
+#
+# expr_stmt: augassign yield_expr | testlist | ('=' yield_expr | testlist_star_expr)*
+#   on: '%=' '&=' '**=' '*=' '+=' '-=' '//=' '/=' '<<=' '>>=' '^=' '|='
+#
+# import_from: ('.' | '...')* dotted_name | ('.' | '...')*
+#   on: NAME '.' '...'
+#
+# try_stmt: (except_clause ':' suite)* ['else' ':' suite] ['finally' ':' suite] | 'finally' ':' suite
+#   on: 'finally'
+#
+# comp_op: '<' | '>' | '==' | '>=' | '<=' | '<>' | '!=' | 'in' | 'not' 'in' | 'is' | 'is' 'not'
+#   on: 'is'
+#
+# testlist_comp: comp_for | (',' test | star_expr)* [',']
+#   on: 'for'
+#
+# subscript: test | [test] ':' [test] [sliceop]
+#   on: NAME NUMBER STRING '(' '+' '-' '...' 'False' 'None' 'True' '[' 'lambda' 'not' '{' '~'
+#
+# dictorsetmaker: comp_for | (',' test ':' test)* [',']
+#   on: 'for'
+#
+# dictorsetmaker: comp_for | (',' test)* [',']
+#   on: 'for'
+#
+# dictorsetmaker: test ':' test comp_for | (',' test ':' test)* [','] | test comp_for | (',' test)* [',']
+#   on: NAME NUMBER STRING '(' '+' '-' '...' 'False' 'None' 'True' '[' 'lambda' 'not' '{' '~'
+#
+# argument: test [comp_for] | test '=' test
+#   on: NAME NUMBER STRING '(' '+' '-' '...' 'False' 'None' 'True' '[' 'lambda' 'not' '{' '~'
+
+KEYWORDS={'!=': 54,
+ '%': 55,
+ '%=': 56,
+ '&': 57,
+ '&=': 58,
+ '(': 59,
+ ')': 60,
+ '*': 61,
+ '**': 62,
+ '**=': 63,
+ '*=': 64,
+ '+': 65,
+ '+=': 66,
+ ',': 67,
+ '-': 68,
+ '-=': 69,
+ '->': 70,
+ '.': 71,
+ '...': 72,
+ '/': 73,
+ '//': 74,
+ '//=': 75,
+ '/=': 76,
+ ':': 77,
+ ';': 78,
+ '<': 79,
+ '<<': 80,
+ '<<=': 81,
+ '<=': 82,
+ '<>': 83,
+ '=': 84,
+ '==': 85,
+ '>': 86,
+ '>=': 87,
+ '>>': 88,
+ '>>=': 89,
+ '@': 90,
+ 'False': 91,
+ 'None': 92,
+ 'True': 93,
+ '[': 94,
+ ']': 95,
+ '^': 96,
+ '^=': 97,
+ 'and': 98,
+ 'as': 99,
+ 'assert': 100,
+ 'break': 101,
+ 'class': 102,
+ 'continue': 103,
+ 'def': 104,
+ 'del': 105,
+ 'elif': 106,
+ 'else': 107,
+ 'except': 108,
+ 'finally': 109,
+ 'for': 110,
+ 'from': 111,
+ 'global': 112,
+ 'if': 113,
+ 'import': 114,
+ 'in': 115,
+ 'is': 116,
+ 'lambda': 117,
+ 'nonlocal': 118,
+ 'not': 119,
+ 'or': 120,
+ 'pass': 121,
+ 'raise': 122,
+ 'return': 123,
+ 'try': 124,
+ 'while': 125,
+ 'with': 126,
+ 'yield': 127,
+ '{': 128,
+ '|': 129,
+ '|=': 130,
+ '}': 131,
+ '~': 132}
+RULES={'and_expr': 58,
+ 'and_test': 51,
+ 'arglist': 74,
+ 'argument': 75,
+ 'arith_expr': 60,
+ 'assert_stmt': 36,
+ 'atom': 64,
+ 'augassign': 17,
+ 'break_stmt': 21,
+ 'classdef': 73,
+ 'comp_for': 77,
+ 'comp_if': 78,
+ 'comp_iter': 76,
+ 'comp_op': 54,
+ 'comparison': 53,
+ 'compound_stmt': 37,
+ 'continue_stmt': 22,
+ 'decorated': 5,
+ 'decorator': 3,
+ 'decorators': 4,
+ 'del_stmt': 18,
+ 'dictorsetmaker': 72,
+ 'dotted_as_name': 30,
+ 'dotted_as_names': 32,
+ 'dotted_name': 33,
+ 'encoding_decl': 79,
+ 'eval_input': 2,
+ 'except_clause': 44,
+ 'expr': 56,
+ 'expr_stmt': 15,
+ 'exprlist': 70,
+ 'factor': 62,
+ 'file_input': 1,
+ 'flow_stmt': 20,
+ 'for_stmt': 40,
+ 'funcdef': 6,
+ 'global_stmt': 34,
+ 'if_stmt': 38,
+ 'import_as_name': 29,
+ 'import_as_names': 31,
+ 'import_from': 28,
+ 'import_name': 27,
+ 'import_stmt': 26,
+ 'lambdef': 48,
+ 'lambdef_nocond': 49,
+ 'nonlocal_stmt': 35,
+ 'not_test': 52,
+ 'or_test': 50,
+ 'parameters': 7,
+ 'pass_stmt': 19,
+ 'power': 63,
+ 'raise_stmt': 25,
+ 'return_stmt': 23,
+ 'shift_expr': 59,
+ 'simple_stmt': 13,
+ 'single_input': 0,
+ 'sliceop': 69,
+ 'small_stmt': 14,
+ 'star_expr': 55,
+ 'stmt': 12,
+ 'subscript': 68,
+ 'subscriptlist': 67,
+ 'suite': 45,
+ 'term': 61,
+ 'test': 46,
+ 'test_nocond': 47,
+ 'testlist': 71,
+ 'testlist_comp': 65,
+ 'testlist_star_expr': 16,
+ 'tfpdef': 9,
+ 'trailer': 66,
+ 'try_stmt': 41,
+ 'typedargslist': 8,
+ 'varargslist': 10,
+ 'vfpdef': 11,
+ 'while_stmt': 39,
+ 'with_item': 43,
+ 'with_stmt': 42,
+ 'xor_expr': 57,
+ 'yield_arg': 81,
+ 'yield_expr': 80,
+ 'yield_stmt': 24}
+RULE_NAMES=['single_input',
+ 'file_input',
+ 'eval_input',
+ 'decorator',
+ 'decorators',
+ 'decorated',
+ 'funcdef',
+ 'parameters',
+ 'typedargslist',
+ 'tfpdef',
+ 'varargslist',
+ 'vfpdef',
+ 'stmt',
+ 'simple_stmt',
+ 'small_stmt',
+ 'expr_stmt',
+ 'testlist_star_expr',
+ 'augassign',
+ 'del_stmt',
+ 'pass_stmt',
+ 'flow_stmt',
+ 'break_stmt',
+ 'continue_stmt',
+ 'return_stmt',
+ 'yield_stmt',
+ 'raise_stmt',
+ 'import_stmt',
+ 'import_name',
+ 'import_from',
+ 'import_as_name',
+ 'dotted_as_name',
+ 'import_as_names',
+ 'dotted_as_names',
+ 'dotted_name',
+ 'global_stmt',
+ 'nonlocal_stmt',
+ 'assert_stmt',
+ 'compound_stmt',
+ 'if_stmt',
+ 'while_stmt',
+ 'for_stmt',
+ 'try_stmt',
+ 'with_stmt',
+ 'with_item',
+ 'except_clause',
+ 'suite',
+ 'test',
+ 'test_nocond',
+ 'lambdef',
+ 'lambdef_nocond',
+ 'or_test',
+ 'and_test',
+ 'not_test',
+ 'comparison',
+ 'comp_op',
+ 'star_expr',
+ 'expr',
+ 'xor_expr',
+ 'and_expr',
+ 'shift_expr',
+ 'arith_expr',
+ 'term',
+ 'factor',
+ 'power',
+ 'atom',
+ 'testlist_comp',
+ 'trailer',
+ 'subscriptlist',
+ 'subscript',
+ 'sliceop',
+ 'exprlist',
+ 'testlist',
+ 'dictorsetmaker',
+ 'classdef',
+ 'arglist',
+ 'argument',
+ 'comp_iter',
+ 'comp_for',
+ 'comp_if',
+ 'encoding_decl',
+ 'yield_expr',
+ 'yield_arg']
+RULE_BODY=[84,
+ 88,
+ 90,
+ 97,
+ 98,
+ 100,
+ 107,
+ 109,
+ 143,
+ 146,
+ 176,
+ 102,
+ 177,
+ 182,
+ 183,
+ 190,
+ 196,
+ 209,
+ 211,
+ 212,
+ 213,
+ 214,
+ 215,
+ 218,
+ 80,
+ 225,
+ 226,
+ 228,
+ 240,
+ 244,
+ 247,
+ 251,
+ 254,
+ 257,
+ 261,
+ 265,
+ 269,
+ 270,
+ 278,
+ 282,
+ 287,
+ 300,
+ 304,
+ 307,
+ 313,
+ 318,
+ 322,
+ 323,
+ 326,
+ 328,
+ 332,
+ 336,
+ 339,
+ 342,
+ 353,
+ 354,
+ 358,
+ 362,
+ 366,
+ 372,
+ 378,
+ 385,
+ 389,
+ 393,
+ 411,
+ 419,
+ 424,
+ 428,
+ 433,
+ 435,
+ 441,
+ 445,
+ 460,
+ 465,
+ 477,
+ 481,
+ 482,
+ 484,
+ 486,
+ 102,
+ 489,
+ 491]
+RULE_REFS=[0,
+ 1,
+ 2,
+ 3,
+ 4,
+ 5,
+ 6,
+ 7,
+ 8,
+ 9,
+ 10,
+ 11,
+ 12,
+ 13,
+ 14,
+ 15,
+ 16,
+ 17,
+ 18,
+ 19,
+ 20,
+ 21,
+ 22,
+ 23,
+ 24,
+ 25,
+ 26,
+ 27,
+ 28,
+ 29,
+ 30,
+ 31,
+ 32,
+ 33,
+ 34,
+ 35,
+ 36,
+ 37,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 49,
+ 50,
+ 51,
+ 52,
+ 53,
+ 54,
+ 55,
+ 56,
+ 57,
+ 58,
+ 59,
+ 60,
+ 61,
+ 62,
+ 63,
+ 64,
+ 65,
+ 66,
+ 67,
+ 68,
+ 69,
+ 70,
+ 71,
+ 72,
+ 73,
+ 74,
+ 75,
+ 76,
+ 77,
+ 78,
+ 79,
+ 80,
+ 81]
+CUT_RULES=[3, 6, 18, 23, 25, 34, 35, 36, 39, 41, 42, 44, 73, 80]
+INLINE_RULES=[3,
+ 4,
+ 5,
+ 7,
+ 8,
+ 15,
+ 17,
+ 18,
+ 19,
+ 20,
+ 21,
+ 22,
+ 23,
+ 24,
+ 25,
+ 26,
+ 27,
+ 28,
+ 32,
+ 34,
+ 35,
+ 36,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 44,
+ 48,
+ 49,
+ 54,
+ 63,
+ 64,
+ 66,
+ 67,
+ 69,
+ 72,
+ 78,
+ 81]
+KIND=[1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 1,
+ 0,
+ 2,
+ 3,
+ 3,
+ 5,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 0,
+ 4,
+ 0,
+ 2,
+ 4,
+ 2,
+ 6,
+ 3,
+ 2,
+ 0,
+ 0,
+ 0,
+ 2,
+ 4,
+ 0,
+ 2,
+ 4,
+ 2,
+ 0,
+ 4,
+ 0,
+ 0,
+ 2,
+ 4,
+ 2,
+ 5,
+ 0,
+ 2,
+ 4,
+ 2,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 5,
+ 4,
+ 2,
+ 4,
+ 2,
+ 5,
+ 2,
+ 4,
+ 2,
+ 2,
+ 3,
+ 4,
+ 2,
+ 4,
+ 2,
+ 2,
+ 3,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 5,
+ 2,
+ 4,
+ 2,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 5,
+ 4,
+ 2,
+ 4,
+ 2,
+ 5,
+ 2,
+ 4,
+ 2,
+ 2,
+ 3,
+ 4,
+ 2,
+ 4,
+ 2,
+ 2,
+ 3,
+ 3,
+ 0,
+ 2,
+ 5,
+ 4,
+ 2,
+ 3,
+ 3,
+ 2,
+ 3,
+ 2,
+ 5,
+ 3,
+ 2,
+ 3,
+ 3,
+ 2,
+ 5,
+ 4,
+ 2,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 3,
+ 0,
+ 2,
+ 0,
+ 3,
+ 0,
+ 0,
+ 0,
+ 4,
+ 2,
+ 0,
+ 0,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 3,
+ 0,
+ 2,
+ 0,
+ 0,
+ 3,
+ 5,
+ 2,
+ 3,
+ 5,
+ 3,
+ 2,
+ 3,
+ 2,
+ 2,
+ 0,
+ 2,
+ 4,
+ 2,
+ 2,
+ 4,
+ 2,
+ 2,
+ 5,
+ 4,
+ 2,
+ 2,
+ 5,
+ 2,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 4,
+ 2,
+ 3,
+ 0,
+ 0,
+ 2,
+ 5,
+ 0,
+ 2,
+ 4,
+ 2,
+ 0,
+ 2,
+ 4,
+ 2,
+ 0,
+ 0,
+ 2,
+ 4,
+ 2,
+ 0,
+ 0,
+ 2,
+ 2,
+ 5,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 3,
+ 2,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 2,
+ 4,
+ 2,
+ 0,
+ 2,
+ 4,
+ 2,
+ 4,
+ 2,
+ 0,
+ 6,
+ 0,
+ 2,
+ 3,
+ 2,
+ 4,
+ 2,
+ 3,
+ 3,
+ 0,
+ 4,
+ 2,
+ 4,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 3,
+ 2,
+ 5,
+ 2,
+ 2,
+ 0,
+ 2,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 0,
+ 3,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 2,
+ 5,
+ 2,
+ 0,
+ 0,
+ 3,
+ 2,
+ 5,
+ 2,
+ 0,
+ 0,
+ 3,
+ 2,
+ 5,
+ 2,
+ 0,
+ 0,
+ 0,
+ 3,
+ 2,
+ 5,
+ 2,
+ 0,
+ 3,
+ 2,
+ 3,
+ 5,
+ 2,
+ 4,
+ 2,
+ 3,
+ 4,
+ 2,
+ 0,
+ 4,
+ 0,
+ 2,
+ 0,
+ 4,
+ 0,
+ 2,
+ 0,
+ 0,
+ 6,
+ 0,
+ 0,
+ 0,
+ 3,
+ 3,
+ 3,
+ 2,
+ 5,
+ 4,
+ 2,
+ 3,
+ 2,
+ 4,
+ 2,
+ 2,
+ 2,
+ 3,
+ 2,
+ 5,
+ 4,
+ 2,
+ 4,
+ 4,
+ 4,
+ 2,
+ 3,
+ 4,
+ 2,
+ 3,
+ 3,
+ 2,
+ 5,
+ 4,
+ 2,
+ 2,
+ 5,
+ 4,
+ 2,
+ 2,
+ 5,
+ 4,
+ 2,
+ 3,
+ 2,
+ 2,
+ 2,
+ 5,
+ 4,
+ 2,
+ 3,
+ 2,
+ 2,
+ 3,
+ 0,
+ 4,
+ 2,
+ 4,
+ 2,
+ 2,
+ 5,
+ 2,
+ 5,
+ 2,
+ 4,
+ 2,
+ 2,
+ 4,
+ 2,
+ 3,
+ 2,
+ 2,
+ 4,
+ 2,
+ 3,
+ 3,
+ 4,
+ 2,
+ 4,
+ 2,
+ 0,
+ 4,
+ 2,
+ 2,
+ 3]
+ENTRY=[6123627543282651917551436524947672924190,
+ 6123627543282651917551436524947672924191,
+ 5785631005190457657531478950948429103118,
+ 1237940039285380274899124224,
+ 1237940039285380274899124224,
+ 1237940039285380274899124224,
+ 20282409603651670423947251286016,
+ 576460752303423488,
+ 6917529027641081858,
+ 2,
+ 6917529027641081858,
+ 2,
+ 6123627543282651917551436524947672924174,
+ 5974742299732559691820172530370570354702,
+ 5974742299732559691820172530370570354702,
+ 5785631005190457657533784793957642797070,
+ 5785631005190457657533784793957642797070,
+ 1361129467842831680782217803915742674944,
+ 40564819207303340847894502572032,
+ 2658455991569831745807614120560689152,
+ 186091932086394224488827003406280294400,
+ 2535301200456458802993406410752,
+ 10141204801825835211973625643008,
+ 10633823966279326983230456482242756608,
+ 170141183460469231731687303715884105728,
+ 5316911983139663491615228241121378304,
+ 23365335863406724328387233481490432,
+ 20769187434139310514121985316880384,
+ 2596148429267413814265248164610048,
+ 2,
+ 2,
+ 2,
+ 2,
+ 2,
+ 5192296858534827628530496329220096,
+ 332306998946228968225951765070086144,
+ 1267650600228229401496703205376,
+ 148885243550092225731263994577102569472,
+ 10384593717069655257060992658440192,
+ 42535295865117307932921825928971026432,
+ 1298074214633706907132624082305024,
+ 21267647932558653966460912964485513216,
+ 85070591730234615865843651857942052864,
+ 5785631005190457657531478950948429103118,
+ 324518553658426726783156020576256,
+ 5974742299732559691820172530370570354718,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 166153499473114484112975882535043072,
+ 166153499473114484112975882535043072,
+ 5785464851690984543047365975065894060046,
+ 5785464851690984543047365975065894060046,
+ 5785464851690984543047365975065894060046,
+ 5784800237693092085110914071535753887758,
+ 789229122783204755893509640368947200,
+ 2305843009213693952,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 5784800237693092085110914071535753887758,
+ 340282366958076669364878959300690575374,
+ 340282366958076669364878959300690575374,
+ 5785631005190457657533784793957642797070,
+ 19807042990325786585512017920,
+ 5785631005190457808647206402777075941390,
+ 5785631005190457808647206402777075941390,
+ 151115727451828646838272,
+ 5784800237693092085113219914544967581710,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 5070602400912917605986812821504,
+ 5785631005190457657538396479976070184974,
+ 5785631005190457657531478950948429103118,
+ 11682667931703362164193616740745216,
+ 1298074214633706907132624082305024,
+ 10384593717069655257060992658440192,
+ 2,
+ 170141183460469231731687303715884105728,
+ 5785633601338886924945293216196593713166,
+ None,
+ 148885243550092225731263994577102569472,
+ None,
+ None,
+ 6123627543282651917551436524947672924190,
+ None,
+ 6123627543282651917551436524947672924191,
+ 16,
+ 5785631005190457657531478950948429103118,
+ None,
+ None,
+ 5785631005190457657538396479976070184974,
+ None,
+ 576460752303423488,
+ 576460752303423488,
+ 1237940039285380274899124224,
+ 1237940039285380274899124224,
+ None,
+ 1237940039285380274899124224,
+ None,
+ None,
+ None,
+ 1180591620717411303424,
+ 1180591620717411303424,
+ None,
+ 20282409603651670423947251286016,
+ 6917529027641081858,
+ 576460752303423488,
+ None,
+ 2,
+ None,
+ None,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2305843009213693952,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2305843009213693952,
+ 4611686018427387904,
+ None,
+ 6917529027641081856,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 4611686018427387904,
+ None,
+ 151115727451828646838272,
+ 151115727451828646838272,
+ 2,
+ 2,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2305843009213693952,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2305843009213693952,
+ 4611686018427387904,
+ None,
+ 6917529027641081856,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 4611686018427387904,
+ None,
+ None,
+ None,
+ 302231454903657293676544,
+ 302231454903657293676544,
+ 302231454903657293676544,
+ 5974742299732559691820172530370570354702,
+ None,
+ None,
+ 1361129467842831680782217803915742674944,
+ None,
+ 19342813113834066795298816,
+ 19342813113834066795298816,
+ None,
+ 5785631005190457657533784793957642797070,
+ None,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 5785631005190457657533784793957642797070,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ 40564819207303340847894502572032,
+ None,
+ None,
+ None,
+ None,
+ None,
+ 5785631005190457657531478950948429103118,
+ 10633823966279326983230456482242756608,
+ None,
+ None,
+ 2596148429267413814265248164610048,
+ 2596148429267413814265248164610048,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 5316911983139663491615228241121378304,
+ None,
+ None,
+ 20769187434139310514121985316880384,
+ None,
+ None,
+ None,
+ 7083549724304467820544,
+ 7083549724304467820546,
+ None,
+ 7083549724304467820544,
+ None,
+ 576460752303423488,
+ None,
+ 2596148429267413814265248164610048,
+ 2596148429267413814265248164610048,
+ None,
+ 633825300114114700748351602688,
+ 633825300114114700748351602688,
+ 2,
+ 633825300114114700748351602688,
+ 633825300114114700748351602688,
+ 2,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2,
+ 2361183241434822606848,
+ 2361183241434822606848,
+ 2,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 5192296858534827628530496329220096,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 332306998946228968225951765070086144,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 1267650600228229401496703205376,
+ None,
+ None,
+ None,
+ 81129638414606681695789005144064,
+ 81129638414606681695789005144064,
+ None,
+ 162259276829213363391578010288128,
+ 162259276829213363391578010288128,
+ 10384593717069655257060992658440192,
+ None,
+ 162259276829213363391578010288128,
+ 162259276829213363391578010288128,
+ 42535295865117307932921825928971026432,
+ None,
+ None,
+ 162259276829213363391578010288128,
+ 162259276829213363391578010288128,
+ 1298074214633706907132624082305024,
+ None,
+ None,
+ 649037107316853453566312041152512,
+ 324518553658426726783156020576256,
+ 324518553658426726783156020576256,
+ 162259276829213363391578010288128,
+ 162259276829213363391578010288128,
+ 649037107316853453566312041152512,
+ 649037107316853453566312041152512,
+ None,
+ None,
+ 21267647932558653966460912964485513216,
+ 21267647932558653966460912964485513216,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 85070591730234615865843651857942052864,
+ 633825300114114700748351602688,
+ 633825300114114700748351602688,
+ 5785631005190457657531478950948429103118,
+ None,
+ 633825300114114700748351602688,
+ 633825300114114700748351602688,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 324518553658426726783156020576256,
+ None,
+ 6123627543282651917551436524947672924174,
+ None,
+ 16,
+ None,
+ 10384593717069655257060992658440192,
+ 10384593717069655257060992658440192,
+ 5785464851690984543047365975065894060046,
+ None,
+ None,
+ None,
+ 6917529027641081858,
+ 166153499473114484112975882535043072,
+ 6917529027641081858,
+ 166153499473114484112975882535043072,
+ None,
+ 1329227995784915872903807060280344576,
+ 1329227995784915872903807060280344576,
+ 5785464851690984543047365975065894060046,
+ None,
+ 316912650057057350374175801344,
+ 316912650057057350374175801344,
+ 5785464851690984543047365975065894060046,
+ None,
+ 664613997892457936451903530140172288,
+ None,
+ 789229122783204755893509640368947200,
+ 789229122783204755893509640368947200,
+ 5784800237693092085110914071535753887758,
+ 664613997892457936451903530140172288,
+ None,
+ 83076749736557242056487941267521536,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ 2305843009213693952,
+ None,
+ 680564733841876926926749214863536422912,
+ 680564733841876926926749214863536422912,
+ 5784800237693092085110914071535753887758,
+ None,
+ 79228162514264337593543950336,
+ 79228162514264337593543950336,
+ 5784800237693092085110914071535753887758,
+ None,
+ 144115188075855872,
+ 144115188075855872,
+ 5784800237693092085110914071535753887758,
+ None,
+ None,
+ None,
+ 310693935640959697899487232,
+ 310693935640959697899487232,
+ 5784800237693092085110914071535753887758,
+ None,
+ None,
+ None,
+ 332041393326771929088,
+ 332041393326771929088,
+ 5784800237693092085110914071535753887758,
+ None,
+ None,
+ None,
+ None,
+ 28336540769024103940096,
+ 28336540769024103940096,
+ 5784800237693092085110914071535753887758,
+ None,
+ None,
+ 5444517870735015415746035112235063312384,
+ None,
+ 19807042990325786585512017920,
+ 4611686018427387904,
+ 4611686018427387904,
+ 340282366958076669364878959300690575374,
+ None,
+ 5955772188650926889265472097673526902798,
+ 576460752303423488,
+ None,
+ 5785631005190457657533784793957642797070,
+ None,
+ 19807040628566084398385987584,
+ None,
+ 5785631005190457657531478950948429103118,
+ None,
+ 340282366920938463463374607431768211456,
+ None,
+ None,
+ 8,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ None,
+ None,
+ 5785631005190457657533784793957642797070,
+ 5785631005190457657538396479976070184974,
+ 576460752303423488,
+ 19807040628566084398385987584,
+ 2361183241434822606848,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 5785631005190457808647206402777075941390,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 151115727451828646838272,
+ 5785631005190457808647206402777075941390,
+ None,
+ 5785631005190457657531478950948429103118,
+ 151115727451828646838272,
+ None,
+ None,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 5784800237693092085113219914544967581710,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 5785631005190457657531478950948429103118,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ None,
+ None,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ None,
+ None,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ None,
+ None,
+ 5785631005190457657538396479976070184974,
+ 576460752303423488,
+ 576460752303423488,
+ 5070602400912917605986812821504,
+ 5785631005190457657531478950948429103118,
+ 5785631005190457657531478950948429103118,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 147573952589676412928,
+ 2305843009213693952,
+ 4611686018427387904,
+ 147573952589676412928,
+ 5785631005190457657531478950948429103118,
+ None,
+ 5785631005190457657538396479976070184974,
+ 5785631005190457657531478950948429103118,
+ 1298074214633706907132624082305024,
+ 5785631005190457657531478950948429103118,
+ None,
+ None,
+ 11682667931703362164193616740745216,
+ 1298074214633706907132624082305024,
+ 11682667931703362164193616740745216,
+ 10384593717069655257060992658440192,
+ None,
+ 5785633601338886924945293216196593713166,
+ 170141183460469231731687303715884105728,
+ 2596148429267413814265248164610048,
+ None]
+ARG=[0,
+ 1,
+ 2,
+ 3,
+ 4,
+ 5,
+ 6,
+ 7,
+ 8,
+ 9,
+ 10,
+ 11,
+ 12,
+ 13,
+ 14,
+ 15,
+ 16,
+ 17,
+ 18,
+ 19,
+ 20,
+ 21,
+ 22,
+ 23,
+ 24,
+ 25,
+ 26,
+ 27,
+ 28,
+ 29,
+ 30,
+ 31,
+ 32,
+ 33,
+ 34,
+ 35,
+ 36,
+ 37,
+ 38,
+ 39,
+ 40,
+ 41,
+ 42,
+ 43,
+ 44,
+ 45,
+ 46,
+ 47,
+ 48,
+ 49,
+ 50,
+ 51,
+ 52,
+ 53,
+ 54,
+ 55,
+ 56,
+ 57,
+ 58,
+ 59,
+ 60,
+ 61,
+ 62,
+ 63,
+ 64,
+ 65,
+ 66,
+ 67,
+ 68,
+ 69,
+ 70,
+ 71,
+ 72,
+ 73,
+ 74,
+ 75,
+ 76,
+ 77,
+ 78,
+ 79,
+ 80,
+ 81,
+ 4,
+ (37, 82),
+ None,
+ None,
+ 85,
+ 0,
+ (86, 87),
+ 82,
+ (71, 89, 87),
+ 90,
+ 59,
+ 74,
+ 60,
+ (92, 93, 94),
+ 95,
+ (91, 33, 96, 82),
+ 3,
+ None,
+ (4, 99),
+ 104,
+ 1,
+ 70,
+ (103, 46),
+ 104,
+ 77,
+ (101, 102, 7, 105, 106, 45),
+ 8,
+ (92, 108, 94),
+ 61,
+ 9,
+ 67,
+ 84,
+ (113, 46),
+ 114,
+ (112, 9, 115),
+ 116,
+ 62,
+ (112, 118, 9),
+ 119,
+ (110, 111, 117, 120),
+ (113, 46),
+ 122,
+ (113, 46),
+ 124,
+ (112, 9, 125),
+ 126,
+ 9,
+ (113, 46),
+ 129,
+ (112, 9, 130),
+ 131,
+ (112, 118, 9),
+ 133,
+ (110, 128, 132, 134),
+ (118, 9),
+ None,
+ 137,
+ (112, 138),
+ 139,
+ (9, 123, 127, 140),
+ (118, 9),
+ None,
+ (106, 46),
+ 144,
+ (102, 145),
+ 11,
+ (113, 46),
+ 148,
+ (112, 11, 149),
+ 150,
+ (112, 118, 11),
+ 152,
+ (110, 147, 151, 153),
+ (113, 46),
+ 155,
+ (113, 46),
+ 157,
+ (112, 11, 158),
+ 159,
+ 11,
+ (113, 46),
+ 162,
+ (112, 11, 163),
+ 164,
+ (112, 118, 11),
+ 166,
+ (110, 161, 165, 167),
+ (118, 11),
+ None,
+ 170,
+ (112, 171),
+ 172,
+ (11, 156, 160, 173),
+ (118, 11),
+ None,
+ None,
+ 78,
+ (178, 14),
+ 179,
+ 178,
+ (14, 180, 181, 82),
+ None,
+ None,
+ (17, 184),
+ None,
+ (113, 186),
+ 187,
+ None,
+ (16, 189),
+ None,
+ None,
+ (112, 192),
+ 193,
+ 112,
+ (191, 194, 195),
+ 66,
+ 69,
+ 64,
+ 76,
+ 56,
+ 58,
+ 130,
+ 97,
+ 81,
+ 89,
+ 63,
+ 75,
+ None,
+ 105,
+ (210, 70),
+ 121,
+ None,
+ 101,
+ 103,
+ 123,
+ 71,
+ (216, 217),
+ 122,
+ 111,
+ (220, 46),
+ 221,
+ (46, 222),
+ 223,
+ (219, 224),
+ None,
+ 114,
+ (227, 32),
+ 71,
+ 72,
+ None,
+ 231,
+ (232, 33),
+ None,
+ 234,
+ None,
+ (92, 31, 94),
+ None,
+ (220, 236, 227, 238),
+ (220, 236, 227, 238),
+ 99,
+ (241, 102),
+ 242,
+ (102, 243),
+ (241, 102),
+ 245,
+ (33, 246),
+ (112, 29),
+ 248,
+ 112,
+ (29, 249, 250),
+ (112, 30),
+ 252,
+ (30, 253),
+ (229, 102),
+ 255,
+ (102, 256),
+ 112,
+ (112, 102),
+ 259,
+ (258, 102, 260),
+ 118,
+ (112, 102),
+ 263,
+ (262, 102, 264),
+ 100,
+ (112, 46),
+ 267,
+ (266, 46, 268),
+ None,
+ 113,
+ 106,
+ (272, 46, 106, 45),
+ 273,
+ 107,
+ (275, 106, 45),
+ 276,
+ (271, 46, 106, 45, 274, 277),
+ 125,
+ (275, 106, 45),
+ 280,
+ (279, 46, 106, 45, 281),
+ 110,
+ 115,
+ (275, 106, 45),
+ 285,
+ (283, 70, 284, 71, 106, 45, 286),
+ 124,
+ 109,
+ (289, 106, 45),
+ (44, 106, 45),
+ 291,
+ (275, 106, 45),
+ 293,
+ (289, 106, 45),
+ 295,
+ (292, 294, 296),
+ None,
+ (288, 106, 45, 298),
+ (288, 106, 45, 298),
+ 126,
+ (112, 43),
+ 302,
+ (301, 43, 303, 106, 45),
+ (241, 56),
+ 305,
+ (46, 306),
+ 108,
+ (241, 102),
+ 309,
+ (46, 310),
+ 311,
+ (308, 312),
+ 5,
+ 12,
+ 6,
+ (82, 314, 315, 316),
+ None,
+ (271, 50, 275, 46),
+ 319,
+ (50, 320),
+ None,
+ None,
+ 117,
+ 10,
+ (324, 325, 106, 46),
+ 10,
+ (324, 327, 106, 47),
+ 120,
+ (329, 51),
+ 330,
+ (51, 331),
+ 98,
+ (333, 52),
+ 334,
+ (52, 335),
+ 119,
+ (337, 52),
+ None,
+ (54, 56),
+ 340,
+ (56, 341),
+ (337, 284),
+ 116,
+ (344, 337),
+ 79,
+ 86,
+ 85,
+ 87,
+ 82,
+ 83,
+ 54,
+ None,
+ (110, 56),
+ 129,
+ (355, 57),
+ 356,
+ (57, 357),
+ 96,
+ (359, 58),
+ 360,
+ (58, 361),
+ 57,
+ (363, 59),
+ 364,
+ (59, 365),
+ 80,
+ 88,
+ None,
+ (369, 60),
+ 370,
+ (60, 371),
+ 65,
+ 68,
+ None,
+ (375, 61),
+ 376,
+ (61, 377),
+ 73,
+ 55,
+ 74,
+ None,
+ (382, 62),
+ 383,
+ (62, 384),
+ 132,
+ None,
+ (387, 62),
+ None,
+ 66,
+ (118, 62),
+ 391,
+ (64, 390, 392),
+ None,
+ 394,
+ (92, 395, 94),
+ 94,
+ 65,
+ 95,
+ (397, 398, 399),
+ 128,
+ 72,
+ 131,
+ (401, 402, 403),
+ 2,
+ 3,
+ 406,
+ 92,
+ 93,
+ 91,
+ None,
+ None,
+ None,
+ (112, 413),
+ 414,
+ 112,
+ (415, 416),
+ None,
+ (412, 418),
+ 74,
+ (92, 420, 94),
+ (397, 67, 399),
+ (229, 102),
+ None,
+ (112, 68),
+ 425,
+ 112,
+ (68, 426, 427),
+ 46,
+ 46,
+ 69,
+ (429, 106, 430, 431),
+ None,
+ 46,
+ (106, 434),
+ None,
+ None,
+ (112, 437),
+ 438,
+ 112,
+ (436, 439, 440),
+ (112, 46),
+ 442,
+ 112,
+ (46, 443, 444),
+ (112, 46, 106, 46),
+ 446,
+ 112,
+ (447, 448),
+ None,
+ (46, 106, 46, 450),
+ (46, 106, 46, 450),
+ (112, 46),
+ 453,
+ 112,
+ (454, 455),
+ None,
+ (46, 457),
+ (46, 457),
+ None,
+ 102,
+ 74,
+ (92, 462, 94),
+ 463,
+ (461, 102, 464, 106, 45),
+ (75, 112),
+ 466,
+ (112, 75),
+ 468,
+ (112, 118, 46),
+ 470,
+ (110, 46, 469, 471),
+ (118, 46),
+ 112,
+ (75, 474),
+ None,
+ (467, 476),
+ (46, 113, 46),
+ 77,
+ (46, 479),
+ None,
+ None,
+ 76,
+ (283, 70, 284, 50, 483),
+ 76,
+ (271, 47, 485),
+ 127,
+ 81,
+ (487, 488),
+ (220, 46),
+ None]
+ITEMS=[(84,),
+ (86, 87),
+ (71, 89, 87),
+ (91, 33, 96, 82),
+ (98,),
+ (4, 99),
+ (101, 102, 7, 105, 106, 45),
+ (92, 108, 94),
+ (143,),
+ (102, 145),
+ (176,),
+ (102,),
+ (177,),
+ (14, 180, 181, 82),
+ (183,),
+ (16, 189),
+ (191, 194, 195),
+ (209,),
+ (210, 70),
+ (212,),
+ (213,),
+ (214,),
+ (215,),
+ (216, 217),
+ (80,),
+ (219, 224),
+ (226,),
+ (227, 32),
+ (220, 236, 227, 238),
+ (102, 243),
+ (33, 246),
+ (29, 249, 250),
+ (30, 253),
+ (102, 256),
+ (258, 102, 260),
+ (262, 102, 264),
+ (266, 46, 268),
+ (270,),
+ (271, 46, 106, 45, 274, 277),
+ (279, 46, 106, 45, 281),
+ (283, 70, 284, 71, 106, 45, 286),
+ (288, 106, 45, 298),
+ (301, 43, 303, 106, 45),
+ (46, 306),
+ (308, 312),
+ (318,),
+ (322,),
+ (323,),
+ (324, 325, 106, 46),
+ (324, 327, 106, 47),
+ (51, 331),
+ (52, 335),
+ (339,),
+ (56, 341),
+ (353,),
+ (110, 56),
+ (57, 357),
+ (58, 361),
+ (59, 365),
+ (60, 371),
+ (61, 377),
+ (62, 384),
+ (389,),
+ (64, 390, 392),
+ (411,),
+ (412, 418),
+ (424,),
+ (68, 426, 427),
+ (433,),
+ (106, 434),
+ (436, 439, 440),
+ (46, 443, 444),
+ (460,),
+ (461, 102, 464, 106, 45),
+ (467, 476),
+ (481,),
+ (482,),
+ (283, 70, 284, 50, 483),
+ (271, 47, 485),
+ (102,),
+ (487, 488),
+ (491,),
+ None,
+ (37, 82),
+ None,
+ None,
+ None,
+ None,
+ (86, 87),
+ None,
+ (71, 89, 87),
+ None,
+ None,
+ None,
+ None,
+ (92, 93, 94),
+ None,
+ (91, 33, 96, 82),
+ None,
+ None,
+ (4, 99),
+ None,
+ None,
+ None,
+ (103, 46),
+ None,
+ None,
+ (101, 102, 7, 105, 106, 45),
+ None,
+ (92, 108, 94),
+ None,
+ None,
+ None,
+ None,
+ (113, 46),
+ None,
+ (112, 9, 115),
+ None,
+ None,
+ (112, 118, 9),
+ None,
+ (110, 111, 117, 120),
+ (113, 46),
+ None,
+ (113, 46),
+ None,
+ (112, 9, 125),
+ None,
+ None,
+ (113, 46),
+ None,
+ (112, 9, 130),
+ None,
+ (112, 118, 9),
+ None,
+ (110, 128, 132, 134),
+ (118, 9),
+ None,
+ None,
+ (112, 138),
+ None,
+ (9, 123, 127, 140),
+ (118, 9),
+ None,
+ (106, 46),
+ None,
+ (102, 145),
+ None,
+ (113, 46),
+ None,
+ (112, 11, 149),
+ None,
+ (112, 118, 11),
+ None,
+ (110, 147, 151, 153),
+ (113, 46),
+ None,
+ (113, 46),
+ None,
+ (112, 11, 158),
+ None,
+ None,
+ (113, 46),
+ None,
+ (112, 11, 163),
+ None,
+ (112, 118, 11),
+ None,
+ (110, 161, 165, 167),
+ (118, 11),
+ None,
+ None,
+ (112, 171),
+ None,
+ (11, 156, 160, 173),
+ (118, 11),
+ None,
+ None,
+ None,
+ (178, 14),
+ None,
+ None,
+ (14, 180, 181, 82),
+ None,
+ None,
+ (17, 184),
+ None,
+ (113, 186),
+ None,
+ None,
+ (16, 189),
+ None,
+ None,
+ (112, 192),
+ None,
+ None,
+ (191, 194, 195),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (210, 70),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (216, 217),
+ None,
+ None,
+ (220, 46),
+ None,
+ (46, 222),
+ None,
+ (219, 224),
+ None,
+ None,
+ (227, 32),
+ None,
+ None,
+ None,
+ None,
+ (232, 33),
+ None,
+ None,
+ None,
+ (92, 31, 94),
+ None,
+ (220, 236, 227, 238),
+ (220, 236, 227, 238),
+ None,
+ (241, 102),
+ None,
+ (102, 243),
+ (241, 102),
+ None,
+ (33, 246),
+ (112, 29),
+ None,
+ None,
+ (29, 249, 250),
+ (112, 30),
+ None,
+ (30, 253),
+ (229, 102),
+ None,
+ (102, 256),
+ None,
+ (112, 102),
+ None,
+ (258, 102, 260),
+ None,
+ (112, 102),
+ None,
+ (262, 102, 264),
+ None,
+ (112, 46),
+ None,
+ (266, 46, 268),
+ None,
+ None,
+ None,
+ (272, 46, 106, 45),
+ None,
+ None,
+ (275, 106, 45),
+ None,
+ (271, 46, 106, 45, 274, 277),
+ None,
+ (275, 106, 45),
+ None,
+ (279, 46, 106, 45, 281),
+ None,
+ None,
+ (275, 106, 45),
+ None,
+ (283, 70, 284, 71, 106, 45, 286),
+ None,
+ None,
+ (289, 106, 45),
+ (44, 106, 45),
+ None,
+ (275, 106, 45),
+ None,
+ (289, 106, 45),
+ None,
+ (292, 294, 296),
+ None,
+ (288, 106, 45, 298),
+ (288, 106, 45, 298),
+ None,
+ (112, 43),
+ None,
+ (301, 43, 303, 106, 45),
+ (241, 56),
+ None,
+ (46, 306),
+ None,
+ (241, 102),
+ None,
+ (46, 310),
+ None,
+ (308, 312),
+ None,
+ None,
+ None,
+ (82, 314, 315, 316),
+ None,
+ (271, 50, 275, 46),
+ None,
+ (50, 320),
+ None,
+ None,
+ None,
+ None,
+ (324, 325, 106, 46),
+ None,
+ (324, 327, 106, 47),
+ None,
+ (329, 51),
+ None,
+ (51, 331),
+ None,
+ (333, 52),
+ None,
+ (52, 335),
+ None,
+ (337, 52),
+ None,
+ (54, 56),
+ None,
+ (56, 341),
+ (337, 284),
+ None,
+ (344, 337),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (110, 56),
+ None,
+ (355, 57),
+ None,
+ (57, 357),
+ None,
+ (359, 58),
+ None,
+ (58, 361),
+ None,
+ (363, 59),
+ None,
+ (59, 365),
+ None,
+ None,
+ None,
+ (369, 60),
+ None,
+ (60, 371),
+ None,
+ None,
+ None,
+ (375, 61),
+ None,
+ (61, 377),
+ None,
+ None,
+ None,
+ None,
+ (382, 62),
+ None,
+ (62, 384),
+ None,
+ None,
+ (387, 62),
+ None,
+ None,
+ (118, 62),
+ None,
+ (64, 390, 392),
+ None,
+ None,
+ (92, 395, 94),
+ None,
+ None,
+ None,
+ (397, 398, 399),
+ None,
+ None,
+ None,
+ (401, 402, 403),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (112, 413),
+ None,
+ None,
+ (415, 416),
+ None,
+ (412, 418),
+ None,
+ (92, 420, 94),
+ (397, 67, 399),
+ (229, 102),
+ None,
+ (112, 68),
+ None,
+ None,
+ (68, 426, 427),
+ None,
+ None,
+ None,
+ (429, 106, 430, 431),
+ None,
+ None,
+ (106, 434),
+ None,
+ None,
+ (112, 437),
+ None,
+ None,
+ (436, 439, 440),
+ (112, 46),
+ None,
+ None,
+ (46, 443, 444),
+ (112, 46, 106, 46),
+ None,
+ None,
+ (447, 448),
+ None,
+ (46, 106, 46, 450),
+ (46, 106, 46, 450),
+ (112, 46),
+ None,
+ None,
+ (454, 455),
+ None,
+ (46, 457),
+ (46, 457),
+ None,
+ None,
+ None,
+ (92, 462, 94),
+ None,
+ (461, 102, 464, 106, 45),
+ (75, 112),
+ None,
+ (112, 75),
+ None,
+ (112, 118, 46),
+ None,
+ (110, 46, 469, 471),
+ (118, 46),
+ None,
+ (75, 474),
+ None,
+ (467, 476),
+ (46, 113, 46),
+ None,
+ (46, 479),
+ None,
+ None,
+ None,
+ (283, 70, 284, 50, 483),
+ None,
+ (271, 47, 485),
+ None,
+ None,
+ (487, 488),
+ (220, 46),
+ None]
+LABEL=[None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ 'NEWLINE',
+ None,
+ None,
+ None,
+ None,
+ 'ENDMARKER',
+ None,
+ None,
+ None,
+ "'@'",
+ "'('",
+ None,
+ "')'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'def'",
+ 'NAME',
+ "'->'",
+ None,
+ None,
+ "':'",
+ None,
+ None,
+ None,
+ "'*'",
+ None,
+ "','",
+ "'='",
+ None,
+ None,
+ None,
+ None,
+ "'**'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "';'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'+='",
+ "'-='",
+ "'*='",
+ "'/='",
+ "'%='",
+ "'&='",
+ "'|='",
+ "'^='",
+ "'<<='",
+ "'>>='",
+ "'**='",
+ "'//='",
+ None,
+ "'del'",
+ None,
+ "'pass'",
+ None,
+ "'break'",
+ "'continue'",
+ "'return'",
+ None,
+ None,
+ "'raise'",
+ "'from'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'import'",
+ None,
+ "'.'",
+ "'...'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'as'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'global'",
+ None,
+ None,
+ None,
+ "'nonlocal'",
+ None,
+ None,
+ None,
+ "'assert'",
+ None,
+ None,
+ None,
+ None,
+ "'if'",
+ "'elif'",
+ None,
+ None,
+ "'else'",
+ None,
+ None,
+ None,
+ "'while'",
+ None,
+ None,
+ None,
+ "'for'",
+ "'in'",
+ None,
+ None,
+ None,
+ "'try'",
+ "'finally'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'with'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'except'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ 'INDENT',
+ None,
+ 'DEDENT',
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'lambda'",
+ None,
+ None,
+ None,
+ None,
+ "'or'",
+ None,
+ None,
+ None,
+ "'and'",
+ None,
+ None,
+ None,
+ "'not'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'is'",
+ None,
+ "'<'",
+ "'>'",
+ "'=='",
+ "'>='",
+ "'<='",
+ "'<>'",
+ "'!='",
+ None,
+ None,
+ "'|'",
+ None,
+ None,
+ None,
+ "'^'",
+ None,
+ None,
+ None,
+ "'&'",
+ None,
+ None,
+ None,
+ "'<<'",
+ "'>>'",
+ None,
+ None,
+ None,
+ None,
+ "'+'",
+ "'-'",
+ None,
+ None,
+ None,
+ None,
+ "'/'",
+ "'%'",
+ "'//'",
+ None,
+ None,
+ None,
+ None,
+ "'~'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'['",
+ None,
+ "']'",
+ None,
+ "'{'",
+ None,
+ "'}'",
+ None,
+ 'NUMBER',
+ 'STRING',
+ None,
+ "'None'",
+ "'True'",
+ "'False'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'class'",
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ "'yield'",
+ None,
+ None,
+ None,
+ None]
+DISPATCH=[None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (13,),
+  2: (13,),
+  3: (13,),
+  4: (82,),
+  59: (13,),
+  61: (13,),
+  65: (13,),
+  68: (13,),
+  72: (13,),
+  90: (83,),
+  91: (13,),
+  92: (13,),
+  93: (13,),
+  94: (13,),
+  100: (13,),
+  101: (13,),
+  102: (83,),
+  103: (13,),
+  104: (83,),
+  105: (13,),
+  110: (83,),
+  111: (13,),
+  112: (13,),
+  113: (83,),
+  114: (13,),
+  117: (13,),
+  118: (13,),
+  119: (13,),
+  121: (13,),
+  122: (13,),
+  123: (13,),
+  124: (83,),
+  125: (83,),
+  126: (83,),
+  127: (13,),
+  128: (13,),
+  132: (13,)},
+ {1: (12,),
+  2: (12,),
+  3: (12,),
+  4: (82,),
+  59: (12,),
+  61: (12,),
+  65: (12,),
+  68: (12,),
+  72: (12,),
+  90: (12,),
+  91: (12,),
+  92: (12,),
+  93: (12,),
+  94: (12,),
+  100: (12,),
+  101: (12,),
+  102: (12,),
+  103: (12,),
+  104: (12,),
+  105: (12,),
+  110: (12,),
+  111: (12,),
+  112: (12,),
+  113: (12,),
+  114: (12,),
+  117: (12,),
+  118: (12,),
+  119: (12,),
+  121: (12,),
+  122: (12,),
+  123: (12,),
+  124: (12,),
+  125: (12,),
+  126: (12,),
+  127: (12,),
+  128: (12,),
+  132: (12,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {102: (73,), 104: (6,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {61: (135,), 62: (136,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (141,), 61: (121,), 62: (142,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {61: (168,), 62: (169,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (174,), 61: (154,), 62: (175,)},
+ {1: (13,),
+  2: (13,),
+  3: (13,),
+  59: (13,),
+  61: (13,),
+  65: (13,),
+  68: (13,),
+  72: (13,),
+  90: (37,),
+  91: (13,),
+  92: (13,),
+  93: (13,),
+  94: (13,),
+  100: (13,),
+  101: (13,),
+  102: (37,),
+  103: (13,),
+  104: (37,),
+  105: (13,),
+  110: (37,),
+  111: (13,),
+  112: (13,),
+  113: (37,),
+  114: (13,),
+  117: (13,),
+  118: (13,),
+  119: (13,),
+  121: (13,),
+  122: (13,),
+  123: (13,),
+  124: (37,),
+  125: (37,),
+  126: (37,),
+  127: (13,),
+  128: (13,),
+  132: (13,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (15,),
+  2: (15,),
+  3: (15,),
+  59: (15,),
+  61: (15,),
+  65: (15,),
+  68: (15,),
+  72: (15,),
+  91: (15,),
+  92: (15,),
+  93: (15,),
+  94: (15,),
+  100: (36,),
+  101: (20,),
+  103: (20,),
+  105: (18,),
+  111: (26,),
+  112: (34,),
+  114: (26,),
+  117: (15,),
+  118: (35,),
+  119: (15,),
+  121: (19,),
+  122: (20,),
+  123: (20,),
+  127: (20,),
+  128: (15,),
+  132: (15,)},
+ {1: (71,),
+  2: (71,),
+  3: (71,),
+  59: (71,),
+  65: (71,),
+  68: (71,),
+  72: (71,),
+  91: (71,),
+  92: (71,),
+  93: (71,),
+  94: (71,),
+  117: (71,),
+  119: (71,),
+  127: (80,),
+  128: (71,),
+  132: (71,)},
+ None,
+ {1: (16,),
+  2: (16,),
+  3: (16,),
+  59: (16,),
+  61: (16,),
+  65: (16,),
+  68: (16,),
+  72: (16,),
+  91: (16,),
+  92: (16,),
+  93: (16,),
+  94: (16,),
+  117: (16,),
+  119: (16,),
+  127: (80,),
+  128: (16,),
+  132: (16,)},
+ None,
+ None,
+ {56: (185, 188),
+  58: (185, 188),
+  63: (185, 188),
+  64: (185, 188),
+  66: (185, 188),
+  69: (185, 188),
+  75: (185, 188),
+  76: (185, 188),
+  81: (185, 188),
+  84: (188,),
+  89: (185, 188),
+  97: (185, 188),
+  130: (185, 188)},
+ None,
+ {1: (46,),
+  2: (46,),
+  3: (46,),
+  59: (46,),
+  61: (55,),
+  65: (46,),
+  68: (46,),
+  72: (46,),
+  91: (46,),
+  92: (46,),
+  93: (46,),
+  94: (46,),
+  117: (46,),
+  119: (46,),
+  128: (46,),
+  132: (46,)},
+ {1: (46,),
+  2: (46,),
+  3: (46,),
+  59: (46,),
+  61: (55,),
+  65: (46,),
+  68: (46,),
+  72: (46,),
+  91: (46,),
+  92: (46,),
+  93: (46,),
+  94: (46,),
+  117: (46,),
+  119: (46,),
+  128: (46,),
+  132: (46,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {56: (201,),
+  58: (202,),
+  63: (207,),
+  64: (199,),
+  66: (197,),
+  69: (198,),
+  75: (208,),
+  76: (200,),
+  81: (205,),
+  89: (206,),
+  97: (204,),
+  130: (203,)},
+ None,
+ None,
+ None,
+ {101: (21,), 103: (22,), 122: (25,), 123: (23,), 127: (24,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {111: (28,), 114: (27,)},
+ None,
+ None,
+ None,
+ None,
+ {71: (229,), 72: (230,)},
+ None,
+ None,
+ {71: (229,), 72: (230,)},
+ None,
+ {1: (233, 235), 71: (233, 235), 72: (233, 235)},
+ None,
+ {1: (31,), 59: (237,), 61: (110,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {90: (5,),
+  102: (73,),
+  104: (6,),
+  110: (40,),
+  113: (38,),
+  124: (41,),
+  125: (39,),
+  126: (42,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {107: (297,), 108: (297,), 109: (290, 297)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (13,),
+  2: (13,),
+  3: (13,),
+  4: (317,),
+  59: (13,),
+  61: (13,),
+  65: (13,),
+  68: (13,),
+  72: (13,),
+  91: (13,),
+  92: (13,),
+  93: (13,),
+  94: (13,),
+  100: (13,),
+  101: (13,),
+  103: (13,),
+  105: (13,),
+  111: (13,),
+  112: (13,),
+  114: (13,),
+  117: (13,),
+  118: (13,),
+  119: (13,),
+  121: (13,),
+  122: (13,),
+  123: (13,),
+  127: (13,),
+  128: (13,),
+  132: (13,)},
+ None,
+ None,
+ None,
+ {1: (321,),
+  2: (321,),
+  3: (321,),
+  59: (321,),
+  65: (321,),
+  68: (321,),
+  72: (321,),
+  91: (321,),
+  92: (321,),
+  93: (321,),
+  94: (321,),
+  117: (48,),
+  119: (321,),
+  128: (321,),
+  132: (321,)},
+ {1: (50,),
+  2: (50,),
+  3: (50,),
+  59: (50,),
+  65: (50,),
+  68: (50,),
+  72: (50,),
+  91: (50,),
+  92: (50,),
+  93: (50,),
+  94: (50,),
+  117: (49,),
+  119: (50,),
+  128: (50,),
+  132: (50,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (53,),
+  2: (53,),
+  3: (53,),
+  59: (53,),
+  65: (53,),
+  68: (53,),
+  72: (53,),
+  91: (53,),
+  92: (53,),
+  93: (53,),
+  94: (53,),
+  119: (338,),
+  128: (53,),
+  132: (53,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {54: (352,),
+  79: (346,),
+  82: (350,),
+  83: (351,),
+  85: (348,),
+  86: (347,),
+  87: (349,),
+  115: (284,),
+  116: (345, 344),
+  119: (343,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {80: (367,), 88: (368,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ {65: (373,), 68: (374,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {55: (380,), 61: (110,), 73: (379,), 74: (381,)},
+ None,
+ None,
+ None,
+ None,
+ {65: (373,), 68: (374,), 132: (386,)},
+ None,
+ {1: (63,),
+  2: (63,),
+  3: (63,),
+  59: (63,),
+  65: (388,),
+  68: (388,),
+  72: (63,),
+  91: (63,),
+  92: (63,),
+  93: (63,),
+  94: (63,),
+  128: (63,),
+  132: (388,)},
+ None,
+ None,
+ None,
+ None,
+ {1: (65,),
+  2: (65,),
+  3: (65,),
+  59: (65,),
+  61: (65,),
+  65: (65,),
+  68: (65,),
+  72: (65,),
+  91: (65,),
+  92: (65,),
+  93: (65,),
+  94: (65,),
+  117: (65,),
+  119: (65,),
+  127: (80,),
+  128: (65,),
+  132: (65,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (102,),
+  2: (405,),
+  3: (407,),
+  59: (396,),
+  72: (230,),
+  91: (410,),
+  92: (408,),
+  93: (409,),
+  94: (400,),
+  128: (404,)},
+ {1: (46,),
+  2: (46,),
+  3: (46,),
+  59: (46,),
+  61: (55,),
+  65: (46,),
+  68: (46,),
+  72: (46,),
+  91: (46,),
+  92: (46,),
+  93: (46,),
+  94: (46,),
+  117: (46,),
+  119: (46,),
+  128: (46,),
+  132: (46,)},
+ {1: (46,),
+  2: (46,),
+  3: (46,),
+  59: (46,),
+  61: (55,),
+  65: (46,),
+  68: (46,),
+  72: (46,),
+  91: (46,),
+  92: (46,),
+  93: (46,),
+  94: (46,),
+  117: (46,),
+  119: (46,),
+  128: (46,),
+  132: (46,)},
+ None,
+ None,
+ None,
+ None,
+ {67: (417,), 110: (77, 417)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ {59: (421,), 71: (423,), 94: (422,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (432, 46),
+  2: (432, 46),
+  3: (432, 46),
+  59: (432, 46),
+  65: (432, 46),
+  68: (432, 46),
+  72: (432, 46),
+  77: (432,),
+  91: (432, 46),
+  92: (432, 46),
+  93: (432, 46),
+  94: (432, 46),
+  117: (432, 46),
+  119: (432, 46),
+  128: (432, 46),
+  132: (432, 46)},
+ None,
+ None,
+ {1: (56,),
+  2: (56,),
+  3: (56,),
+  59: (56,),
+  61: (55,),
+  65: (56,),
+  68: (56,),
+  72: (56,),
+  91: (56,),
+  92: (56,),
+  93: (56,),
+  94: (56,),
+  128: (56,),
+  132: (56,)},
+ {1: (56,),
+  2: (56,),
+  3: (56,),
+  59: (56,),
+  61: (55,),
+  65: (56,),
+  68: (56,),
+  72: (56,),
+  91: (56,),
+  92: (56,),
+  93: (56,),
+  94: (56,),
+  128: (56,),
+  132: (56,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {67: (449,), 110: (77, 449)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {67: (456,), 110: (77, 456)},
+ None,
+ None,
+ {1: (452, 459),
+  2: (452, 459),
+  3: (452, 459),
+  59: (452, 459),
+  65: (452, 459),
+  68: (452, 459),
+  72: (452, 459),
+  91: (452, 459),
+  92: (452, 459),
+  93: (452, 459),
+  94: (452, 459),
+  117: (452, 459),
+  119: (452, 459),
+  128: (452, 459),
+  132: (452, 459)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (475,),
+  2: (475,),
+  3: (475,),
+  59: (475,),
+  61: (472,),
+  62: (473,),
+  65: (475,),
+  68: (475,),
+  72: (475,),
+  91: (475,),
+  92: (475,),
+  93: (475,),
+  94: (475,),
+  117: (475,),
+  119: (475,),
+  128: (475,),
+  132: (475,)},
+ None,
+ None,
+ None,
+ None,
+ {1: (478, 480),
+  2: (478, 480),
+  3: (478, 480),
+  59: (478, 480),
+  65: (478, 480),
+  68: (478, 480),
+  72: (478, 480),
+  91: (478, 480),
+  92: (478, 480),
+  93: (478, 480),
+  94: (478, 480),
+  117: (478, 480),
+  119: (478, 480),
+  128: (478, 480),
+  132: (478, 480)},
+ {110: (77,), 113: (78,)},
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ {1: (71,),
+  2: (71,),
+  3: (71,),
+  59: (71,),
+  65: (71,),
+  68: (71,),
+  72: (71,),
+  91: (71,),
+  92: (71,),
+  93: (71,),
+  94: (71,),
+  111: (490,),
+  117: (71,),
+  119: (71,),
+  128: (71,),
+  132: (71,)}]
+DEFAULT=[None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ (),
+ None,
+ (),
+ None,
+ None,
+ (188,),
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ (),
+ None,
+ (235,),
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (297,),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ (417,),
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (449,),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (456,),
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ (),
+ None,
+ None,
+ None,
+ None,
+ (),
+ (),
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ None,
+ ()]
@@ -7,10 +7,28 @@ PPPP: Pure Python Python Parser
 """
 
 from . import tokenizer
+from . import cache
+from .arena import Arena, NodeView
 
 class EndOfFile(Exception):
     pass
 
+class ParseError(Exception):
+    """
+    A syntax error found at a commit point of the generated parser: the
+    rule failed past a token that no other rule can match. pos is the
+    index of the token where it failed, tok that token.
+    """
+    def __init__(self, rule, pos, tok):
+        Exception.__init__(self, "SyntaxError: invalid syntax in {0}, line {1}".format(rule, tok[3]))
+        self.rule = rule
+        self.pos = pos
+        self.tok = tok
+
+# Fixed punctuation of the grammar. With punctuation=False the parser
+# drops their leaves, since the rule holding them tells where they were.
+PUNCTUATION = frozenset(["(", ")", "[", "]", "{", "}", ":", ",", ";"])
+
 class astnode:
     def __init__(self, ntype, tok=None):
         self.ntype = ntype
@@ -25,23 +43,656 @@ class astnode:
         self.childs.append(child)
         child.parent = self
 
+def fix_parents(node):
+    """
+    Sets the parent of every node under node to the node holding it.
+    """
+    stack = [node]
+    while len(stack) > 0:
+        n = stack.pop(-1)
+        for x in n.childs:
+            x.parent = n
+            stack.append(x)
+
+def arena_nodes(arena, toks, base=0):
+    """
+    Returns an astnode for each record of arena, whose token 0 is toks[base].
+    """
+    type_names = arena.type_names
+    types = arena.types
+    first = arena.first
+    kids = arena.kids
+    kid_start = arena.kid_start
+    kid_count = arena.kid_count
+    nodes = [None] * len(types)
+    for i in range(len(types)):
+        if kid_count[i] < 0:
+            nodes[i] = astnode(type_names[types[i]], toks[base + first[i]])
+        else:
+            n = astnode(type_names[types[i]])
+            n.childs = [nodes[x] for x in kids[kid_start[i]:kid_start[i] + kid_count[i]]]
+            nodes[i] = n
+    for i, p in enumerate(arena.parent):
+        if p >= 0:
+            nodes[i].parent = nodes[p]
+    return nodes
+
+def token_index(toks, tok):
+    """
+    Index in the list toks of the token tuple tok, which is in it.
+    """
+    lo = 0
+    hi = len(toks)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if toks[mid][1] < tok[1]:
+            lo = mid + 1
+        else:
+            hi = mid
+    # Zero-width tokens may share their start, like consecutive DEDENTs.
+    while toks[lo] is not tok:
+        lo = lo + 1
+    return lo
+
+def last_token(toks, node):
+    """
+    Index in toks of the last token of the statement node.
+    """
+    while node.tok is None:
+        node = node.childs[-1]
+    return token_index(toks, node.tok)
+
+def stmt_list(toks, node):
+    """
+    If node is a file_input, or a suite of an indented block, returns the
+    range lo to hi of its childs between the tokens before and after the
+    statements, and the indices in toks of the first statement token and
+    of the closing ENDMARKER or DEDENT. Returns None otherwise.
+    """
+    childs = node.childs
+    if node.ntype == 'file_input':
+        return 0, len(childs) - 1, 0, token_index(toks, childs[-1].tok)
+    if node.ntype == 'suite' and len(childs) > 0 and childs[0].ntype == 'NEWLINE':
+        return 2, len(childs) - 1, token_index(toks, childs[1].tok) + 1, token_index(toks, childs[-1].tok)
+    return None
+
+def move_leaves(nodes, toks, pos, delta):
+    """
+    Gives the leaves under nodes, which follow an edit that moved their
+    tokens by delta characters, the tokens of toks from pos on instead.
+    """
+    stack = list(reversed(nodes))
+    while len(stack) > 0:
+        n = stack.pop(-1)
+        if n.tok is not None:
+            t = n.tok
+            while toks[pos][1] != t[1] + delta or toks[pos][0] != t[0]:
+                pos = pos + 1
+            n.tok = toks[pos]
+            pos = pos + 1
+        else:
+            stack.extend(reversed(n.childs))
+    return pos
+
 def print_tree(node, level=0):
-    assert type(node) is astnode
-    
-    if node.tok is not None and node.tok[4] is not None:
-        ww = repr(node.tok[4])
-    else:
-        ww = ""
-    print((" " * level) + node.ntype + "(" + ww + ")")
-    if node.childs is not None:
-        for x in node.childs:
-            print_tree(x, level + 1)
+    assert type(node) is astnode or type(node) is NodeView
+
+    # Iterative, so that deep trees do not hit the recursion limit.
+    stack = [(node, level)]
+    while len(stack) > 0:
+        node, level = stack.pop(-1)
+        if node.tok is not None and node.tok[4] is not None:
+            ww = repr(node.tok[4])
+        else:
+            ww = ""
+        print((" " * level) + node.ntype + "(" + ww + ")")
+        if node.childs is not None:
+            for x in reversed(node.childs):
+                stack.append((x, level + 1))
 
 class parser_base:
-    def __init__(self, toks):
+    # Maps the string literal of a grammar keyword or operator to its token
+    # class; overridden by the generated parser.
+    keywords = {}
+
+    # Expression rules parsed by precedence climbing, see climb; set by
+    # the generated parser.
+    prec_rules = []
+    prec_bottom = None
+    prec_prefix = []
+    prec_ops = {}
+
+    # In packrat mode, once a statement at the top level is parsed no
+    # rule backtracks before its end, so the memo is trimmed there.
+    commit_rule = 'parse_stmt'
+
+    def __init__(self, toks, packrat=False, compact=False, punctuation=True, arena=False):
         self.toks = toks
         self.root = None
         self.pos = 0
+        self.memo = None
+        # Compact mode: a rule that would get exactly one child returns
+        # that child instead of a node of its own, so chains like
+        # test -> or_test -> ... -> atom collapse to the atom.
+        self.compact = compact
+        self.drop_punctuation = not punctuation
+        # Arena mode: the nodes are appended to self.arena, and the
+        # parse_<rule> methods return node indices; self.arena.view() turns
+        # them into NodeView objects.
+        if arena:
+            self.arena = Arena(toks)
+        else:
+            self.arena = None
+        self.classify_tokens()
+        # Token classes of all the prefix operators, see climb.
+        self.prec_prefix_classes = frozenset([c for p in self.prec_prefix if p is not None for c in p])
+        if packrat:
+            self.enable_packrat()
+        # Tokens loaded from or stored in the cache, see cache.enable.
+        key = getattr(toks, 'cache_key', None)
+        if key is not None and cache.current is not None:
+            self.enable_cache(cache.current, key)
+
+    def enable_packrat(self):
+        # Packrat mode: the result of every parse_<rule> method is memoized
+        # by (rule, pos), so backtracking never parses the same rule at the
+        # same position twice, and the parse takes linear time.
+        self.memo = {}
+        if self.arena is not None:
+            self.arena.trimming = False
+        self.depth = 0
+        self.commit_depth = 0
+        for name in dir(type(self)):
+            if name.startswith('parse_'):
+                setattr(self, name, self.memoize(name, getattr(self, name)))
+
+    def enable_cache(self, c, key):
+        # The tree of parse_file_input is loaded from the Cache c, or else
+        # parsed in arena mode and stored there. Out of arena mode, it is
+        # then made into astnode objects. A tree stored for other tokens,
+        # as after an edit that kept the key, is parsed again.
+        parse = self.parse_file_input
+
+        def parse_cached():
+            if self.pos != 0:
+                return parse()
+            punctuation = not self.drop_punctuation
+            digest = cache.classes_digest(self.tclasses)
+            value = c.load_tree(key, self.compact, punctuation)
+            if value is not None and (value[0] != len(self.toks) or value[1] != digest):
+                value = None
+            if value is None:
+                arena = self.arena
+                if arena is None:
+                    self.arena = Arena(self.toks)
+                    self.arena.trimming = self.memo is None
+                tree = self.arena
+                try:
+                    root = parse()
+                    error = None
+                except ParseError as e:
+                    root = None
+                    error = (e.rule, e.pos)
+                finally:
+                    self.arena = arena
+                if root is None:
+                    tree = None
+                c.store_tree(key, self.compact, punctuation, len(self.toks), digest, tree, root, error)
+            else:
+                tree, root, error = value[2:]
+                if tree is not None:
+                    tree.toks = self.toks
+                    tree.trimming = self.memo is None
+                    self.pos = len(self.toks)
+                    if self.arena is not None:
+                        self.arena = tree
+            if error is not None:
+                raise ParseError(error[0], error[1], self.toks[error[1]])
+            if root is None or self.arena is not None:
+                return root
+            return arena_nodes(tree, self.toks)[root]
+
+        self.parse_file_input = parse_cached
+
+    def memoize(self, name, func):
+        commit = (name == self.commit_rule)
+
+        def parse_memo():
+            pos = self.pos
+            entry = self.memo.get(pos)
+            if entry is None:
+                entry = {}
+                self.memo[pos] = entry
+            elif name in entry:
+                node, self.pos = entry[name]
+                return node
+
+            self.depth = self.depth + 1
+            if commit:
+                self.commit_depth = self.commit_depth + 1
+            try:
+                node = func()
+            finally:
+                self.depth = self.depth - 1
+                if commit:
+                    self.commit_depth = self.commit_depth - 1
+            entry[name] = (node, self.pos)
+
+            if node is not None:
+                if commit and self.commit_depth == 0:
+                    # Drop the positions behind the statement.
+                    end = self.pos
+                    self.memo = dict([(p, e) for p, e in self.memo.items() if p >= end])
+                if self.depth == 0:
+                    # A memoized node may have been added last to a parent
+                    # that was then discarded.
+                    if self.arena is not None:
+                        self.arena.fix_parents(node)
+                    else:
+                        fix_parents(node)
+            return node
+
+        return parse_memo
+
+    def classify_tokens(self):
+        # Token class of every token: the keyword class for keywords and
+        # operators in the grammar, the token ID for anything else. The
+        # list ends with an ERRORTOKEN sentinel, which is in no FIRST set,
+        # so the generated code can test the class at the current position
+        # without a bounds check.
+        keywords = self.keywords
+        classes = [keywords.get(t[4], t[0]) for t in self.toks]
+        classes.append(tokenizer.T_ERRORTOKEN)
+        self.tclasses = classes
+        self.gstrs = {}
+        self.add_gstrs(self.toks, classes)
+
+    def add_gstrs(self, toks, classes):
+        # One shared "Grammar String" set per token class.
+        for t, c in zip(toks, classes):
+            if c not in self.gstrs:
+                if t[4] is not None:
+                    self.gstrs[c] = frozenset(["'" + t[4] + "'", tokenizer.TOK_NAMES[t[0]]])
+                else:
+                    self.gstrs[c] = frozenset([tokenizer.TOK_NAMES[t[0]]])
+
+    def push_tokens(self, toks):
+        """
+        Appends the list toks to the tokens being parsed, for a parser that
+        reads its input as it goes; see stream.iter_statements. self.toks
+        must be a list.
+        """
+        keywords = self.keywords
+        classes = [keywords.get(t[4], t[0]) for t in toks]
+        self.toks.extend(toks)
+        self.tclasses[-1:] = classes
+        self.tclasses.append(tokenizer.T_ERRORTOKEN)
+        self.add_gstrs(toks, classes)
+
+    def release_tokens(self, n):
+        """
+        Drops the first n tokens; the positions of the rest move back by n.
+        The memo of packrat mode is emptied.
+        """
+        del self.toks[:n]
+        del self.tclasses[:n]
+        self.pos = self.pos - n
+        if self.memo is not None:
+            self.memo = {}
+
+    def reparse(self, tree, source, offset, length, text):
+        """
+        Parses again the source of self.toks after the length characters at
+        offset are replaced by text. tree is its file_input node, made of
+        astnode objects, and self.toks is a list. Returns the new source and
+        its file_input node, or None if it does not parse; self.toks are
+        then its tokens.
+
+        Only the innermost suite around the tokens that changed is parsed
+        again, from the statement before them up to the first statement
+        that starts where an old one did; the other nodes are kept, with
+        the tokens of their leaves moved. If that does not end where the
+        suite did, the suite around it is parsed instead, up to the whole
+        file.
+        """
+        assert self.arena is None
+
+        old = self.toks
+        S, a, b, new, delta, line_delta = tokenizer.rescan(source, old, offset, length, text)
+        shift = len(new) - (b - a)
+        # An edit that changes no token is taken as one changing token a.
+        b = max(b, a + 1)
+
+        # The suites around the tokens from a to b, from the file_input in.
+        path = [tree]
+        while True:
+            lo, hi, first, close = stmt_list(old, path[-1])
+            childs = path[-1].childs
+            m = self.first_ending(old, childs, lo, hi, b - 1)
+            if m == hi or childs[m].tok is not None:
+                break
+            if m > lo and last_token(old, childs[m - 1]) + 1 > a:
+                break
+            found = None
+            stack = [childs[m]]
+            while len(stack) > 0 and found is None:
+                n = stack.pop(-1)
+                if n.tok is not None:
+                    continue
+                r = stmt_list(old, n)
+                if r is None:
+                    stack.extend(n.childs)
+                elif r[2] <= a and b <= r[3]:
+                    found = n
+            if found is None:
+                break
+            path.append(found)
+
+        rest = old[b:]
+        moved = delta != 0 or line_delta != 0
+        if moved:
+            rest = [(t[0], t[1] + delta, t[2] + delta, t[3] + line_delta, t[4]) for t in rest]
+        self.toks = old[:a] + new + rest
+        keywords = self.keywords
+        classes = [keywords.get(t[4], t[0]) for t in new]
+        self.tclasses[a:b] = classes
+        self.add_gstrs(new, classes)
+        if self.memo is not None:
+            self.memo = {}
+
+        while len(path) > 0:
+            node = path.pop(-1)
+            kept = self.reparse_stmts(node, old, a, b, shift)
+            if kept is None:
+                continue
+            if kept < 0:
+                return S, None
+            if moved:
+                # Move the leaves after the new statements.
+                pos = move_leaves(node.childs[kept:], self.toks, self.pos, delta)
+                while node.parent is not None:
+                    childs = node.parent.childs
+                    pos = move_leaves(childs[childs.index(node) + 1:], self.toks, pos, delta)
+                    node = node.parent
+            return S, tree
+        return S, None
+
+    def first_ending(self, toks, childs, lo, hi, idx):
+        # First of childs[lo:hi] ending at or after the token idx, or hi.
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if last_token(toks, childs[mid]) < idx:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def reparse_stmts(self, node, old, a, b, shift):
+        """
+        Parses again the statements of node, see reparse. old are the tokens
+        before the edit, a to b those that changed, and shift what the
+        index of the tokens after them changed by. Returns the position of
+        the index in node of the first child kept after the new statements,
+        whose first token is at self.pos, or None if they do not end where
+        node did, or -1 if the file does not parse.
+        """
+        lo, hi, first, close = stmt_list(old, node)
+        childs = node.childs
+        top = node.ntype == 'file_input'
+        if close < b and not top:
+            return None
+
+        # From the statement before the first one that changed.
+        i = self.first_ending(old, childs, lo, hi, a)
+        if i > lo:
+            i = i - 1
+        if i > lo:
+            pos = last_token(old, childs[i - 1]) + 1
+        else:
+            pos = first
+
+        # Up to the first child starting after b, at its new position, or
+        # the closing token, which is childs[hi].
+        k = self.first_ending(old, childs, lo, hi, b - 1) + 1
+        if k <= hi:
+            target = last_token(old, childs[k - 1]) + 1 + shift
+
+        stmts = []
+        synced = False
+        while True:
+            while k <= hi and target < pos:
+                k = k + 1
+                if k <= hi:
+                    target = last_token(old, childs[k - 1]) + 1 + shift
+            if k <= hi and target == pos:
+                synced = True
+                break
+            if top and self.tclasses[pos] == tokenizer.T_NEWLINE:
+                stmts.append(astnode('NEWLINE', self.toks[pos]))
+                pos = pos + 1
+                continue
+            self.pos = pos
+            try:
+                c = self.parse_stmt()
+            except ParseError:
+                if top:
+                    raise
+                return None
+            if c is None:
+                break
+            stmts.append(c)
+            pos = self.pos
+
+        if not synced:
+            if not top:
+                return None
+            if self.tclasses[pos] != tokenizer.T_ENDMARKER:
+                return -1
+            stmts.append(astnode('ENDMARKER', self.toks[pos]))
+            pos = pos + 1
+            k = hi + 1
+        elif not top and i - lo + len(stmts) + hi - k == 0:
+            # A suite without statements.
+            return None
+
+        for c in stmts:
+            c.parent = node
+        childs[i:k] = stmts
+        self.pos = pos
+        return i + len(stmts)
+
+    def syntax_error(self, rule, pos):
+        if pos >= len(self.toks):
+            pos = len(self.toks) - 1
+        return ParseError(rule, pos, self.toks[pos])
+
+    def climb(self, level):
+        """
+        Parses the rule prec_rules[level] by precedence climbing, with the
+        same nodes as parsing each rule of prec_rules on its own. Every
+        rule there is binary, "R: C (op C)*", or prefix, "R: op R | C", with
+        C the next rule, or prec_bottom for the last one. prec_ops maps the
+        token class of each binary operator to (level, leaf name, False),
+        or (level, method, True) if the operator is a rule. prec_prefix
+        maps, for the prefix levels, the class of each operator to its leaf
+        name. The operators of different binary levels do not share a
+        class, and no prefix operator can start C.
+        """
+        rules = self.prec_rules
+        prefix = self.prec_prefix
+        ops = self.prec_ops
+        bottom = getattr(self, self.prec_bottom)
+        K = len(rules)
+        tclasses = self.tclasses
+        toks = self.toks
+        arena = self.arena
+        compact = self.compact
+        # The nodes are allocated before their children, like the
+        # parse_<rule> methods do.
+        early = arena is None and not compact
+
+        # The open levels are always level to K - 1. Each has its start, its
+        # node, its children so far, or None while no operator matched,
+        # and for prefix levels the operators before it, as (leaf, start,
+        # node), or None.
+        starts = [0] * K
+        nodes = [None] * K
+        childs = [None] * K
+        pending = [None] * K
+
+        startpos = pos = self.pos
+        if arena is not None:
+            mark = len(arena)
+        top = -1 # Level of the operator before the operand being parsed
+        oppos = 0 # and its position
+        lv = level
+        while True:
+            # Open the levels from lv on, then parse the operand.
+            if tclasses[pos] not in self.prec_prefix_classes:
+                # No prefix operator, so they all start here.
+                starts[lv:] = [pos] * (K - lv)
+                if early:
+                    nodes[lv:] = [astnode(x) for x in rules[lv:]]
+                lv = K
+            while lv < K:
+                p = prefix[lv]
+                if p is not None:
+                    while tclasses[pos] in p:
+                        n = None
+                        if early:
+                            n = astnode(rules[lv])
+                        if arena is None:
+                            leaf = astnode(p[tclasses[pos]], toks[pos])
+                        else:
+                            leaf = arena.add_leaf(p[tclasses[pos]], pos)
+                        if pending[lv] is None:
+                            pending[lv] = []
+                        pending[lv].append((leaf, pos, n))
+                        pos = pos + 1
+                starts[lv] = pos
+                if early:
+                    nodes[lv] = astnode(rules[lv])
+                lv = lv + 1
+
+            self.pos = pos
+            x = bottom()
+            if x is not None:
+                pos = self.pos
+                k = K - 1
+                op = ops.get(tclasses[pos])
+                if op is None or op[0] < level:
+                    L = level - 1
+                else:
+                    L = op[0]
+            elif top < level:
+                if arena is not None:
+                    arena.truncate(mark)
+                self.pos = startpos
+                return None
+            else:
+                # The repetition of the operator at level top fails, and
+                # ends there; no other level takes that operator. The
+                # levels after it are dropped.
+                for k in range(top + 1, K):
+                    pending[k] = None
+                ch = childs[top]
+                pos = oppos
+                if arena is not None:
+                    arena.trim(ch, len(ch) - 1)
+                del ch[-1]
+                x = ch.pop(-1)
+                if len(ch) == 0:
+                    childs[top] = None
+                k = top
+                L = level - 1
+
+            while True:
+                # Close the levels after L, from the innermost.
+                while k > L:
+                    ch = childs[k]
+                    if ch is None and pending[k] is None:
+                        # A level that only passes its operand up.
+                        if compact:
+                            pass
+                        elif arena is not None:
+                            x = arena.add_node(rules[k], [x], starts[k], pos)
+                        else:
+                            n = nodes[k]
+                            n.childs = [x]
+                            x.parent = n
+                            x = n
+                        k = k - 1
+                        continue
+
+                    if ch is None:
+                        ch = [x]
+                    else:
+                        ch.append(x)
+                        childs[k] = None
+                    if compact and len(ch) == 1:
+                        pass
+                    elif arena is not None:
+                        x = arena.add_node(rules[k], ch, starts[k], pos)
+                    else:
+                        n = nodes[k]
+                        if n is None:
+                            n = astnode(rules[k])
+                        n.childs = ch
+                        for y in ch:
+                            y.parent = n
+                        x = n
+                    if pending[k] is not None:
+                        for leaf, s, n in reversed(pending[k]):
+                            if arena is not None:
+                                x = arena.add_node(rules[k], [leaf, x], s, pos)
+                                continue
+                            if n is None:
+                                n = astnode(rules[k])
+                            n.childs = [leaf, x]
+                            leaf.parent = n
+                            x.parent = n
+                            x = n
+                        pending[k] = None
+                    k = k - 1
+
+                if L < level:
+                    self.pos = pos
+                    return x
+
+                # The operator of level L, then its next operand.
+                ch = childs[L]
+                if ch is None:
+                    ch = []
+                    childs[L] = ch
+                ch.append(x)
+                if op[2]:
+                    self.pos = pos
+                    y = getattr(self, op[1])()
+                    if y is None:
+                        x = ch.pop(-1)
+                        if len(ch) == 0:
+                            childs[L] = None
+                        k = L
+                        L = level - 1
+                        continue
+                    ch.append(y)
+                    oppos = pos
+                    pos = self.pos
+                else:
+                    if arena is None:
+                        ch.append(astnode(op[1], toks[pos]))
+                    else:
+                        ch.append(arena.add_leaf(op[1], pos))
+                    oppos = pos
+                    pos = pos + 1
+                top = L
+                lv = L + 1
+                break
+
+    def tok_class(self):
+        if self.pos < len(self.toks):
+            return self.tclasses[self.pos]
+        raise EndOfFile()
 
     def tok_peek(self):
         if self.pos < len(self.toks):
@@ -58,10 +709,7 @@ class parser_base:
         #
         # ie, the 'def' keyword token will return: set(["'def'", "NAME"])
         #
-        t = self.tok_peek()
-        if t[4] is not None:
-            return set(["'" + t[4] + "'", tokenizer.TOK_NAMES[t[0]]])
-        return set([tokenizer.TOK_NAMES[t[0]]])
+        return self.gstrs[self.tok_class()]
         
     def tok_get(self):
         if self.pos < len(self.toks):
@@ -79,7 +727,8 @@ class parser_base:
         if name is not None and t[4] != name:
             return False
 
-        if name is None and tok_id == tokenizer.T_NAME and t[4] is not None and self.is_special_name("'" + t[4] + "'"):
+        # A NAME that is a keyword has the keyword class.
+        if name is None and tok_id == tokenizer.T_NAME and self.tclasses[self.pos] != tokenizer.T_NAME:
             return False
 
         return True
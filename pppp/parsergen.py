@@ -13,14 +13,50 @@ import textwrap
 import pprint
 
 from . import grammarparse
+from . import parserbase
 from . import tokenizer
 
 GrammarNode = grammarparse.GrammarNode
 
 
+# Loops the inlined code of a method can nest; CPython allows 20 blocks.
+MAX_LOOPS = 12
+
 def indent(L, prefix):
     return '\n'.join([(prefix + x) for x in L])
 
+def indent_lines(L):
+    return [("    " + x) for x in L]
+
+def unwrap(N):
+    """
+    Returns N without the sequences of one item around it.
+    """
+    while type(N) is GrammarNode and N.type == 'S' and len(N.data) == 1:
+        N = N.data[0]
+    return N
+
+def distance(calls, src, dst):
+    """
+    Returns the number of calls from the method src to the method dst, in
+    the call graph calls.
+    """
+    seen = set([src])
+    level = [src]
+    n = 0
+    while len(level) > 0:
+        n = n + 1
+        nxt = []
+        for x in level:
+            for y in calls.get(x, ()):
+                if y == dst:
+                    return n
+                if y not in seen:
+                    seen.add(y)
+                    nxt.append(y)
+        level = nxt
+    return None
+
 def longest_seq(N):
     if type(N) is str:
         return 1
@@ -43,25 +79,64 @@ def longest_seq(N):
     assert False
 
 class parser_gen:
-    def __init__(self):
+    def __init__(self, optimize=True):
+        self.optimize = optimize # Inline the rule bodies, see emitNode
+        self.helpers = {} # Helper method of each inlined node, by repr
+        self.inline_rules = set()
+        self.inlining = set() # Rules being inlined
+        self.cut_rules = set() # Rules with a commit point, see findCutRules
+        self.prec = [] # (rule, kind, operators) of each level, see findPrecRules
+        self.prec_bottom = None
         self.G = None
         self.header = ""
         self.header2 = ""
         self.methods = []
         self.hidx = 1 # Index counter for sub-expressions
         self.tables = [] # Sub-sets of FIRST subexpressions
+        self.dispatch = [] # Alternative of each token class, see emitDispatch
+        self.dispatch_names = {} # Sorted items of each table to its name
+        self.keywords = {} # Token class of each keyword and operator
+        self.class_gstrs = [] # "Grammar Strings" of each token class
+        self.class_bits = {} # Mask of the token classes of each grammar string
 
     def newTable(self, data):
         idx = len(self.tables)
-        self.tables.append(data)
+        self.tables.append(self.mask(data))
         return idx
 
+    def mask(self, first_set):
+        """
+        Converts a FIRST set into an integer with the bit of every token
+        class that can start it. The generated code tests a token with
+        (mask >> tclass) & 1.
+        """
+        m = 0
+        for x in first_set:
+            m = m | self.class_bits.get(x, 0)
+        return m
+
+    def alt_key(self, N):
+        """
+        Sort key of the alternative N of an A-type node. Alternatives are
+        tried from the highest key to the lowest, see parseSubexpr.
+        """
+        f = self.G.FIRST(N)
+        if grammarparse.EPS_SYMBOL in f:
+            has_eps = 0
+        else:
+            has_eps = 1
+        if 'NAME' in f:
+            name_count = 0
+        else:
+            name_count = 1
+        return (has_eps, longest_seq(N), name_count)
+
     def parseSubexpr(self, N, ctx):
         helper_name = "parsehelper_" + str(self.hidx)
         self.hidx = self.hidx + 1
         
         m = """
-    def {0}(self, node):
+    def {0}(self):
         \"\"\" ## subexpr ##
         {1}
         \"\"\"
@@ -75,31 +150,43 @@ class parser_gen:
                     # Special token code
                     m += """
         # Terminal literal operator
-        if not self.tok_test(tokenizer.T_{0}, {1}):
+        if self.tclasses[self.pos] != {0}: # {1}
             return None
-        tok = self.tok_peek()
+        tok = self.toks[self.pos]
         self.pos = self.pos + 1
-        return [astnode({2}, tok)]
-""".format(tokenizer.TOK_NAMES[tokenizer.TOK_STR[N[1:-1]]], # 0
-    repr(N[1:-1]),                              # 1
-    repr(N))                                    # 2
+""".format(self.keywords[N[1:-1]], # 0
+    repr(N))                       # 1
+                    if N[1:-1] in parserbase.PUNCTUATION:
+                        m += """
+        if self.drop_punctuation:
+            return []
+"""
+                    m += """
+        if self.arena is not None:
+            return [self.arena.add_leaf({0}, self.pos - 1)]
+        return [astnode({0}, tok)]
+""".format(repr(N))
                 elif N[0] == "'" and N[-1] == "'":
                     # T_NAME
                     m += """
         # Terminal NAME
-        if not self.tok_test(tokenizer.T_NAME, {1}):
+        if self.tclasses[self.pos] != {1}: # {0}
             return None
-        tok = self.tok_peek()
+        tok = self.toks[self.pos]
         self.pos = self.pos + 1
+        if self.arena is not None:
+            return [self.arena.add_leaf({0}, self.pos - 1)]
         return [astnode({0}, tok)]
-""".format(repr(N), repr(N[1:-1]))
+""".format(repr(N), self.keywords[N[1:-1]])
                 else:
                     m += """
         # Terminal std
-        if not self.tok_test(tokenizer.T_{0}):
+        if self.tclasses[self.pos] != tokenizer.T_{0}:
             return None
-        tok = self.tok_peek()
+        tok = self.toks[self.pos]
         self.pos = self.pos + 1
+        if self.arena is not None:
+            return [self.arena.add_leaf({1}, self.pos - 1)]
         return [astnode({1}, tok)]
 """.format(N, repr(N))
             else:
@@ -124,7 +211,7 @@ class parser_gen:
 """
             for x, _subp in childs:
                 m += """
-        c = self.{0}(node) # {1}
+        c = self.{0}() # {1}
         if c is None:
             self.pos = oldpos
             return None
@@ -139,19 +226,7 @@ class parser_gen:
             assert type(N.data) is list
             #' | '.join([printNodeStr(x) for x in N.data])
             
-            def name_count(N):
-                f = self.G.FIRST(N)
-                if 'NAME' in f:
-                    return 0
-                return 1
-            
-            def has_eps(N):
-                f = self.G.FIRST(N)
-                if grammarparse.EPS_SYMBOL in f:
-                    return 0
-                return 1
-            
-            childs = [(self.parseSubexpr(x, ctx), (has_eps(x), longest_seq(x), name_count(x)), x) for x in N.data]
+            childs = [(self.parseSubexpr(x, ctx), self.alt_key(x), x) for x in N.data]
             
             # This is a simple attempt to fix some issues of production parsing:
             #
@@ -190,10 +265,13 @@ class parser_gen:
 
             m += """
         # A-type (alt)
-        if self.tok_peek_gstr().isdisjoint(TABLE[{0}]) and not ({1} in TABLE[{0}]):
+"""
+            if not grammarparse.EPS_SYMBOL in N_first_set:
+                m += """
+        if not {0:#x} >> self.tclasses[self.pos] & 1: # TABLE[{1}]
             self.pos = oldpos
             return None
-""".format(N_first_set_idx, repr(grammarparse.EPS_SYMBOL))
+""".format(self.tables[N_first_set_idx], N_first_set_idx)
 
             alts_first_sets=[]
             for x, _xlen, _subp in childs:
@@ -211,7 +289,7 @@ class parser_gen:
                     disjoint_str = "INTERSECTION: EMPTY"
 
                 m += """
-        c = self.{0}(node) # {1}, {2} FIRST: {3} {4}
+        c = self.{0}() # {1}, {2} FIRST: {3} {4}
         if c is not None:
             return c
 """.format(x, _xlen, _subp, this_first_set, disjoint_str)
@@ -228,7 +306,7 @@ class parser_gen:
             
             m += """
         # [-type (opt)
-        c = self.{0}(node)
+        c = self.{0}()
         if c is None:
             self.pos = oldpos
             return []
@@ -246,7 +324,7 @@ class parser_gen:
         childs = []
         while True:
             oldpos2 = self.pos
-            c = self.{0}(node)
+            c = self.{0}()
             if c is None:
                 self.pos = oldpos2
                 break
@@ -266,7 +344,7 @@ class parser_gen:
         i = 0
         while True:
             oldpos2 = self.pos
-            c = self.{0}(node)
+            c = self.{0}()
             if c is None:
                 self.pos = oldpos2
                 break
@@ -281,8 +359,671 @@ class parser_gen:
             return helper_name
         assert False
         
-    def run(self):
+    # Optimization pass. Instead of one parsehelper method per grammar node,
+    # the body of each rule is emitted inline in its parse_<rule> method,
+    # with pos and the childs list in locals. The lines of a node append
+    # its children to childs and advance pos; when it does not match they
+    # run the "fail" lines, which restore both to the checkpoint of the
+    # innermost node that can recover (an option, a repetition or an
+    # alternative) and break out of its loop, or return None.
+
+    def termClass(self, N):
+        if N[0] == "'" and N[-1] == "'":
+            return self.keywords[N[1:-1]]
+        return getattr(tokenizer, 'T_' + N)
+
+    def newVar(self, ctx, prefix):
+        ctx['vidx'] = ctx['vidx'] + 1
+        return prefix + str(ctx['vidx'])
+
+    def firstCheck(self, N):
+        """
+        Returns the mask of the token classes N can start with, or None if
+        N can match nothing and so can not be checked.
+        """
+        f = self.G.FIRST(N)
+        if grammarparse.EPS_SYMBOL in f:
+            return None
+        return self.mask(f)
+
+    def emitLeaf(self, N, ctx):
+        ctx['uses'].add('toks')
+        ctx['uses'].add('arena')
+        m = [
+            "if arena is None:",
+            "    childs.append(astnode({0}, toks[pos]))".format(repr(N)),
+            "else:",
+            "    childs.append(arena.add_leaf({0}, pos))".format(repr(N)),
+        ]
+        if N[1:-1] in parserbase.PUNCTUATION and N[0] == "'":
+            ctx['uses'].add('drop')
+            m = ["if not drop:"] + indent_lines(m)
+        return m + ["pos = pos + 1"]
+
+    def restoreLines(self, p, k, ctx):
+        """
+        Lines going back to the checkpoint pos = p, len(childs) = k. In
+        arena mode the records of the dropped children are dropped too.
+        """
+        ctx['uses'].add('arena')
+        return [
+            "pos = " + p,
+            "if arena is not None:",
+            "    arena.trim(childs, {0})".format(k),
+            "del childs[{0}:]".format(k),
+        ]
+
+    def returnLines(self, ctx):
+        """
+        Lines failing the whole method.
+        """
+        ctx['uses'].add('arena')
+        return [
+            "if arena is not None:",
+            "    arena.trim(childs, 0)",
+            "self.pos = startpos",
+            "return None",
+        ]
+
+    def emitCall(self, name, fail, extend):
+        m = [
+            "self.pos = pos",
+            "c = self.{0}()".format(name),
+            "if c is None:",
+        ] + indent_lines(fail)
+        if extend:
+            m.append("childs.extend(c)")
+        else:
+            m.append("childs.append(c)")
+        return m + ["pos = self.pos"]
+
+    def isSimple(self, N):
+        """
+        True if N is a terminal or a rule call, which change nothing when
+        they do not match, so they need no checkpoint.
+        """
+        N = unwrap(N)
+        if type(N) is not str:
+            return False
+        return self.G.isTerminal(N) or N not in self.inline_rules or N in self.inlining
+
+    def emitRecover(self, N, ctx, loops):
+        """
+        Lines of N inside a new loop, with a checkpoint its failures go
+        back to. Returns (checkpoint lines, lines of N).
+        """
+        if self.isSimple(N):
+            return ([], self.emitNode(N, ["break"], ctx, loops + 1))
+        p = self.newVar(ctx, 'p')
+        k = self.newVar(ctx, 'k')
+        fail = self.restoreLines(p, k, ctx) + ["break"]
+        body = self.emitNode(N, fail, ctx, loops + 1)
+        return ([p + " = pos", k + " = len(childs)"], body)
+
+    def emitHelper(self, N, ctx):
+        """
+        Emits N as a method of its own, once for every node that prints the
+        same, and returns its name.
+        """
+        key = repr(N)
+        if key not in self.helpers:
+            name = "parsehelper_" + str(self.hidx)
+            self.hidx = self.hidx + 1
+            self.helpers[key] = name
+            hctx = self.newContext()
+            body = self.emitNode(N, self.returnLines(hctx), hctx, 0)
+            m = """
+    def {0}(self):
+        \"\"\" ## subexpr ##
+        {1}
+        \"\"\"
+""".format(name, key)
+            m += indent(self.prologue(hctx) + ["startpos = pos", "childs = []"] + body +
+                ["self.pos = pos", "return childs"], " " * 8) + "\n"
+            self.methods.append(m)
+        return self.helpers[key]
+
+    def emitRule(self, name, fail, ctx, loops):
+        """
+        Lines of the rule name inlined, building its node like parse_<rule>.
+        """
+        self.inlining.add(name)
+        s = self.newVar(ctx, 's')
+        k = self.newVar(ctx, 'k')
+        n = self.newVar(ctx, 'n')
+        ctx['uses'].add('arena')
+        m = [
+            "# " + name + " (inline)",
+            "if not {0:#x} >> tclasses[pos] & 1: # FIRST[{1}]".format(self.mask(self.G.FIRST(name)), repr(name)),
+        ] + indent_lines(fail) + [
+            s + " = pos",
+            k + " = len(childs)",
+            "if arena is None:",
+            "    {0} = astnode({1})".format(n, repr(name)),
+        ]
+        m += self.emitBody(name, self.G.G[name], fail, ctx, loops)
+        m += [
+            "if self.compact and len(childs) == {0} + 1:".format(k),
+            "    pass",
+            "elif arena is None:",
+            "    {0}.childs = childs[{1}:]".format(n, k),
+            "    for x in {0}.childs:".format(n),
+            "        x.parent = {0}".format(n),
+            "    del childs[{0}:]".format(k),
+            "    childs.append({0})".format(n),
+            "else:",
+            "    x = arena.add_node({0}, childs[{1}:], {2}, pos)".format(repr(name), k, s),
+            "    del childs[{0}:]".format(k),
+            "    childs.append(x)",
+        ]
+        self.inlining.remove(name)
+        return m
+
+    def emitNode(self, N, fail, ctx, loops):
+        """
+        Returns the lines matching N inline. loops is the number of loops
+        they are nested in; past MAX_LOOPS nodes go to a helper method, as
+        Python limits how deep blocks can nest.
+        """
+        if type(N) is str:
+            if self.G.isTerminal(N):
+                m = ["if tclasses[pos] != {0}: # {1}".format(self.termClass(N), repr(N))]
+                return m + indent_lines(fail) + self.emitLeaf(N, ctx)
+            if N in self.inline_rules and N not in self.inlining:
+                return self.emitRule(N, fail, ctx, loops)
+            return self.emitCall("parse_" + N, fail, False)
+
+        assert type(N) is GrammarNode
+        if N.type == 'S':
+            assert type(N.data) is list
+            m = []
+            for x in N.data:
+                m += self.emitNode(x, fail, ctx, loops)
+            return m
+
+        if loops >= MAX_LOOPS:
+            return self.emitCall(self.emitHelper(N, ctx), fail, True)
+
+        if N.type == 'A':
+            assert type(N.data) is list
+            alts = sorted(N.data, key=self.alt_key, reverse=True)
+            if len([x for x in alts if self.G.NULLABLE(x)]) == 0:
+                return self.emitDispatch(alts, fail, ctx, loops)
+            return self.emitTrials(alts, fail, ctx, loops)
+        elif N.type == '[':
+            assert type(N.data) is GrammarNode
+            check = self.firstCheck(N.data)
+            if type(N.data.data) is list and len(N.data.data) == 1 and type(N.data.data[0]) is str \
+                and self.G.isTerminal(N.data.data[0]):
+                # A single optional terminal.
+                x = N.data.data[0]
+                return ["if tclasses[pos] == {0}: # {1}".format(self.termClass(x), repr(x))] + \
+                    indent_lines(self.emitLeaf(x, ctx))
+            checkpoint, body = self.emitRecover(N.data, ctx, loops)
+            m = ["# [-type (opt)", "while True:"]
+            if check is not None:
+                m += ["    if not {0:#x} >> tclasses[pos] & 1:".format(check), "        break"]
+            return m + indent_lines(checkpoint + body + ["break"])
+        elif N.type == '*' or N.type == '+':
+            assert type(N.data) is GrammarNode
+            check = self.firstCheck(N.data)
+            checkpoint, body = self.emitRecover(N.data, ctx, loops)
+            if N.type == '*':
+                m = ["# *-type (0+)"]
+            else:
+                i = self.newVar(ctx, 'i')
+                m = ["# +-type (1+)", i + " = 0"]
+                body = body + [i + " = " + i + " + 1"]
+            m += ["while True:"]
+            if check is not None:
+                m += ["    if not {0:#x} >> tclasses[pos] & 1:".format(check), "        break"]
+            m += indent_lines(checkpoint + body)
+            if N.type == '+':
+                m += ["if " + i + " == 0:"] + indent_lines(fail)
+            return m
+        assert False
+
+    def emitDispatch(self, alts, fail, ctx, loops):
+        """
+        Lines of the alternatives alts of an A-type node, none of which can
+        match nothing, picked by the class of the next token. A class only
+        one alternative can start with goes straight to it, and if that
+        fails so does the node. The classes more than one can start with
+        try those in order, see emitTrials.
+        """
+        masks = [self.mask(self.G.FIRST(x)) for x in alts]
+        seen = 0
+        conflict = 0
+        for m in masks:
+            conflict = conflict | (seen & m)
+            seen = seen | m
+
+        # (classes, lines) of each branch, then the failing one.
+        branches = []
+        for x, m in zip(alts, masks):
+            if m & ~conflict:
+                branches.append((m & ~conflict, self.emitPredicted(x, fail, ctx, loops)))
+        if conflict:
+            trials = [x for x, m in zip(alts, masks) if m & conflict]
+            branches.append((conflict, self.emitTrials(trials, fail, ctx, loops)))
+
+        if len(branches) <= 2:
+            m = ["# A-type, by token class"]
+            for i, (classes, body) in enumerate(branches):
+                if i == 0:
+                    m.append("if {0:#x} >> tclasses[pos] & 1:".format(classes))
+                else:
+                    m.append("elif {0:#x} >> tclasses[pos] & 1:".format(classes))
+                m += indent_lines(body)
+            return m + ["else:"] + indent_lines(fail)
+
+        table = {}
+        for i, (classes, body) in enumerate(branches):
+            for c in range(len(self.class_gstrs)):
+                if classes >> c & 1:
+                    table[c] = i
+        # Tables with the same contents are emitted once.
+        key = tuple(sorted(table.items()))
+        name = self.dispatch_names.get(key)
+        if name is None:
+            name = "DISPATCH_" + str(len(self.dispatch))
+            self.dispatch_names[key] = name
+            self.dispatch.append(table)
+        d = self.newVar(ctx, 'd')
+        bodies = [body for classes, body in branches] + [fail]
+        return ["# A-type, by token class",
+            "{0} = {1}.get(tclasses[pos], {2})".format(d, name, len(branches))] + \
+            self.emitSwitch(d, bodies, 0, len(bodies))
+
+    def emitSwitch(self, d, bodies, lo, hi):
+        """
+        Lines running bodies[v] for the value v of d, with lo <= v < hi.
+        """
+        if hi - lo == 1:
+            return bodies[lo]
+        if hi - lo > 3:
+            mid = (lo + hi) // 2
+            return ["if {0} < {1}:".format(d, mid)] + indent_lines(self.emitSwitch(d, bodies, lo, mid)) + \
+                ["else:"] + indent_lines(self.emitSwitch(d, bodies, mid, hi))
+        m = ["if {0} == {1}:".format(d, lo)] + indent_lines(bodies[lo])
+        for v in range(lo + 1, hi - 1):
+            m += ["elif {0} == {1}:".format(d, v)] + indent_lines(bodies[v])
+        return m + ["else:"] + indent_lines(bodies[hi - 1])
+
+    def emitPredicted(self, N, fail, ctx, loops):
+        """
+        Lines of the alternative N once the class of the next token picked
+        it. If N starts with a terminal, that token is already checked.
+        """
+        N = unwrap(N)
+        if type(N) is str and self.G.isTerminal(N):
+            return self.emitLeaf(N, ctx)
+        if type(N) is GrammarNode and N.type == 'S':
+            first = unwrap(N.data[0])
+            if type(first) is str and self.G.isTerminal(first):
+                m = self.emitLeaf(first, ctx)
+                for x in N.data[1:]:
+                    m += self.emitNode(x, fail, ctx, loops)
+                return m
+        return self.emitNode(N, fail, ctx, loops)
+
+    def emitTrials(self, alts, fail, ctx, loops):
+        """
+        Lines trying the alternatives alts of an A-type node in order, from
+        a checkpoint, until one matches.
+        """
+        ok = self.newVar(ctx, 'ok')
+        m = ["# A-type", ok + " = False"]
+        if len([x for x in alts if not self.isSimple(x)]) > 0:
+            p = self.newVar(ctx, 'p')
+            k = self.newVar(ctx, 'k')
+            altfail = self.restoreLines(p, k, ctx) + ["break"]
+            m += [p + " = pos", k + " = len(childs)"]
+        for i, x in enumerate(alts):
+            cond = []
+            if i > 0:
+                cond.append("not " + ok)
+            check = self.firstCheck(x)
+            if check is not None:
+                cond.append("{0:#x} >> tclasses[pos] & 1".format(check))
+            if self.isSimple(x):
+                body = self.emitNode(x, ["break"], ctx, loops + 1)
+            else:
+                body = self.emitNode(x, altfail, ctx, loops + 1)
+            body = ["while True:"] + indent_lines(body + [ok + " = True", "break"])
+            if len(cond) > 0:
+                m += ["if " + " and ".join(cond) + ":"] + indent_lines(body)
+            else:
+                m += body
+        return m + ["if not " + ok + ":"] + indent_lines(fail)
+
+    def newContext(self):
+        # vidx numbers the locals of a method, uses has the locals its
+        # prologue sets up.
+        return {'vidx': 0, 'uses': set()}
+
+    def prologue(self, ctx):
+        m = ["tclasses = self.tclasses", "pos = self.pos"]
+        if 'toks' in ctx['uses']:
+            m.append("toks = self.toks")
+        if 'arena' in ctx['uses']:
+            m.append("arena = self.arena")
+        if 'drop' in ctx['uses']:
+            m.append("drop = self.drop_punctuation")
+        return m
+
+    def findCutRules(self):
+        """
+        Finds the rules that commit after their first terminal. If that
+        terminal appears nowhere else in the grammar, its token can only be
+        matched by this rule starting there, and a rule parses the same
+        whenever it starts at the same token; so if the rest fails, no
+        parse can consume the token and the input has a syntax error. This
+        holds for parses that must consume every token, like file_input.
+        """
+        count = {}
+        def walk(N):
+            if type(N) is str:
+                if self.G.isTerminal(N):
+                    count[N] = count.get(N, 0) + 1
+            elif type(N.data) is list:
+                for x in N.data:
+                    walk(x)
+            else:
+                walk(N.data)
+        for x in self.G.productions:
+            walk(x[2])
+
+        for x in self.G.productions:
+            N = unwrap(x[2])
+            if type(N) is GrammarNode and N.type == 'S':
+                first = unwrap(N.data[0])
+                if type(first) is str and self.G.isTerminal(first) and count[first] == 1:
+                    self.cut_rules.add(x[0])
+
+    def emitBody(self, name, N, fail, ctx, loops):
+        """
+        Lines of the body N of the rule name. Past the commit point of a
+        rule in cut_rules, failing raises a ParseError.
+        """
+        if name not in self.cut_rules:
+            return self.emitNode(N, fail, ctx, loops)
+        N = unwrap(N)
+        cut = ["raise self.syntax_error({0}, pos)".format(repr(name))]
+        m = self.emitNode(N.data[0], fail, ctx, loops)
+        for x in N.data[1:]:
+            m += self.emitNode(x, cut, ctx, loops)
+        return m
+
+    def opTerminals(self, N):
+        """
+        Returns the terminals of N if it is a terminal or a choice between
+        terminals, else None.
+        """
+        N = unwrap(N)
+        if type(N) is str:
+            if self.G.isTerminal(N):
+                return [N]
+            return None
+        if N.type != 'A':
+            return None
+        terms = [unwrap(x) for x in N.data]
+        if len([x for x in terms if type(x) is not str or not self.G.isTerminal(x)]) > 0:
+            return None
+        return terms
+
+    def precLevel(self, name):
+        """
+        Returns (kind, next rule, operators) if the rule name is a level of
+        the expression rules, else None. kind is 'B' for "R: C (op C)*",
+        with operators a list of terminals or a rule name, or 'P' for
+        "R: op R | C", with operators a list of terminals.
+        """
+        N = unwrap(self.G.G[name])
+        if type(N) is not GrammarNode or type(N.data) is not list or len(N.data) != 2:
+            return None
+        if N.type == 'S':
+            C = unwrap(N.data[0])
+            R = N.data[1]
+            if type(C) is not str or self.G.isTerminal(C) or type(R) is not GrammarNode or R.type != '*':
+                return None
+            R = unwrap(R.data)
+            if type(R) is not GrammarNode or R.type != 'S' or len(R.data) != 2 or unwrap(R.data[1]) != C:
+                return None
+            op = unwrap(R.data[0])
+            terms = self.opTerminals(op)
+            if terms is not None:
+                return ('B', C, terms)
+            if type(op) is str:
+                return ('B', C, op)
+            return None
+        if N.type == 'A':
+            for i in range(2):
+                C = unwrap(N.data[i])
+                R = unwrap(N.data[1 - i])
+                if type(C) is str and C != name and not self.G.isTerminal(C) and \
+                    type(R) is GrammarNode and R.type == 'S' and len(R.data) == 2 and \
+                    unwrap(R.data[1]) == name and self.opTerminals(R.data[0]) is not None:
+                    return ('P', C, self.opTerminals(R.data[0]))
+        return None
+
+    def findPrecRules(self):
+        """
+        Finds the longest chain of expression rules, each a level of
+        precedence passing to the next, to parse by precedence climbing;
+        see parser_base.climb. The chain is only taken if climbing parses
+        it the same as the recursive descent: the binary operators of
+        different levels never share a token class, and a prefix operator
+        can not start the rule after it.
+        """
+        levels = {}
+        for x in self.G.productions:
+            lv = self.precLevel(x[0])
+            if lv is not None:
+                levels[x[0]] = lv
+        nexts = set([lv[1] for lv in levels.values()])
+
+        chain = []
+        for x in self.G.productions:
+            if x[0] not in levels or x[0] in nexts:
+                continue
+            c = [x[0]]
+            while levels[c[-1]][1] in levels and levels[c[-1]][1] not in c:
+                c.append(levels[c[-1]][1])
+            if len(c) > len(chain):
+                chain = c
+        if len(chain) < 2:
+            return
+
+        seen = 0
+        for name in chain:
+            kind, C, ops = levels[name]
+            if type(ops) is str:
+                m = self.mask(self.G.FIRST(ops))
+            else:
+                m = self.mask(ops)
+                if len([x for x in ops if x[0] == "'" and x[1:-1] in parserbase.PUNCTUATION]) > 0:
+                    return
+            if kind == 'B':
+                if seen & m:
+                    return
+                seen = seen | m
+            elif m & self.mask(self.G.FIRST(C)):
+                return
+        self.prec = [(name, levels[name][0], levels[name][2]) for name in chain]
+        self.prec_bottom = levels[chain[-1]][1]
+
+    def precTables(self):
+        """
+        Returns the lines of the PREC_* tables of parser_base.climb.
+        """
+        prefix = []
+        ops = {}
+        for i, (name, kind, terms) in enumerate(self.prec):
+            if kind == 'P':
+                prefix.append(dict([(self.termClass(x), x) for x in terms]))
+                continue
+            prefix.append(None)
+            if type(terms) is str:
+                m = self.mask(self.G.FIRST(terms))
+                for c in range(len(self.class_gstrs)):
+                    if m >> c & 1:
+                        ops[c] = (i, 'parse_' + terms, True)
+            else:
+                for x in terms:
+                    ops[self.termClass(x)] = (i, x, False)
+        return ("# Expression rules parsed by precedence climbing, see parser_base.climb.\n"
+            "PREC_RULES=" + pprint.pformat([x[0] for x in self.prec]) + "\n"
+            "PREC_BOTTOM=" + repr('parse_' + self.prec_bottom) + "\n"
+            "PREC_PREFIX=" + pprint.pformat(prefix) + "\n"
+            "PREC_OPS=" + pprint.pformat(ops) + "\n")
+
+    def findInlineRules(self):
+        """
+        Rules referenced from one place only, other than themselves and the
+        commit rule of packrat mode, are inlined there.
+        """
+        refs = {}
+        def walk(N, rule):
+            if type(N) is str:
+                if not self.G.isTerminal(N):
+                    refs[N] = refs.get(N, 0) + 1
+                    if N == rule:
+                        refs[N] = refs[N] + 1
+                return
+            if type(N.data) is list:
+                for x in N.data:
+                    walk(x, rule)
+            else:
+                walk(N.data, rule)
+        for x in self.G.productions:
+            walk(x[2], x[0])
+        self.inline_rules = set([x for x, n in refs.items() if n == 1 and
+            'parse_' + x != parserbase.parser_base.commit_rule])
+        self.inline_rules = self.inline_rules - set([x[0] for x in self.prec])
+
+    def emitParseRule(self, x, p):
+        levels = [y[0] for y in self.prec]
+        if x[0] in levels:
+            self.emitPrecRule(x, p, levels.index(x[0]))
+            return
+        ctx = self.newContext()
+        self.inlining = set([x[0]])
+        body = self.emitBody(x[0], x[2], self.returnLines(ctx), ctx, 0)
+        m = """
+    def parse_{0}(self):
+        \"\"\"
+{1}
+        
+{2}
+        \"\"\"
+""".format(x[0],                                        # 0
+            indent(textwrap.wrap(p), " " * 8),          # 1
+            indent(textwrap.wrap(repr(x)), " " * 8))    # 2
+        pro = self.prologue(ctx)
+        m += indent(pro[:2] + [
+            "if not {0:#x} >> tclasses[pos] & 1: # FIRST[{1}]".format(self.mask(self.G.FIRST(x[0])), repr(x[0])),
+            "    return None",
+        ] + pro[2:] + [
+            "if arena is None:",
+            "    node = astnode({0})".format(repr(x[0])),
+            "    childs = node.childs",
+            "else:",
+            "    childs = []",
+            "startpos = pos",
+        ] + body + [
+            "self.pos = pos",
+            "if self.compact and len(childs) == 1:",
+            "    return childs[0]",
+            "if arena is not None:",
+            "    return arena.add_node({0}, childs, startpos, pos)".format(repr(x[0])),
+            "for x in childs:",
+            "    x.parent = node",
+            "return node",
+        ], " " * 8) + "\n"
+        self.methods.append(m)
+
+    def emitPrecRule(self, x, p, level):
+        m = """
+    def parse_{0}(self):
+        \"\"\"
+{1}
+        
+{2}
+        \"\"\"
+        if not {3:#x} >> self.tclasses[self.pos] & 1: # FIRST[{4}]
+            return None
+        return self.climb({5})
+""".format(x[0],                                        # 0
+            indent(textwrap.wrap(p), " " * 8),          # 1
+            indent(textwrap.wrap(repr(x)), " " * 8),    # 2
+            self.mask(self.G.FIRST(x[0])),              # 3
+            repr(x[0]),                                 # 4
+            level)                                      # 5
+        self.methods.append(m)
+
+    def codeReport(self):
+        """
+        Returns comment lines with the size of the generated methods and the
+        frames the parser nests for each level of parentheses.
+        """
+        calls = {}
+        lines = 0
+        for m in self.methods:
+            lines = lines + m.strip("\n").count("\n") + 1
+            name = m[m.find("def ") + 4:m.find("(self)")]
+            calls[name] = set()
+            i = m.find("self.parse")
+            while i >= 0:
+                j = m.find("(", i)
+                calls[name].add(m[i + 5:j])
+                i = m.find("self.parse", j)
+            if "self.climb(" in m:
+                calls[name].add('climb')
+        # parser_base.climb calls the bottom rule and the rule operators.
+        calls['climb'] = set(['parse_' + x[2] for x in self.prec if type(x[2]) is str])
+        if self.prec_bottom is not None:
+            calls['climb'].add('parse_' + self.prec_bottom)
+
+        # Shortest cycle from parse_test back to itself through the method
+        # building the atom node, as in "((x))".
+        depth = None
+        for name, m in zip(calls, self.methods):
+            if "astnode('atom')" in m:
+                a = distance(calls, 'parse_test', name)
+                b = distance(calls, name, 'parse_test')
+                if a is not None and b is not None and (depth is None or a + b < depth):
+                    depth = a + b
+
+        helpers = len([x for x in calls if x.startswith('parsehelper_')])
+        picked = sum([m.count("# A-type, by token class\n") for m in self.methods])
+        tried = sum([m.count("# A-type\n") for m in self.methods])
+        return ("# {0} methods ({1} helpers), {2} lines\n"
+            "# {3} frames for each level of '(' nesting\n"
+            "# {4} choices picked by token class, {5} tried in order\n").format(
+            len(self.methods), helpers, lines, depth, picked, tried)
+
+    def load_grammar(self):
         self.G = grammarparse.parse_grammar_file('Grammar')
+
+        # Keywords and operators get token classes after the token IDs.
+        for i, x in enumerate(sorted(self.G.special_terminals)):
+            self.keywords[x[1:-1]] = tokenizer.T_N_TOKENS + i
+
+        # The token ID classes, then the keyword classes. A token of a
+        # keyword class only matches the keyword: the NAME terminal does
+        # not take keywords, and no other terminal takes an operator.
+        for x in tokenizer.TOK_NAMES:
+            self.class_gstrs.append(frozenset([x]))
+        for x in sorted(self.keywords, key=self.keywords.get):
+            self.class_gstrs.append(frozenset(["'" + x + "'"]))
+        for c, gstrs in enumerate(self.class_gstrs):
+            for x in gstrs:
+                self.class_bits[x] = self.class_bits.get(x, 0) | (1 << c)
+
+    def run(self):
+        self.load_grammar()
+
         self.header = ("""#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 #
@@ -297,28 +1038,54 @@ from pppp.parserbase import astnode
 
 SPECIAL_NAMES = {0}
 
-""".format(self.G.special_terminals))
+# Token class of each keyword and operator. Any other token has its token
+# ID as class.
+KEYWORDS = {1}
+
+""".format(self.G.special_terminals, pprint.pformat(self.keywords)))
 
-        self.header += "FIRST=" + pprint.pformat(dict([(x[0], self.G.FIRST(x[0])) for x in self.G.productions]))
+        # FIRST sets as token class bit masks.
+        self.header += "FIRST=" + pprint.pformat(dict([(x[0], self.mask(self.G.FIRST(x[0]))) for x in self.G.productions]))
         self.header += """\n"""
 
         self.header2 = ("""
 class parser(parserbase.parser_base):
-    def __init__(self, toks):
-        parserbase.parser_base.__init__(self, toks)
+    def __init__(self, toks, packrat=False, compact=False, punctuation=True, arena=False):
+        parserbase.parser_base.__init__(self, toks, packrat, compact, punctuation, arena)
         
+    keywords = KEYWORDS
+
     def is_special_name(self, name):
         return name in SPECIAL_NAMES
 """.format())
     
+        if self.optimize:
+            self.findPrecRules()
+            self.findInlineRules()
+            self.findCutRules()
+        if len(self.prec) > 0:
+            self.header += "\n" + self.precTables()
+            self.header2 += """
+    prec_rules = PREC_RULES
+    prec_bottom = PREC_BOTTOM
+    prec_prefix = PREC_PREFIX
+    prec_ops = PREC_OPS
+"""
+
         for x, p in zip(self.G.productions, self.G.productions_text):
             #print(x)
             #print(p)
             #print()
             assert type(x[2]) is GrammarNode
 
+            if self.optimize:
+                self.emitParseRule(x, p)
+                continue
+
             subexp = self.parseSubexpr(x[2], {})
             
+            # The node is allocated before its children: with the tree in
+            # allocation order the garbage collector walks it faster.
             m = ("""
     def parse_{0}(self):
         \"\"\"
@@ -326,37 +1093,45 @@ class parser(parserbase.parser_base):
         
 {2}
         \"\"\"
-        node = astnode('{0}')
-        if self.tok_peek_gstr().isdisjoint(FIRST[{3}]):
+        if not {3:#x} >> self.tclasses[self.pos] & 1: # FIRST[{5}]
             return None
-        #
+        if self.arena is None:
+            node = astnode('{0}')
         startpos = self.pos
-        c = self.{4}(node)
+        c = self.{4}()
         if c is None:
             self.pos = startpos
             return None
 """.format(x[0],                                        # 0
             indent(textwrap.wrap(p), " " * 8),          # 1
             indent(textwrap.wrap(repr(x)), " " * 8),    # 2
-            repr(x[0]),                                 # 3
-            subexp))                                    # 4
+            self.mask(self.G.FIRST(x[0])),              # 3
+            subexp,                                     # 4
+            repr(x[0])))                                # 5
         
             m += ("""
+        if self.compact and len(c) == 1:
+            return c[0]
+        if self.arena is not None:
+            return self.arena.add_node({0}, c, startpos, self.pos)
         for x in c:
             node.addchild(x)
         return node
-""")
+""".format(repr(x[0])))
         
             self.methods.append(m)
 
         print(self.header)
+        print(self.codeReport())
         #print('\n'.join(("TABLE_" + str(i) + "=" + repr(x)) for i, x in enumerate(self.tables)))
         print("""TABLE=""" + pprint.pformat(self.tables))
+        for i, x in enumerate(self.dispatch):
+            print("DISPATCH_{0}={1}".format(i, pprint.pformat(x)))
         print(self.header2)
         print('\n\n'.join(map(lambda x: x.strip("\n").rstrip(), self.methods)))
 
 def main():
-    pg = parser_gen()
+    pg = parser_gen(optimize=('--no-inline' not in sys.argv))
     pg.run()
     
 if __name__ == '__main__':
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Streaming parse. iter_statements reads the tokens of a source as it parses
+it and yields the tree of each statement at the top level as soon as it is
+complete, instead of one file_input tree for the whole source. The parser
+only holds the tokens of the statements not yet yielded, plus a few lines
+of lookahead.
+"""
+
+from . import tokenizer
+from . import parser
+from .arena import Arena
+from .parserbase import ParseError
+
+def read_units(tokens):
+    """
+    Splits the token iterator tokens into units, each from the first token
+    of a line at indentation level 0 up to the first token of the next one.
+    A statement at the top level is made of whole units: one, or more for a
+    decorated definition or an if statement with an else clause. Yields
+    each unit as a list of tokens.
+    """
+    unit = []
+    depth = 0
+    prev = tokenizer.T_NEWLINE
+    for t in tokens:
+        if depth == 0 and (prev == tokenizer.T_NEWLINE or prev == tokenizer.T_DEDENT) \
+            and t[0] != tokenizer.T_INDENT and len(unit) > 0:
+            yield unit
+            unit = []
+        if t[0] == tokenizer.T_INDENT:
+            depth = depth + 1
+        elif t[0] == tokenizer.T_DEDENT:
+            depth = depth - 1
+        unit.append(t)
+        prev = t[0]
+    if len(unit) > 0:
+        yield unit
+
+def iter_statements(source, packrat=False, compact=False, punctuation=True, arena=False):
+    """
+    Parses source, a str or a binary file object, and yields the node of
+    each statement at the top level: the same nodes as the stmt childs of
+    parse_file_input, but without a parent. In arena mode they are NodeView
+    objects, each one of an Arena of its own that holds the tokens of its
+    statement only. A syntax error raises ParseError, with pos counted from
+    the first token of source.
+
+    A statement is parsed with the unit after it read too, since the parser
+    looks past its end for a clause that may continue it, like an else.
+    If it takes every unit read, the number of units read is doubled and
+    the statement parsed again.
+    """
+    if type(source) is str:
+        tokens = tokenizer.generate_tokens(iter([source]))
+    else:
+        tokens = tokenizer.tokenize_stream(source)
+    units = read_units(tokens)
+
+    p = parser.parser([], packrat, compact, punctuation)
+    base = 0      # Index in source of the token p.toks[0]
+    ends = []     # Index in p.toks past the end of each unit read
+    ended = False # The ENDMARKER was read
+    need = 2
+
+    while True:
+        while len(ends) < need and not ended:
+            unit = next(units, None)
+            if unit is None:
+                ended = True
+            else:
+                p.push_tokens(unit)
+                ends.append(len(p.toks))
+                ended = unit[-1][0] == tokenizer.T_ENDMARKER
+
+        # The NEWLINE tokens between statements, as in file_input.
+        n = 0
+        while p.tclasses[n] == tokenizer.T_NEWLINE:
+            n = n + 1
+        if n > 0:
+            p.release_tokens(n)
+            base = base + n
+            ends = [x - n for x in ends if x > n]
+        if len(p.toks) == 0 and not ended:
+            need = 2
+            continue
+        if len(p.toks) == 0 or p.tclasses[0] == tokenizer.T_ENDMARKER:
+            return
+
+        p.pos = 0
+        if p.memo is not None:
+            p.memo = {}
+        if arena:
+            p.arena = Arena(p.toks)
+            p.arena.trimming = p.memo is None
+        # Start of the last unit read.
+        if len(ends) >= 2:
+            last = ends[-2]
+        else:
+            last = 0
+
+        try:
+            node = p.parse_stmt()
+        except ParseError as e:
+            if ended or e.pos < last:
+                e.pos = e.pos + base
+                raise
+            node = None
+
+        if not ended and (node is None or p.pos == len(p.toks)):
+            need = 2 * len(ends)
+            continue
+        if node is None:
+            e = p.syntax_error('file_input', 0)
+            e.pos = e.pos + base
+            raise e
+
+        n = p.pos
+        if arena:
+            p.arena.toks = p.toks[:n]
+            node = p.arena.view(node)
+            p.arena = None
+        p.release_tokens(n)
+        base = base + n
+        ends = [x - n for x in ends if x > n]
+        need = 2
+        yield node
@@ -7,6 +7,9 @@
 # This is the tokenizer in pure python, without the use of regular 
 # expressions.
 
+import codecs
+from array import array
+
 # UTF BOMs magic bytes.
 BOM_UTF8 = b'\xef\xbb\xbf'
 BOM_UTF16_LE = b'\xff\xfe'
@@ -199,11 +202,54 @@ P_LETTERS_DIGITS = P_LETTERS.union(P_DIGITS)
 P_LETTERS_UNDER = P_LETTERS.union("_")
 P_LETTERS_DIGITS_UNDER = P_LETTERS_DIGITS.union("_")
 
+P_QUOTES = set(["'", '"'])
+
+# The same character sets as str, for span().
+S_WHITESPACE = P_WHITESPACE
+S_DIGITS = ''.join(sorted(P_DIGITS))
+S_DIGITS_HEX = ''.join(sorted(P_DIGITS_HEX))
+S_DIGITS_OCT = ''.join(sorted(P_DIGITS_OCT))
+S_LETTERS_DIGITS_UNDER = ''.join(sorted(P_LETTERS_DIGITS_UNDER))
+
+# Characters looked at by each step of span().
+SPAN_WINDOW = 32
+
 STR_PREFIXES = None
-STR_PREFIXES_LEN = None
+STR_PREFIX_PAIRS = None
+
+# Character classes. The tokenizer main loop dispatches on the class of the
+# first character of each token.
+C_OTHER = 0
+C_SPACE = 1
+C_NEWLINE = 2
+C_BACKSLASH = 3
+C_COMMENT = 4
+C_DIGIT = 5
+C_DOT = 6       # Number or operator
+C_OP = 7
+C_QUOTE = 8
+C_PREFIX = 9    # Name or string prefix
+C_LETTER = 10
+
+CHAR_CLASS = None
+
+# Operators trie. Maps a character to a [token ID, trie] pair; the token ID
+# is None for prefixes that are not an operator by themselves, like '..'.
+OP_TRIE = None
+
+# Bracket tokens, they change the nesting level.
+OPEN_BRACKETS = frozenset([T_LPAR, T_LSQB, T_LBRACE])
+CLOSE_BRACKETS = frozenset([T_RPAR, T_RSQB, T_RBRACE])
+
+# Bytes read at a time by tokenize_stream.
+CHUNK_SIZE = 64 * 1024
+
+# Characters given at a time to generate_tokens by retokenize, which
+# usually stops after a few lines.
+RESCAN_CHUNK_SIZE = 4 * 1024
 
 def init_tables():
-    global STR_PREFIXES, STR_PREFIXES_LEN
+    global STR_PREFIXES, STR_PREFIX_PAIRS, CHAR_CLASS, OP_TRIE
     
     # (T_STRING, r"(([ruRU]|[bB]|[bB][rR]|[rR][bB])?'''([^\\]|\\.)*?''')"),
     # (T_STRING, r'(([ruRU]|[bB]|[bB][rR]|[rR][bB])?"""([^\\]|\\.)*?""")'),
@@ -223,7 +269,32 @@ def init_tables():
     for y in STR_PREFIX2:
         STR_PREFIXES.add(y)
 
-    STR_PREFIXES_LEN = sorted(set(map(len, STR_PREFIXES)), reverse=True)
+    STR_PREFIX_PAIRS = set([x for x in STR_PREFIX1 if len(x) == 2])
+
+    CHAR_CLASS = {}
+    for op in TOK_STR:
+        CHAR_CLASS[op[0]] = C_OP
+    for c in P_LETTERS_UNDER:
+        CHAR_CLASS[c] = C_LETTER
+    for x in STR_PREFIX1:
+        CHAR_CLASS[x[0]] = C_PREFIX
+    for c in P_DIGITS:
+        CHAR_CLASS[c] = C_DIGIT
+    for c in P_QUOTES:
+        CHAR_CLASS[c] = C_QUOTE
+    for c in P_WHITESPACE:
+        CHAR_CLASS[c] = C_SPACE
+    CHAR_CLASS['.'] = C_DOT
+    CHAR_CLASS['\n'] = C_NEWLINE
+    CHAR_CLASS['\\'] = C_BACKSLASH
+    CHAR_CLASS['#'] = C_COMMENT
+
+    OP_TRIE = {}
+    for op, tok_id in TOK_STR.items():
+        trie = OP_TRIE
+        for c in op[:-1]:
+            trie = trie.setdefault(c, [None, {}])[1]
+        trie.setdefault(op[-1], [None, {}])[0] = tok_id
 
 def detect_encoding(S):
     # http://www.python.org/dev/peps/pep-0263/
@@ -278,66 +349,220 @@ def detect_encoding(S):
         i = i + 1
     return None
 
-def get_next_op_len(S, i):
-    if S[i:i+3] in TOK_STR:
-        return 3
-    if S[i:i+2] in TOK_STR:
-        return 2
-    if S[i:i+1] in TOK_STR:
-        return 1
-    return 0
+def match_op(S, i):
+    """
+    Returns the (token ID, length) of the longest operator at S[i:], or
+    (None, 0) if there is none.
+    """
+    op_id, trie = OP_TRIE.get(S[i], (None, None))
+    if trie is None:
+        return None, 0
+    op_len = 1
+    p = i + 1
+    while p < len(S) and S[p] in trie:
+        op_id2, trie = trie[S[p]]
+        p = p + 1
+        if op_id2 is not None:
+            op_id = op_id2
+            op_len = p - i
+    if op_id is None:
+        return None, 0
+    return op_id, op_len
 
-def is_next_string(S, i):
-    for n in STR_PREFIXES_LEN:
-        if S[i:i+n] in STR_PREFIXES:
-            return S[i:i+n]
-    return None
-    
-def tokenize_file(file_name):
-    if STR_PREFIXES is None:
-        init_tables()
+def span(S, i, chars):
+    """
+    Returns the end of the run of characters in chars that starts at S[i].
+    Each step strips a window of SPAN_WINDOW characters with str.lstrip
+    instead of testing them one at a time.
+    """
+    p = i
+    while True:
+        W = S[p:p+SPAN_WINDOW]
+        n = len(W.lstrip(chars))
+        if n > 0 or len(W) < SPAN_WINDOW:
+            return p + len(W) - n
+        p = p + SPAN_WINDOW
 
+def read_source(file_name, verbose=False):
+    """
+    Reads file_name and returns its contents decoded as str. With verbose
+    set, prints the encoding.
+    """
     with open(file_name, 'rb') as f:
         S = f.read()
+
+    return decode_source(S, verbose)
+
+def decode_source(S, verbose=False):
+    """
+    Decodes the bytes S of a source file as str, in the encoding it
+    declares, or else UTF-8.
+    """
+    encoding = source_encoding(S)
+
+    if verbose:
+        print("Encoding: " + encoding)
     
-    # Detect file encoding
+    return S.decode(encoding)
+
+def source_encoding(S):
+    """
+    The encoding the bytes S of a source file declare, or else UTF-8.
+    """
     encoding = detect_encoding(S)
     if encoding is None:
         encoding = 'utf-8'
+    return encoding
+
+def tokenize_file(file_name, compact=False, verbose=False):
+    """
+    Returns the tokens of file_name as a list of tuples, or as a TokenBuffer
+    if compact is True. verbose is passed to read_source. If the cache is
+    enabled, they are loaded from it when there; see cache.enable.
+    """
+    from . import cache
+
+    if cache.current is not None:
+        return cache.current.tokenize_file(file_name, compact, verbose)
+    return tokenize_source(read_source(file_name, verbose), compact)
+
+def tokenize_source(S, compact=False):
+    """
+    Tokenizes the str S like tokenize_file.
+    """
+    if compact:
+        return tokenize_buffer(S)
+    return list(generate_tokens(iter([S])))
+
+def tokenize_buffer(S):
+    """
+    Tokenizes the str S into a TokenBuffer.
+    """
+    toks = TokenBuffer(S)
+    for t in generate_tokens(iter([S])):
+        toks.append(t)
+    return toks
+
+def tokenize_stream(fileobj, chunk_size=CHUNK_SIZE):
+    """
+    Generator version of tokenize_file. Reads the binary file object fileobj
+    in chunks of chunk_size bytes, decodes them incrementally and yields the
+    same tokens as they are found.
+    """
+    if STR_PREFIXES is None:
+        init_tables()
+
+    # The encoding declaration must be in the first two lines.
+    head = fileobj.read(chunk_size)
+    while head.count(b'\n') < 2:
+        data = fileobj.read(chunk_size)
+        if not data:
+            break
+        head += data
+
+    encoding = detect_encoding(head)
+    if encoding is None:
+        encoding = 'utf-8'
+
+    yield from generate_tokens(read_chunks(fileobj, encoding, head, chunk_size))
+
+def read_chunks(fileobj, encoding, head=b'', chunk_size=CHUNK_SIZE):
+    """
+    Reads fileobj and yields decoded str chunks. head are bytes already read
+    from fileobj.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    data = head
+    while True:
+        if not data:
+            data = fileobj.read(chunk_size)
+            if not data:
+                break
+        text = decoder.decode(data)
+        if text:
+            yield text
+        data = None
+    text = decoder.decode(b'', True)
+    if text:
+        yield text
+
+def generate_tokens(chunks, base=0, line_num=1, indent_stack=None):
+    """
+    Tokenizer main loop. chunks is an iterator of str, the source code. Only
+    the lines being scanned are kept in memory; the indent stack, the
+    bracket level and the line number are carried across chunks.
+
+    To scan from the start of a line at bracket level 0 other than the
+    first one, base is its position in the source, line_num its number and
+    indent_stack the indent stack there; see retokenize.
+    """
+    if STR_PREFIXES is None:
+        init_tables()
 
-    print("Encoding: " + encoding)
-    
-    S = S.decode(encoding)
-    
     # Genera un token y su metadata:
     # 0 - Codigo/ID del token
     # 1 - Posicion de inicio
     # 2 - Posicion de fin
     # 3 - Numero de linea
     # 4 - String literal que valida el token
-    toks = []
+    #
+    # S holds the current piece of source, starting at the absolute
+    # position base. S[:limit] only has complete lines, so every token
+    # except a multi-line string can be scanned without reading more.
+    S = ''
+    limit = 0
+    eof = False
+    last = None # Last token ID
     i = 0
+    p = 0
     line_start = True
-    indent_stack = [0]
-    line_num = 1
+    if indent_stack is None:
+        indent_stack = [0]
     level = 0
     
-    while i < len(S):
-        if False and len(toks):
-            print(toks[-1])
-            print("i: " + str(i) + " line_start: " + str(line_start))
+    while True:
+        if i >= limit:
+            if eof:
+                break
+            # Drop what was already scanned and read the next chunk.
+            S = S[i:]
+            base = base + i
+            i = 0
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                limit = len(S)
+            else:
+                S = S + chunk
+                limit = S.rfind('\n') + 1
+            continue
 
-        if S[i] in P_WHITESPACE:
-            p = i
-            while p < len(S) and S[p] in P_WHITESPACE:
-                p = p + 1
+        cls = CHAR_CLASS.get(S[i], C_OTHER)
+        if cls == C_PREFIX:
+            # Only a string prefix if a quote follows, otherwise a name.
+            if S[i+1:i+2] in P_QUOTES or \
+                (S[i:i+2] in STR_PREFIX_PAIRS and S[i+2:i+3] in P_QUOTES):
+                cls = C_QUOTE
+            else:
+                cls = C_LETTER
+        elif cls == C_DOT:
+            if S[i+1:i+2] in P_DIGITS:
+                cls = C_DIGIT
+            else:
+                cls = C_OP
+
+        if cls == C_SPACE:
+            p = i + 1
+            if p < len(S) and S[p] in P_WHITESPACE:
+                p = span(S, p, S_WHITESPACE)
             if line_start:
                 line_start = False
                 # Check if we need to create indent tokens.
                 if p < len(S) and S[p] in '#\n\\':
                     # Line is blank. Eat the comment until EOL.
-                    while p < len(S) and S[p] != '\n':
-                        p = p + 1
+                    p = S.find('\n', p)
+                    if p == -1:
+                        p = len(S)
                     # Only create an indent token on a non-empty line.
                     # Ignore this line.
                     i = p
@@ -347,20 +572,23 @@ def tokenize_file(file_name):
                     # Create an indent token
                     if level == 0:
                         if dist > indent_stack[-1]:
-                            toks.append((T_INDENT, i, p, line_num, None))
+                            last = T_INDENT
+                            yield (T_INDENT, base + i, base + p, line_num, None)
                             indent_stack.append(dist)
                         elif dist < indent_stack[-1]:
                             while dist < indent_stack[-1]:
                                 indent_stack.pop(-1)
-                                toks.append((T_DEDENT, i, p, line_num, None))
+                                last = T_DEDENT
+                                yield (T_DEDENT, base + i, base + p, line_num, None)
                     i = p
             else:
                 # Just eat the whitespace.
                 i = p
-        elif S[i] == '\n':
+        elif cls == C_NEWLINE:
             # Create a newline token
-            if len(toks) > 0 and toks[-1][0] != T_NEWLINE and level == 0 and not line_start:
-                toks.append((T_NEWLINE, i, p, line_num, '\n'))
+            if last is not None and last != T_NEWLINE and level == 0 and not line_start:
+                last = T_NEWLINE
+                yield (T_NEWLINE, base + i, base + i + 1, line_num, '\n')
             line_num = line_num + 1
             if level == 0:
                 line_start = True
@@ -369,37 +597,53 @@ def tokenize_file(file_name):
             line_start = False
             while 0 < indent_stack[-1]:
                 indent_stack.pop(-1)
-                toks.append((T_DEDENT, i, p, line_num, None))
-        elif (i+1) < len(S) and S[i] == "\\" and S[i+1] == '\n':
+                last = T_DEDENT
+                yield (T_DEDENT, base + i, base + i, line_num, None)
+        elif cls == C_LETTER:
+            # Most names fit in the first window of span().
+            W = S[i:i+SPAN_WINDOW]
+            p = i + len(W) - len(W.lstrip(S_LETTERS_DIGITS_UNDER))
+            if p == i + SPAN_WINDOW:
+                p = span(S, p, S_LETTERS_DIGITS_UNDER)
+            last = T_NAME
+            yield (T_NAME, base + i, base + p, line_num, S[i:p])
+            i = p
+        elif cls == C_OP:
+            # General operators: +, -, <<=, ...
+            op_id, op_len = match_op(S, i)
+            if op_id is None:
+                raise Exception("SyntaxError: Unknown token.")
+            
+            last = op_id
+            yield (op_id, base + i, base + i + op_len, line_num, S[i:i+op_len])
+            i = i + op_len
+            
+            if op_id in OPEN_BRACKETS:
+                level = level + 1
+            elif op_id in CLOSE_BRACKETS:
+                level = level - 1
+        elif cls == C_BACKSLASH and S[i+1:i+2] == '\n':
             line_num = line_num + 1
             i = i + 2
-        elif S[i] == '#':
+        elif cls == C_COMMENT:
             # Comments.
-            p = i
-            while p < len(S) and S[p] != '\n':
-                p = p + 1
+            p = S.find('\n', i)
+            if p == -1:
+                p = len(S)
             i = p # i points to EOL.
-        elif (S[i] in P_DIGITS) or ((i+1) < len(S) and S[i] == '.' and S[i+1] in P_DIGITS):
+        elif cls == C_DIGIT:
             # Number
-            p = i
             if S[i] == '0' and (i+1) < len(S) and S[i+1] in 'xXbBoO':
-                p = i + 2
-                
                 if S[i+1] in "xX": # Hex
-                    while p < len(S) and S[p] in P_DIGITS_HEX:
-                        p = p + 1
-                if S[i+1] in "bB": # Bin
-                    while p < len(S) and S[p] in P_DIGITS_BIN:
-                        p = p + 1
-                if S[i+1] in "oO": # Oct
-                    while p < len(S) and S[p] in P_DIGITS_OCT:
-                        p = p + 1
+                    p = span(S, i + 2, S_DIGITS_HEX)
+                elif S[i+1] in "bB": # Bin
+                    p = span(S, i + 2, P_DIGITS_BIN)
+                else: # Oct
+                    p = span(S, i + 2, S_DIGITS_OCT)
             else:
-                while p < len(S) and S[p] in P_DIGITS:
-                    p = p + 1
+                p = span(S, i, S_DIGITS)
                 if p < len(S) and S[p] == '.':
-                    while p < len(S) and S[p] in P_DIGITS:
-                        p = p + 1
+                    p = span(S, p + 1, S_DIGITS)
                 if p < len(S) and S[p] in "eE":
                     # Exponent, 1e3
                     p = p + 1
@@ -407,81 +651,237 @@ def tokenize_file(file_name):
                         p = p + 1
                     if p < len(S) and not (S[p] in P_DIGITS):
                         raise Exception("SyntaxError: Error")
-                    while p < len(S) and S[p] in P_DIGITS:
-                        p = p + 1
+                    p = span(S, p, S_DIGITS)
                 if p < len(S) and S[p] in "jJ":
                     # Imaginary
                     p = p + 1
            
-            toks.append((T_NUMBER, i, p, line_num, S[i:p]))
+            last = T_NUMBER
+            yield (T_NUMBER, base + i, base + p, line_num, S[i:p])
             i = p
-        elif get_next_op_len(S, i) > 0:
-            # General operators: +, -, <<=, ...
-            op_len = get_next_op_len(S, i)
-            op_str = S[i:i+op_len]
-            op_id = TOK_STR[op_str]
-            assert op_str in TOK_STR and op_len == len(op_str)
-            
-            toks.append((op_id, i, p, line_num, op_str))
-            i = i + len(op_str)
-            
-            if len(op_str) == 1:
-                if op_str in "[{(":
-                    level = level + 1
-                elif op_str in "]})":
-                    level = level - 1
-        elif is_next_string(S, i) is not None:
+        elif cls == C_QUOTE:
             # String literals, "hi"
-            start_tok = is_next_string(S, i)
-            
-            if start_tok.endswith("'''"):
-                quote = "'''"
-            elif start_tok.endswith('"""'):
-                quote = '"""'
-            elif start_tok.endswith('"'):
-                quote = '"'
-            elif start_tok.endswith("'"):
-                quote = "'"
-            else:
-                assert False
-            
-            p = i + len(start_tok)
-            
-            if len(quote) == 1:
-                # If we find an EOL raise an error
-                Q = '\n' + quote
-                while p < len(S) and S[p] not in Q:
-                    p = p + 1
-                if p < len(S) and S[p] == '\n':
-                    raise Exception("SyntaxError: EOL while scanning string literal")
-            else:
-                while p < len(S) and not S.startswith(quote, p):
-                    if S[p] == '\n':
-                        line_num = line_num + 1
-                    p = p + 1
-            p = p + len(quote)
-            toks.append((T_STRING, i, p, line_num, S[i:p]))
-            i = p
-        elif S[i] in P_LETTERS_UNDER:
             p = i
-            while p < len(S) and S[p] in P_LETTERS_DIGITS_UNDER:
+            while S[p] not in P_QUOTES:
                 p = p + 1
-            toks.append((T_NAME, i, p, line_num, S[i:p]))
+            quote = S[p]
+            if S.startswith(quote * 3, p):
+                quote = quote * 3
+            p = p + len(quote)
+            
+            # Jump from one backslash or closing quote to the next. The
+            # character after a backslash is skipped, so an escaped quote
+            # does not end the string.
+            while True:
+                q = S.find(quote, p)
+                if q == -1:
+                    e = len(S)
+                else:
+                    e = q
+                b = S.find('\\', p, e)
+                if b != -1:
+                    e = b
+                if len(quote) == 1 and S.find('\n', p, e) != -1:
+                    raise Exception("SyntaxError: EOL while scanning string literal")
+                if b != -1:
+                    p = b + 2
+                elif q != -1:
+                    break
+                elif eof:
+                    raise Exception("SyntaxError: EOF while scanning string literal")
+                else:
+                    # The string continues after the lines read so far.
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        eof = True
+                        limit = len(S)
+                    else:
+                        S = S + chunk
+                        limit = S.rfind('\n') + 1
+            p = q + len(quote)
+            line_num = line_num + S.count('\n', i, p)
+            last = T_STRING
+            yield (T_STRING, base + i, base + p, line_num, S[i:p])
             i = p
         else:
             raise Exception("SyntaxError: Unknown token.")
     
     while indent_stack[-1] > 0:
         indent_stack.pop(-1)
-        toks.append((T_DEDENT, i, i, line_num, None))
+        yield (T_DEDENT, base + i, base + i, line_num, None)
     
-    toks.append((T_ENDMARKER, i, i, line_num, None))
-    
-    return toks
+    yield (T_ENDMARKER, base + i, base + i, line_num, None)
+
+# Tokens without a string literal.
+VALUELESS = frozenset([T_INDENT, T_DEDENT, T_ENDMARKER])
+
+class TokenBuffer:
+    """
+    Compact token list. Instead of one tuple per token it keeps a column per
+    field; the string literal is not stored but sliced from the source when
+    the token is read. Indexing returns the same tuples as tokenize_file, so
+    a TokenBuffer can be given to parserbase.parser_base as is.
+    """
+    # Key of the source in the cache, see cache.Cache.load_tokens.
+    cache_key = None
+
+    def __init__(self, source):
+        self.source = source
+        self.kinds = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+
+    def append(self, tok):
+        self.kinds.append(tok[0])
+        self.starts.append(tok[1])
+        self.ends.append(tok[2])
+        self.lines.append(tok[3])
+
+    def value(self, idx):
+        if self.kinds[idx] in VALUELESS:
+            return None
+        return self.source[self.starts[idx]:self.ends[idx]]
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx = idx + len(self.kinds)
+        return (self.kinds[idx], self.starts[idx], self.ends[idx],
+            self.lines[idx], self.value(idx))
+
+    def __iter__(self):
+        for idx in range(len(self.kinds)):
+            yield self[idx]
+
+    def splice(self, start, stop, toks, delta, line_delta, source):
+        """
+        Replaces the tokens from start up to stop with the tuples toks, and
+        moves the tokens after them by delta characters and line_delta
+        lines. source is the new source.
+        """
+        self.source = source
+        # The tokens are no longer those of the cached source.
+        self.cache_key = None
+        for column, f, d in ((self.kinds, 0, 0), (self.starts, 1, delta),
+            (self.ends, 2, delta), (self.lines, 3, line_delta)):
+            rest = column[stop:]
+            if d != 0:
+                rest = array('i', [x + d for x in rest])
+            del column[start:]
+            column.extend([t[f] for t in toks])
+            column.extend(rest)
+
+def retokenize(source, toks, offset, length, text):
+    """
+    Tokenizes source again after the length characters at offset are
+    replaced by text. toks are the tokens of source before the edit, a list
+    or a TokenBuffer. Returns the new source and its tokens: a new list, or
+    toks itself edited in place.
+
+    The scan starts at the logical line of the edit and stops at the first
+    NEWLINE after it where the tokens and the indent stack are those of the
+    old tokens again; the old tokens after it are kept, moved by the size
+    of the edit.
+    """
+    S, start, stop, new, delta, line_delta = rescan(source, toks, offset, length, text)
+
+    if type(toks) is TokenBuffer:
+        toks.splice(start, stop, new, delta, line_delta, S)
+        return S, toks
+
+    rest = toks[stop:]
+    if delta != 0 or line_delta != 0:
+        rest = [(t[0], t[1] + delta, t[2] + delta, t[3] + line_delta, t[4]) for t in rest]
+    return S, toks[:start] + new + rest
+
+def rescan(source, toks, offset, length, text):
+    """
+    The scan of retokenize. Returns the new source, the range start to stop
+    of the old tokens to replace, the new tokens that replace them, and the
+    characters and lines the tokens after them move by.
+    """
+    S = source[:offset] + text + source[offset + length:]
+    delta = len(text) - length
+    line_delta = text.count('\n') - source.count('\n', offset, offset + length)
+    n = len(toks)
+
+    # The last NEWLINE before the edit, j; the tokens up to it stay.
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if toks[mid][1] < offset:
+            lo = mid + 1
+        else:
+            hi = mid
+    j = lo - 1
+    while j >= 0 and toks[j][0] != T_NEWLINE:
+        j = j - 1
+
+    # The indent stack after it. It is [0] at the first token of a logical
+    # line at column 0, past its DEDENT tokens, so the INDENT and DEDENT
+    # tokens are replayed from the last one of those.
+    c = j
+    while c > 0:
+        t = toks[c]
+        if t[0] != T_INDENT and t[0] != T_DEDENT and t[0] != T_NEWLINE and \
+            (t[1] == 0 or source[t[1] - 1] == '\n'):
+            b = c - 1
+            while b >= 0 and toks[b][0] == T_DEDENT:
+                b = b - 1
+            if b < 0 or toks[b][0] == T_NEWLINE:
+                break
+        c = c - 1
+    stack = [0]
+    for idx in range(max(c, 0), j + 1):
+        t = toks[idx]
+        if t[0] == T_INDENT:
+            stack.append(t[2] - t[1])
+        elif t[0] == T_DEDENT:
+            stack.pop(-1)
+
+    if j < 0:
+        start = 0
+        line_num = 1
+    else:
+        start = toks[j][2]
+        line_num = toks[j][3] + 1
+
+    # Scan the new source, replaying the old tokens alongside, until both
+    # are at the same NEWLINE past the edit with the same indent stack.
+    new = []
+    new_stack = list(stack)
+    old_stack = list(stack)
+    k = j + 1
+    stop = n
+    chunks = (S[x:x + RESCAN_CHUNK_SIZE] for x in range(start, len(S), RESCAN_CHUNK_SIZE))
+    for t in generate_tokens(chunks, start, line_num, list(stack)):
+        new.append(t)
+        if t[0] == T_INDENT:
+            new_stack.append(t[2] - t[1])
+        elif t[0] == T_DEDENT:
+            new_stack.pop(-1)
+        elif t[0] == T_NEWLINE and t[1] >= offset + len(text):
+            old_start = t[1] - delta
+            while k < n and toks[k][1] < old_start:
+                if toks[k][0] == T_INDENT:
+                    old_stack.append(toks[k][2] - toks[k][1])
+                elif toks[k][0] == T_DEDENT:
+                    old_stack.pop(-1)
+                k = k + 1
+            if k < n and toks[k][0] == T_NEWLINE and toks[k][1] == old_start \
+                and old_stack == new_stack:
+                stop = k + 1
+                break
+
+    return S, j + 1, stop, new, delta, line_delta
 
 def main():
     import sys
-    toks = tokenize_file(sys.argv[1])
+    toks = tokenize_file(sys.argv[1], verbose=True)
 
     if True:
         for t in toks:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Checks batch.parse_split against parsing the whole file at once.
+"""
+
+import unittest
+
+from pppp import tokenizer, parser, batch
+from pppp.parserbase import ParseError
+
+SOURCE = '''import os
+
+@decorator
+@other(1,
+       2)
+def f(a, b):
+    return a + \\
+        b
+
+x = [1,
+     2,
+     3]
+y = f(
+    x,
+    x)
+if x:
+    pass
+elif y:
+    pass
+else:
+    pass
+z = 1 + \\
+    2 + \\
+    3
+@decorator
+class C:
+    def g(self):
+        return {1: 2,
+                3: 4}
+try:
+    pass
+except Exception:
+    pass
+finally:
+    pass
+w = (1); v = 2
+'''
+
+# (compact, punctuation, arena) of each parser mode.
+MODES = [(False, True, False), (True, True, False), (False, True, True), (True, False, True)]
+
+def shape(node):
+    """
+    The tree under node as nested tuples, with its tokens.
+    """
+    return (node.ntype, node.tok, tuple([shape(x) for x in node.childs]))
+
+def run(parse):
+    # The shape of the tree, or None, or the ParseError.
+    try:
+        T = parse()
+    except ParseError as e:
+        return ('ParseError', e.rule, e.pos)
+    if T is None:
+        return None
+    return shape(T)
+
+class ParseSplitTest(unittest.TestCase):
+    def check(self, S, workers=1, chunks=None):
+        toks = tokenizer.tokenize_source(S)
+        for compact, punctuation, arena in MODES:
+            def whole():
+                p = parser.parser(toks, compact=compact, punctuation=punctuation, arena=arena)
+                T = p.parse_file_input()
+                if arena and T is not None:
+                    return p.arena.view(T)
+                return T
+            def split():
+                return batch.parse_split(toks, workers, chunks, compact, punctuation, arena)
+            self.assertEqual(run(split), run(whole), (chunks, compact, punctuation, arena))
+
+    def test_every_split(self):
+        # Chunks of one unit split before every statement that may start
+        # one, including the decorated ones, the continued lines and the
+        # statements in brackets.
+        for chunks in list(range(1, 12)) + [len(SOURCE)]:
+            self.check(SOURCE, 1, chunks)
+
+    def test_statements_across_splits(self):
+        # Where the split points land inside a statement, or before a
+        # clause that goes on with it.
+        for old, new in [('x = [1,\n', 'x = [1,\n\n'), ('if x:\n', 'while x:\n'),
+            ('@decorator\nclass', '@decorator\n\nclass'), ('v = 2', 'v = (2 +\n3)')]:
+            S = SOURCE.replace(old, new)
+            for chunks in (3, 7, len(S)):
+                self.check(S, 1, chunks)
+
+    def test_errors(self):
+        # The same ParseError, or None, as the whole parse.
+        for old, new in [('return a + \\', 'return a +'), ('else:\n', 'else\n'),
+            ('3: 4}', '3: 4'), ('def g(self):', 'def g(self)')]:
+            S = SOURCE.replace(old, new)
+            for chunks in (2, 5, len(S)):
+                self.check(S, 1, chunks)
+
+    def test_workers(self):
+        self.check(SOURCE, 2)
+        self.check(SOURCE, 2, len(SOURCE))
+
+    def test_small_files(self):
+        # Fewer statements than workers.
+        for S in ['', '\n', 'x = 1\n', '@d\ndef f(): pass\n', 'x = (1,\n2)\n']:
+            self.check(S, 1, 8)
+            self.check(S, 4)
+
+if __name__ == '__main__':
+    unittest.main()
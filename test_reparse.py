@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Checks parser_base.reparse against parsing the edited source again.
+"""
+
+import unittest
+
+from pppp import tokenizer, parser
+from pppp.parserbase import ParseError
+
+SOURCE = '''import os
+
+def f(a, b):
+    if a:
+        for x in b:
+            if x:
+                a = a + x
+            else:
+                continue
+        return a
+    elif b:
+        while b:
+            b = b - 1
+    try:
+        pass
+    except Exception:
+        raise
+    return b
+
+class C:
+    def g(self, x):
+        with x as y:
+            return [y,
+                    x]
+
+    def h(self):
+        return 1
+
+w = f(1, 2)
+'''
+
+# Edits at every position: (length, text) replacing the characters there.
+EDITS = [(0, '\n'), (0, ' '), (0, 'x'), (1, '')]
+
+def shape(node):
+    """
+    The tree under node as nested tuples, with its tokens.
+    """
+    return (node.ntype, node.tok, tuple([shape(x) for x in node.childs]))
+
+def parse(toks, compact):
+    try:
+        return parser.parser(toks, compact=compact).parse_file_input()
+    except ParseError:
+        return None
+
+class ReparseTest(unittest.TestCase):
+    def check_parents(self, node):
+        stack = [node]
+        while len(stack) > 0:
+            n = stack.pop(-1)
+            for x in n.childs:
+                self.assertIs(x.parent, n)
+                stack.append(x)
+
+    def check(self, source, offset, length, text, compact=False):
+        S = source[:offset] + text + source[offset + length:]
+        try:
+            toks = tokenizer.tokenize_source(S)
+        except Exception:
+            # The edit does not tokenize.
+            return
+        expected = parse(toks, compact)
+
+        p = parser.parser(tokenizer.tokenize_source(source), compact=compact)
+        tree = p.parse_file_input()
+        try:
+            S2, T = p.reparse(tree, source, offset, length, text)
+        except ParseError:
+            T = None
+        where = (offset, length, text, compact)
+        if expected is None:
+            self.assertIsNone(T, where)
+            return
+        self.assertEqual(S2, S)
+        self.assertEqual(p.toks, toks, where)
+        self.assertIsNotNone(T, where)
+        self.assertEqual(shape(T), shape(expected), where)
+        self.check_parents(T)
+
+    def check_text(self, old, text):
+        for compact in (False, True):
+            self.check(SOURCE, SOURCE.index(old), len(old), text, compact)
+
+    def test_every_position(self):
+        for offset in range(len(SOURCE) + 1):
+            for length, text in EDITS:
+                if offset + length <= len(SOURCE):
+                    self.check(SOURCE, offset, length, text)
+
+    def test_nested_suites(self):
+        self.check_text('a = a + x', 'a = a * x + 1')
+        self.check_text('                continue\n', '                continue\n                break\n')
+        self.check_text('            b = b - 1', '            b -= 1\n            if b:\n                pass')
+        self.check_text('[y,\n                    x]', '[y, x]')
+        self.check_text('        pass\n    except', '        pass\n        pass\n    except')
+
+    def test_dedent_boundaries(self):
+        # Lines moved into or out of the block before them, and blocks
+        # that lose their last statement or gain a new one at the end.
+        self.check_text('        return a\n', '    return a\n')
+        self.check_text('        return a\n', '            return a\n')
+        self.check_text('    return b\n', '        return b\n')
+        self.check_text('    return b\n', 'return b\n')
+        self.check_text('        return 1\n', '        return 1\n    x = 2\n')
+        self.check_text('        return 1\n\n', '        return 1\n\nx = 2\n')
+        self.check_text('w = f', '    w = f')
+        self.check_text('    elif b:\n', '    if b:\n')
+        self.check_text('\n    def h', '\n        def h')
+        self.check_text('    def h(self):\n        return 1\n', '')
+
+if __name__ == '__main__':
+    unittest.main()
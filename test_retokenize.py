@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Checks tokenizer.retokenize against tokenizing the edited source again.
+"""
+
+import unittest
+
+from pppp import tokenizer
+
+SOURCE = '''import os
+
+x = 1  #"""
+y = 'abc' + "d\\"e"
+z = 2  #"""
+s = """one
+two
+"""
+t = 1 + \\
+    2
+def f(a,
+      b):
+    if a:
+        c = [1,
+             2]
+        return c
+    elif b:  # comment
+        pass
+
+    return (a
+        + b)
+
+class C:
+    def g(self):
+        return 3
+w = f(1, 2)
+'''
+
+# Edits at every position: (length, text) replacing the characters there.
+EDITS = [
+    (0, ' '), (0, '\n'), (0, '    '), (0, '\\\n'), (0, '"""'), (0, "'"),
+    (0, '#'), (0, '('), (0, 'x'), (1, ''), (1, 'q'), (2, ''), (4, ''),
+]
+
+class RetokenizeTest(unittest.TestCase):
+    def check(self, source, offset, length, text):
+        S = source[:offset] + text + source[offset + length:]
+        try:
+            expected = list(tokenizer.generate_tokens(iter([S])))
+        except Exception:
+            # The edit does not tokenize.
+            return
+        toks = tokenizer.tokenize_source(source)
+        S2, new = tokenizer.retokenize(source, toks, offset, length, text)
+        self.assertEqual(S2, S)
+        self.assertEqual(new, expected, (offset, length, text))
+
+        buf = tokenizer.tokenize_source(source, True)
+        S2, new = tokenizer.retokenize(source, buf, offset, length, text)
+        self.assertIs(new, buf)
+        self.assertEqual(new.source, S)
+        self.assertEqual(list(new), expected, (offset, length, text))
+
+    def check_text(self, old, text):
+        self.check(SOURCE, SOURCE.index(old), len(old), text)
+
+    def test_every_position(self):
+        for offset in range(len(SOURCE) + 1):
+            for length, text in EDITS:
+                if offset + length <= len(SOURCE):
+                    self.check(SOURCE, offset, length, text)
+
+    def test_strings(self):
+        # Inside a string, and opening one that ends lines later.
+        self.check_text("abc", "a'b")
+        self.check_text('d\\"e', 'd"')
+        self.check_text('one\ntwo', 'one\n\n  two\n')
+        self.check_text('x = 1  #', 'x = 1  ')
+        self.check_text('s = """', 's = "')
+        self.check_text('"""\nt = 1', '""" + """\nt = 1')
+
+    def test_backslash(self):
+        # After a continuation, and adding or removing one.
+        self.check_text('    2\n', '    2 + 3\n')
+        self.check_text('1 + \\\n', '1 + \n')
+        self.check_text('\\\n    2', '\\\n\\\n    2')
+        self.check_text('import os\n', 'import os \\\n')
+
+    def test_indentation(self):
+        # Lines moved into, out of and between blocks.
+        self.check_text('        return c', '    return c')
+        self.check_text('        return c', '            return c')
+        self.check_text('        pass\n', '        pass\n    else:\n        pass\n')
+        self.check_text('    return (a', 'return (a')
+        self.check_text('    elif b:', '    else:\n        pass\n    if b:')
+        self.check_text('w = f', '    w = f')
+        self.check_text('class C:\n', '')
+        self.check_text('    def g', '  def g')
+
+if __name__ == '__main__':
+    unittest.main()
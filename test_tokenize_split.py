@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+
+"""
+PPPP: Pure Python Python Parser
+
+Checks batch.tokenize_split against tokenizing the whole source at once.
+"""
+
+import unittest
+
+from pppp import tokenizer, batch
+
+# The lines at column 0 inside strings and brackets look like the start of
+# a statement, so chunks can start there.
+SOURCE = '''import os
+s = """
+x = 1
+def f():
+    pass
+"""
+t = \'\'\'a
+b = 2\'\'\' + """c
+"""
+u = [1,
+2,
+y
+]
+def g(a,
+b):
+    return {a:
+b}
+v = (
+"""
+w = 3
+""",
+)
+z = f(1) \\
++ 2
+if z:
+    pass
+'''
+
+class TokenizeSplitTest(unittest.TestCase):
+    def check(self, S, workers=1, chunks=None):
+        expected = list(tokenizer.generate_tokens(iter([S])))
+        toks = batch.tokenize_split(S, workers, chunks)
+        self.assertEqual(toks, expected, chunks)
+        buf = batch.tokenize_split(S, workers, chunks, True)
+        self.assertEqual(buf.source, S)
+        self.assertEqual(list(buf), expected, chunks)
+
+    def test_every_split(self):
+        # Chunks of one line split at every line at column 0, inside the
+        # strings and brackets too.
+        for chunks in list(range(1, 12)) + [len(SOURCE)]:
+            self.check(SOURCE, 1, chunks)
+
+    def test_split_points(self):
+        # The split points land inside the strings and brackets.
+        points = batch.line_points(SOURCE, len(SOURCE))
+        for x in ['x = 1', 'b = 2', 'y\n', 'b):', 'b}', 'w = 3']:
+            self.assertIn(SOURCE.index(x), points, x)
+        # But not after a backslash.
+        self.assertNotIn(SOURCE.index('+ 2'), points)
+
+    def test_workers(self):
+        self.check(SOURCE, 2)
+        self.check(SOURCE, 2, len(SOURCE))
+
+    def test_small_sources(self):
+        for S in ['', '\n', 'x = 1\n', 'x = 1', 's = """\nx\n"""\n']:
+            self.check(S, 1, 8)
+            self.check(S, 4)
+
+    def test_errors(self):
+        # A source that does not tokenize raises in the last chunk.
+        for S in [SOURCE + 's = """\nx = 1\n', SOURCE.replace('b = 2\'\'\'', 'b = 2')]:
+            with self.assertRaises(Exception):
+                list(tokenizer.generate_tokens(iter([S])))
+            with self.assertRaises(Exception):
+                batch.tokenize_split(S, 1, len(S))
+
+if __name__ == '__main__':
+    unittest.main()